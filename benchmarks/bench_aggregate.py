@@ -0,0 +1,49 @@
+"""
+Per-currency and grouped totals over large inputs.
+
+    $ python benchmarks/bench_aggregate.py [--rows 1000000,10000000]
+
+The pure Python paths are only run up to ``--python-rows`` rows since they
+take minutes at 10M rows.
+"""
+import optparse
+import random
+from decimal import Decimal
+
+from common import report, time_row
+from money import Money, CURRENCY
+from money.aggregate import sum_by_currency, group_sum, group_sum_arrays
+from money.arrays import numpy
+
+CODES = ('USD', 'EUR', 'GBP', 'JPY', 'CHF')
+
+
+def main():
+    parser = optparse.OptionParser()
+    parser.add_option('--rows', default='1000000,10000000')
+    parser.add_option('--python-rows', type='int', default=1000000)
+    parser.add_option('--groups', type='int', default=100)
+    options, args = parser.parse_args()
+
+    rows = []
+    for count in [int(n) for n in options.rows.split(',')]:
+        rng = random.Random(count)
+        if count <= options.python_rows:
+            moneys = [Money._make(Decimal(rng.randint(1, 100000)).scaleb(-2), CURRENCY[rng.choice(CODES)])
+                      for i in xrange(count)]
+            keys = [rng.randint(0, options.groups) for i in xrange(count)]
+            time_row(rows, 'sum_by_currency(list of Money)', count, sum_by_currency, moneys)
+            time_row(rows, 'group_sum(list of Money, keys)', count, group_sum, moneys, keys)
+            del moneys
+        if numpy:
+            state = numpy.random.RandomState(count)
+            minor = state.randint(1, 100000, size=count).astype(numpy.int64)
+            codes = numpy.array(CODES, dtype='S3')[state.randint(0, len(CODES), size=count)]
+            keys = state.randint(0, options.groups, size=count)
+            time_row(rows, 'group_sum_arrays(int64, codes)', count, group_sum_arrays, minor, codes)
+            time_row(rows, 'group_sum_arrays(int64, codes, keys)', count, group_sum_arrays, minor, codes, keys)
+    report('Grouped aggregation', rows, ('path', 'rows', 'seconds', 'rows/s'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Splitting many invoices across the same cost-centre ratios.
+
+    $ python benchmarks/bench_allocate.py [--invoices 500000]
+
+Compares the original Money.allocate(), the current per-invoice
+Money.allocate() and the batch MoneyArray.allocate().
+"""
+import optparse
+import random
+import time
+from decimal import Decimal
+
+from common import report
+import legacy
+from money import Money, MoneyArray, CURRENCY
+from money.arrays import numpy
+
+RATIOS = (50, 30, 15, 5)
+
+
+def main():
+    parser = optparse.OptionParser()
+    parser.add_option('--invoices', type='int', default=500000)
+    parser.add_option('--loop-invoices', type='int', default=50000,
+                      help='invoices for the per-invoice paths')
+    options, args = parser.parse_args()
+
+    rng = random.Random(0)
+    minor = [rng.randint(1, 10000000) for i in xrange(options.invoices)]
+    rows = []
+
+    count = min(options.loop_invoices, options.invoices)
+    usd = legacy.CURRENCY['USD']
+    invoices = [legacy.Money(Decimal(m).scaleb(-2), usd) for m in minor[:count]]
+    start = time.time()
+    for invoice in invoices:
+        invoice.allocate(RATIOS)
+    seconds = time.time() - start
+    rows.append(('legacy Money.allocate', count, '%.3f' % seconds, '%.0f' % (count / seconds)))
+
+    usd = CURRENCY['USD']
+    invoices = [Money._make(Decimal(m).scaleb(-2), usd) for m in minor[:count]]
+    start = time.time()
+    for invoice in invoices:
+        invoice.allocate(RATIOS)
+    seconds = time.time() - start
+    rows.append(('Money.allocate', count, '%.3f' % seconds, '%.0f' % (count / seconds)))
+
+    if numpy:
+        invoices = MoneyArray(minor, usd)
+        start = time.time()
+        invoices.allocate(RATIOS)
+        seconds = time.time() - start
+        rows.append(('MoneyArray.allocate', options.invoices, '%.3f' % seconds,
+                     '%.0f' % (options.invoices / seconds)))
+    report('Allocation across %d ratios' % len(RATIOS), rows,
+           ('path', 'invoices', 'seconds', 'invoices/s'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Per-currency totals of a ledger stored as CSV and in the columnar format.
+
+    $ python benchmarks/bench_columnar.py [--rows 1000000]
+
+Writes the same ledger as a CSV file and as a columnar file in a temporary
+directory, then compares reading the CSV with money.io.read_batches()
+against opening the columnar file with ColumnarFile, and the time to the
+per-currency totals on each.
+"""
+import csv
+import optparse
+import os
+import shutil
+import tempfile
+
+from common import report, timed
+from money.aggregate import sum_by_currency
+from money.arrays import MoneyArray, numpy
+from money.columnar import ColumnarFile, write_columns
+from money.io import read_batches
+
+CODES = ('USD', 'EUR', 'GBP', 'JPY', 'CHF')
+
+
+def csv_totals(path):
+    totals = {}
+    for batch in read_batches(path, batch_size=100000):
+        for code, total in sum_by_currency(batch).iteritems():
+            totals[code] = totals[code] + total if code in totals else total
+    return totals
+
+
+def columnar_totals(path):
+    with ColumnarFile(path) as ledger:
+        return ledger.sum_by_currency()
+
+
+def main():
+    parser = optparse.OptionParser()
+    parser.add_option('--rows', type='int', default=1000000)
+    options, args = parser.parse_args()
+    count = options.rows
+
+    state = numpy.random.RandomState(0)
+    minor = state.randint(-100000, 10000000, size=count).astype(numpy.int64)
+    codes = numpy.array(CODES, dtype='S3')[state.randint(0, len(CODES), size=count)]
+    directory = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(directory, 'ledger.csv')
+        columnar_path = os.path.join(directory, 'ledger.money')
+        with open(csv_path, 'wb') as f:
+            writer = csv.writer(f)
+            writer.writerow(('amount', 'currency'))
+            for value, code in zip(minor.tolist(), codes.tolist()):
+                writer.writerow(('%d' % value if code == 'JPY' else '%.2f' % (value / 100.0), code))
+        write_columns(columnar_path, MoneyArray(minor, codes))
+
+        open_seconds, ledger = timed(ColumnarFile, columnar_path)
+        ledger.close()
+        rows = []
+        for label, path, func in (('CSV (read_batches)', csv_path, csv_totals),
+                                  ('columnar (ColumnarFile)', columnar_path, columnar_totals)):
+            seconds, totals = timed(func, path)
+            rows.append((label, count, '%.1f' % (os.path.getsize(path) / 1e6), '%.3f' % seconds))
+        report('Per-currency totals of a ledger', rows, ('format', 'rows', 'MB', 'seconds'))
+        print 'Opening the columnar file: %.6f seconds' % open_seconds
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Converting a price list to one currency.
+
+    $ python benchmarks/bench_convert.py [--rows 100000]
+
+Compares Money.convert_to() per value with the batch convert_many() on
+lists and on a MoneyArray.
+"""
+import optparse
+import random
+from decimal import Decimal
+
+from common import report, time_row
+from money import Money, MoneyArray, RateTable, CURRENCY, convert_many
+from money.arrays import numpy
+
+CODES = ('USD', 'EUR', 'GBP', 'JPY', 'CHF')
+
+
+def main():
+    parser = optparse.OptionParser()
+    parser.add_option('--rows', type='int', default=100000)
+    options, args = parser.parse_args()
+    count = options.rows
+
+    rates = RateTable('USD', {'EUR': '0.8', 'GBP': '0.65', 'JPY': '110', 'CHF': '0.95'})
+    rng = random.Random(0)
+    codes = [rng.choice(CODES) for i in xrange(count)]
+    amounts = [Decimal(rng.randint(1, 10000000)).scaleb(-CURRENCY[c].decimals) for c in codes]
+    moneys = [Money._make(a, CURRENCY[c]) for a, c in zip(amounts, codes)]
+
+    # convert_many() rounds to the target currency, so the per value path
+    # does too
+    cent = Decimal('0.01')
+    rows = []
+    time_row(rows, 'Money.convert_to per value', count,
+          lambda: [m.convert_to('EUR', rates=rates).amount.quantize(cent) for m in moneys])
+    time_row(rows, 'convert_many(list)', count, convert_many, amounts, codes, 'EUR', rates)
+    if numpy:
+        array = MoneyArray.from_money(moneys)
+        time_row(rows, 'convert_many(MoneyArray)', count, convert_many, array, None, 'EUR', rates)
+    report('Currency conversion throughput', rows, ('path', 'rows', 'seconds', 'rows/s'))
+
+
+if __name__ == '__main__':
+    main()
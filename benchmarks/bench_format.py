@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Formatting prices for display.
+
+    $ python benchmarks/bench_format.py [--rows 100000] [--locale de_DE]
+
+Compares babel's format_currency() called per price (if babel is installed)
+with format_money() per price and format_many() on a list of Money and on
+a MoneyArray.
+"""
+import optparse
+import random
+from decimal import Decimal
+
+from common import report, time_row
+from money import Money, MoneyArray, CURRENCY
+from money.arrays import numpy
+from money.formatting import format_money, format_many
+
+try:
+    from babel.numbers import format_currency
+except ImportError:
+    format_currency = None
+
+CODES = ('USD', 'EUR', 'GBP', 'JPY', 'CHF')
+
+
+def main():
+    parser = optparse.OptionParser()
+    parser.add_option('--rows', type='int', default=100000)
+    parser.add_option('--locale', default='de_DE')
+    options, args = parser.parse_args()
+    count, locale = options.rows, options.locale
+
+    rng = random.Random(0)
+    codes = [rng.choice(CODES) for i in xrange(count)]
+    moneys = [Money._make(Decimal(rng.randint(-100000, 10000000)).scaleb(-CURRENCY[c].decimals), CURRENCY[c])
+              for c in codes]
+
+    rows = []
+    if format_currency:
+        time_row(rows, 'babel format_currency per price', count,
+              lambda: [format_currency(m.amount, m.currency.code, locale=locale) for m in moneys])
+    time_row(rows, 'format_money per price', count, lambda: [format_money(m, locale) for m in moneys])
+    time_row(rows, 'format_many(list)', count, format_many, moneys, locale)
+    if numpy:
+        time_row(rows, 'format_many(MoneyArray)', count, format_many, MoneyArray.from_money(moneys), locale)
+    report('Formatting throughput (%s)' % locale, rows, ('path', 'rows', 'seconds', 'rows/s'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Cold import time of the package.
+
+    $ python benchmarks/bench_import.py [--repeat 20] [--compare /path/to/other/checkout]
+
+Every sample starts a fresh interpreter. The time of an interpreter that
+only starts up is subtracted. With --compare the same measurement is made
+for another checkout (e.g. an older release) for comparison.
+"""
+import optparse
+import os
+import subprocess
+import sys
+import time
+
+from common import ROOT, report
+
+IMPORT = 'import money'
+LOOKUP = "import money; money.CURRENCY['USD']; money.Money(1, 'EUR')"
+SCAN = 'import money; len(money.CURRENCY.values())'
+
+
+def run(code, path, repeat):
+    env = dict(os.environ, PYTHONPATH=path, PYTHONDONTWRITEBYTECODE='')
+    samples = []
+    for i in xrange(repeat):
+        start = time.time()
+        subprocess.check_call([sys.executable, '-c', code], env=env)
+        samples.append(time.time() - start)
+    return min(samples)
+
+
+def main():
+    parser = optparse.OptionParser()
+    parser.add_option('--repeat', type='int', default=20)
+    parser.add_option('--compare', default=None)
+    options, args = parser.parse_args()
+
+    checkouts = [('current', ROOT)]
+    if options.compare:
+        checkouts.insert(0, ('compare', os.path.abspath(options.compare)))
+
+    # Make sure the .pyc files exist before measuring
+    for label, path in checkouts:
+        run(SCAN, path, 1)
+
+    startup = run('pass', ROOT, options.repeat)
+    rows = []
+    for label, path in checkouts:
+        for name, code in (('import money', IMPORT),
+                           ('import + first lookups', LOOKUP),
+                           ('import + load all currencies', SCAN)):
+            seconds = run(code, path, options.repeat) - startup
+            rows.append((label, name, '%.2f' % (seconds * 1000)))
+    report('Cold import time (ms, interpreter startup subtracted)', rows,
+           ('checkout', 'measurement', 'ms'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Memory footprint and construction cost of ``Money`` and ``Currency``
+compared to the original old-style classes.
+
+    $ python benchmarks/bench_memory.py
+"""
+import sys
+from decimal import Decimal
+
+from common import best_of, report
+import legacy
+from money import Money, Currency, CURRENCY
+
+
+def instance_size(obj):
+    """
+    Size of the instance itself plus its attribute dict, if it has one.
+    The referenced values (the Decimal, the Currency) are shared and are
+    not counted.
+    """
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def main():
+    amount = Decimal('19.99')
+    usd, legacy_usd = CURRENCY['USD'], legacy.CURRENCY['USD']
+
+    rows = []
+    for label, money_cls, currency_cls, currency in (
+            ('legacy', legacy.Money, legacy.Currency, legacy_usd),
+            ('current', Money, Currency, usd)):
+        money = money_cls(amount, currency)
+        cur = currency_cls(code='USD', numeric='840', name='US Dollar')
+        rows.append((
+            label,
+            instance_size(money),
+            instance_size(cur),
+            '%.3f' % (best_of(lambda: money_cls(amount, currency)) * 1e6),
+            '%.3f' % (best_of(lambda: money_cls('19.99', 'USD')) * 1e6),
+        ))
+    report('Money/Currency footprint (bytes) and construction (usec)', rows,
+           ('classes', 'Money bytes', 'Currency bytes',
+            'Money(Decimal, Currency)', "Money('19.99', 'USD')"))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Per-operator cost of ``Money`` compared to the original implementation,
+which coerced every operand with ``Decimal(str(...))``.
+
+    $ python benchmarks/bench_operators.py
+"""
+from decimal import Decimal
+
+from common import best_of, report
+import legacy
+from money import Money, CURRENCY
+
+
+def cases(money_cls, usd):
+    a = money_cls(Decimal('19.99'), usd)
+    b = money_cls(Decimal('5.01'), usd)
+    return (
+        ('Money(Decimal, Currency)', lambda: money_cls(Decimal('19.99'), usd)),
+        ("Money(int, 'USD')", lambda: money_cls(1999, 'USD')),
+        ("Money(float, 'USD')", lambda: money_cls(19.99, 'USD')),
+        ('money + money', lambda: a + b),
+        ('money + int', lambda: a + 5),
+        ('money - money', lambda: a - b),
+        ('money * int', lambda: a * 3),
+        ('money * Decimal', lambda: a * Decimal('1.2')),
+        ('int % money', lambda: 5 % a),
+        ('money < money', lambda: a < b),
+        ('money > int', lambda: a > 10),
+    )
+
+
+def main():
+    rows = []
+    before = cases(legacy.Money, legacy.CURRENCY['USD'])
+    after = cases(Money, CURRENCY['USD'])
+    for (label, old), (_, new) in zip(before, after):
+        old_time, new_time = best_of(old), best_of(new)
+        rows.append((label, '%.3f' % (old_time * 1e6), '%.3f' % (new_time * 1e6),
+                     '%.2fx' % (old_time / new_time)))
+    report('Money operators (usec per call)', rows,
+           ('operation', 'before', 'after', 'speedup'))
+
+
+if __name__ == '__main__':
+    main()
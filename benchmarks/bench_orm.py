@@ -0,0 +1,137 @@
+"""
+Loading and aggregating model instances with a MoneyField on SQLite.
+
+    $ python benchmarks/bench_orm.py [--rows 50000]
+
+Fills an in-memory SQLite table with a MoneyField in a few currencies and
+times loading every row and reading its price, with the current
+MoneyFieldProxy and with a copy of the original one, which builds every
+Money from a string and looks its currency up again for every row.
+Loading the rows without reading the price is timed as the floor.
+
+Then compares per-currency totals computed by aggregate_by_currency() in
+the database with loading every row and adding the prices in Python, and
+inserting rows one save() at a time with bulk_create().
+"""
+import optparse
+import random
+
+from common import report, time_row
+from suite import setup_django
+from money import Money, RateTable
+from money.aggregate import sum_by_currency
+
+CODES = ('USD', 'EUR', 'GBP', 'JPY', 'CHF')
+
+
+class OriginalMoneyFieldProxy(object):
+    """
+    The MoneyFieldProxy of python-money 0.2.
+    """
+    def __init__(self, field):
+        from django.utils.encoding import smart_unicode
+        self.smart_unicode = smart_unicode
+        self.field = field
+        self.currency_field_name = '%s_currency' % field.name
+
+    def _money_from_obj(self, obj):
+        return Money(obj.__dict__[self.field.name], obj.__dict__[self.currency_field_name])
+
+    def __get__(self, obj, type=None):
+        if obj is None:
+            raise AttributeError('Can only be accessed via an instance.')
+        if not isinstance(obj.__dict__[self.field.name], Money):
+            obj.__dict__[self.field.name] = self._money_from_obj(obj)
+        return obj.__dict__[self.field.name]
+
+    def __set__(self, obj, value):
+        if isinstance(value, Money):
+            obj.__dict__[self.field.name] = value.amount
+            setattr(obj, self.currency_field_name, self.smart_unicode(value.currency))
+        else:
+            if value: value = str(value)
+            obj.__dict__[self.field.name] = self.field.to_python(value)
+
+
+def fill(model, count):
+    from django.db import connection, transaction
+    rng = random.Random(0)
+    rows = [('row %d' % i, '%d.%02d' % (rng.randint(0, 99999), rng.randint(0, 99)), rng.choice(CODES))
+            for i in xrange(count)]
+    cursor = connection.cursor()
+    cursor.executemany('INSERT INTO %s (name, price, price_currency) VALUES (%%s, %%s, %%s)'
+                       % model._meta.db_table, rows)
+    transaction.commit_unless_managed()
+
+
+def main():
+    parser = optparse.OptionParser()
+    parser.add_option('--rows', type='int', default=50000)
+    options, args = parser.parse_args()
+    count = options.rows
+
+    if not setup_django():
+        print 'Django is not installed'
+        return
+    from money.tests.models import TestMoneyModel
+    fill(TestMoneyModel, count)
+    current = TestMoneyModel.__dict__['price']
+    original = OriginalMoneyFieldProxy(current.field)
+
+    def load():
+        list(TestMoneyModel.objects.all())
+
+    def load_prices():
+        [instance.price for instance in TestMoneyModel.objects.all()]
+
+    rows = []
+    time_row(rows, 'load rows, price not read', count, load)
+    try:
+        TestMoneyModel.price = original
+        time_row(rows, 'load rows + read price (original proxy)', count, load_prices)
+    finally:
+        TestMoneyModel.price = current
+    time_row(rows, 'load rows + read price', count, load_prices)
+    report('Loading MoneyField rows from SQLite', rows, ('path', 'rows', 'seconds', 'rows/s'))
+
+    rates = RateTable('USD', {'EUR': '0.9', 'GBP': '0.8', 'JPY': '110', 'CHF': '0.95'})
+    objects = TestMoneyModel.objects
+
+    def python_totals():
+        sum_by_currency([instance.price for instance in objects.all()])
+
+    def python_total_usd():
+        sum([instance.price.convert_to('USD', rates) for instance in objects.all()], Money(0, 'USD'))
+
+    rows = []
+    time_row(rows, 'totals per currency, Python loop', count, python_totals)
+    time_row(rows, 'totals per currency, aggregate_by_currency', count,
+          lambda: objects.aggregate_by_currency('price'))
+    time_row(rows, 'total in USD, Python loop', count, python_total_usd)
+    time_row(rows, 'total in USD, aggregate_by_currency', count,
+          lambda: objects.aggregate_by_currency('price', currency='USD', rates=rates))
+    report('Aggregating MoneyField rows on SQLite', rows, ('path', 'rows', 'seconds', 'rows/s'))
+
+    from django.db import transaction
+    from money.tests.models import TestMoneyModel_USD
+    rng = random.Random(1)
+    prices = [Money('%d.%02d' % (rng.randint(0, 99999), rng.randint(0, 99)), rng.choice(CODES))
+              for i in xrange(count)]
+
+    @transaction.commit_on_success
+    def save_each():
+        for price in prices:
+            TestMoneyModel_USD(name='saved', price=price).save()
+
+    def bulk_create():
+        TestMoneyModel_USD.objects.bulk_create(
+            [TestMoneyModel_USD(name='bulk', price=price) for price in prices], batch_size=1000)
+
+    rows = []
+    time_row(rows, 'save() per row', count, save_each)
+    time_row(rows, 'bulk_create(batch_size=1000)', count, bulk_create)
+    report('Inserting MoneyField rows on SQLite', rows, ('path', 'rows', 'seconds', 'rows/s'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Parsing monetary strings.
+
+    $ python benchmarks/bench_parse.py [--rows 100000]
+
+Compares the original Money.from_string() with parse_many() on a feed where
+every value carries a currency code, the format from_string() understands.
+parse_many() also accepts symbols, trailing codes, thousands separators and
+negative formats; its throughput on such a mixed feed is reported too.
+"""
+import optparse
+import random
+
+from common import report, time_row
+from money.parsing import parse_many
+import legacy
+
+# the original registry in legacy.py only knows these
+CODES = ('USD', 'EUR')
+FORMATS = ('%(code)s %(amount)s', '%(amount)s %(code)s', u'$%(amount)s',
+           '%(code)s %(thousands)s', '(%(code)s %(amount)s)', '-%(amount)s %(code)s')
+
+
+def legacy_parse(values):
+    result = []
+    for value in values:
+        money = legacy.Money()
+        money.from_string(value)
+        result.append(money)
+    return result
+
+
+def main():
+    parser = optparse.OptionParser()
+    parser.add_option('--rows', type='int', default=100000)
+    options, args = parser.parse_args()
+    count = options.rows
+
+    rng = random.Random(0)
+    values = [{'code': rng.choice(CODES), 'amount': '%d.%02d' % (rng.randint(0, 99999), rng.randint(0, 99)),
+               'thousands': '{:,}.00'.format(rng.randint(1000, 9999999))}
+              for i in xrange(count)]
+    simple = ['%(code)s %(amount)s' % value for value in values]
+    mixed = [rng.choice(FORMATS) % value for value in values]
+
+    rows = []
+    time_row(rows, 'Money.from_string (original)', count, legacy_parse, simple)
+    time_row(rows, 'parse_many', count, list, parse_many(simple))
+    time_row(rows, 'parse_many, mixed formats', count, list, parse_many(mixed))
+    report('String parsing throughput', rows, ('path', 'rows', 'seconds', 'rows/s'))
+
+
+if __name__ == '__main__':
+    main()
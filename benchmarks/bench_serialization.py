@@ -0,0 +1,55 @@
+"""
+Serializing lists of Money.
+
+    $ python benchmarks/bench_serialization.py [--rows 100000]
+
+Compares the hand-rolled ``{"amount": str(m.amount), "currency": code}``
+dicts passed through json with dumps_many()/loads_many(), and with the
+msgpack hooks when msgpack is installed.
+"""
+import json
+import optparse
+import random
+from decimal import Decimal
+
+from common import report, timed
+from money import Money, CURRENCY
+from money.optional import msgpack
+from money.serialization import dumps_many, loads_many, packb_many, unpackb_many
+
+CODES = ('USD', 'EUR', 'GBP', 'JPY', 'CHF')
+
+
+def hand_dumps(moneys):
+    return json.dumps([{'amount': str(m.amount), 'currency': m.currency.code} for m in moneys])
+
+
+def hand_loads(s):
+    return [Money(Decimal(obj['amount']), obj['currency']) for obj in json.loads(s)]
+
+
+def main():
+    parser = optparse.OptionParser()
+    parser.add_option('--rows', type='int', default=100000)
+    options, args = parser.parse_args()
+    count = options.rows
+
+    rng = random.Random(0)
+    moneys = [Money._make(Decimal(rng.randint(-100000, 10000000)).scaleb(-2), CURRENCY[rng.choice(CODES)])
+              for i in xrange(count)]
+    paths = [('hand-rolled json', hand_dumps, hand_loads),
+             ('dumps_many/loads_many', dumps_many, loads_many)]
+    if msgpack:
+        paths.append(('packb_many/unpackb_many', packb_many, unpackb_many))
+
+    rows = []
+    for label, dump, load in paths:
+        dump_seconds, data = timed(dump, moneys)
+        load_seconds, result = timed(load, data)
+        assert result == moneys
+        rows.append((label, count, len(data), '%.3f' % dump_seconds, '%.3f' % load_seconds))
+    report('Serialization of a list of Money', rows, ('path', 'rows', 'bytes', 'encode s', 'decode s'))
+
+
+if __name__ == '__main__':
+    main()
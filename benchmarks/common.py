@@ -0,0 +1,61 @@
+"""
+Helpers shared by the benchmark scripts in this directory.
+
+The scripts are meant to be run from a source checkout, e.g.::
+
+    $ python benchmarks/bench_memory.py
+
+so the checkout root is put on ``sys.path`` ahead of any installed copy of
+the package.
+"""
+import os
+import sys
+import time
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def best_of(func, number=10000, repeat=5):
+    """
+    Returns the best per-call time of ``func`` in seconds.
+    """
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def timed(func, *args):
+    """
+    Calls ``func(*args)`` once and returns the elapsed seconds and the
+    result.
+    """
+    start = time.time()
+    result = func(*args)
+    return time.time() - start, result
+
+
+def time_row(rows, label, count, func, *args):
+    """
+    Times ``func(*args)`` over ``count`` items and appends a (label, count,
+    seconds, items per second) row for report() to ``rows``.
+    """
+    seconds, result = timed(func, *args)
+    rows.append((label, count, '%.3f' % seconds, '%.0f' % (count / seconds)))
+    return result
+
+
+def report(title, rows, columns):
+    """
+    Prints ``rows`` (a list of tuples) as a plain-text table.
+    """
+    print title
+    print '-' * len(title)
+    widths = [max(len(str(c)), max([len(str(r[i])) for r in rows] or [0]))
+              for i, c in enumerate(columns)]
+    line = '  '.join(['%%-%ds' % w for w in widths])
+    print line % tuple(columns)
+    for row in rows:
+        print line % tuple(row)
+    print
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Reference copies of the original old-style ``Currency`` and ``Money``
+classes (python-money 0.2). The benchmarks use them as the baseline that
+the current implementation is measured against; they are not meant to be
+used by application code.
+"""
+from decimal import Decimal
+
+
+class Currency:
+    code = "XXX"
+    country = ""
+    countries = []
+    name = ""
+    numeric = "999"
+    exchange_rate = Decimal("1.0")
+    def __init__(self, code="", numeric="999", name="", symbol=u"", decimals=2, countries=[]):
+        self.code = code
+        self.numeric = numeric
+        self.name = name
+        self.symbol = symbol
+        self.decimals = decimals
+        self.countries = countries
+
+    def __repr__(self):
+        return self.code
+    def __eq__(self, other):
+        if isinstance(other, Currency):
+            return self.code and other.code and self.code == other.code
+        return False
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+
+CURRENCY = {}
+CURRENCY['XXX'] = Currency(code="XXX", numeric="999")
+CURRENCY['USD'] = Currency(code='USD', numeric='840', name='US Dollar', symbol=u"$", decimals=2)
+CURRENCY['EUR'] = Currency(code='EUR', numeric='978', name='Euro', symbol=u"€", decimals=2)
+DEFAULT_CURRENCY = CURRENCY['XXX']
+
+
+class Money:
+    amount = Decimal("0.0")
+    currency = DEFAULT_CURRENCY
+    def __init__ (self, amount=Decimal("0.0"), currency=None):
+        if not isinstance(amount, Decimal):
+            amount = Decimal(str(amount or 0))
+        self.amount = amount
+        if not currency:
+            self.currency = DEFAULT_CURRENCY
+        else:
+            if not isinstance(currency, Currency):
+                currency = CURRENCY[str(currency).upper()]
+            self.currency = currency
+
+    def __repr__(self):
+        return '%s %5.2f' % (self.currency, self.amount)
+    def __add__(self, other):
+        if isinstance(other, Money):
+            if self.currency == other.currency:
+                return Money(amount = self.amount + other.amount, currency = self.currency)
+            raise TypeError('legacy cross-currency addition is not modelled')
+        else:
+            return Money(amount = self.amount + Decimal(str(other)), currency = self.currency)
+    def __sub__(self, other):
+        if isinstance(other, Money):
+            if self.currency == other.currency:
+                return Money(amount = self.amount - other.amount, currency = self.currency)
+            raise TypeError('legacy cross-currency subtraction is not modelled')
+        else:
+            return Money(amount = self.amount - Decimal(str(other)), currency = self.currency)
+    def __mul__(self, other):
+        if isinstance(other, Money):
+            raise TypeError('can not multiply monetary quantities')
+        else:
+            return Money(amount = self.amount*Decimal(str(other)), currency = self.currency)
+    def __rmod__(self, other):
+        if isinstance(other, Money):
+            raise TypeError('invalid monetary operation')
+        else:
+            return Money(amount = Decimal(str(other)) * self.amount / 100, currency = self.currency)
+    def __lt__(self, other):
+        if isinstance(other, Money):
+            if (self.currency == other.currency):
+                return (self.amount < other.amount)
+            else:
+                raise TypeError('can not compare different currencies')
+        else:
+            return (self.amount < Decimal(str(other)))
+    def __gt__(self, other):
+        if isinstance(other, Money):
+            if (self.currency == other.currency):
+                return (self.amount > other.amount)
+            else:
+                raise TypeError('can not compare different currencies')
+        else:
+            return (self.amount > Decimal(str(other)))
+    def from_string(self, s):
+        try:
+            self.amount = Decimal(str(s).strip())
+            self.currency = DEFAULT_CURRENCY
+        except:
+            try:
+                s = s.strip()
+                self.currency = CURRENCY[s[:3].upper()]
+                self.amount = Decimal(s[3:].strip())
+            except:
+                raise ValueError(s)
+    def allocate(self, ratios):
+        total = sum(ratios)
+        remainder = self.amount
+        results = []
+        for i in range(0, len(ratios)):
+            results.append(Money(amount = self.amount * ratios[i] / total, currency = self.currency))
+            remainder -= results[i].amount
+        i = 0
+        while i < remainder:
+            results[i].amount += Decimal("0.01")
+            i += 1
+        return results
@@ -0,0 +1,246 @@
+"""
+Benchmark suite with machine-readable results.
+
+    $ python benchmarks/suite.py [--output results.json] [--compare baseline.json]
+                                 [--filter NAME] [--quick]
+
+Runs a fixed set of micro-benchmarks covering construction, operators,
+conversion, allocation, parsing, formatting, import time and the Django
+model field on an in-memory SQLite database, and prints the time per call
+of each. Fixtures are generated from a fixed seed so runs are comparable.
+
+--output writes the results as JSON; --compare reads such a file (e.g. from
+an older checkout) and adds the ratio to it for every benchmark, marking
+regressions beyond --threshold. The Django benchmarks are skipped if Django
+is not installed.
+"""
+import json
+import optparse
+import platform
+import random
+import sys
+import time
+from decimal import Decimal
+
+from common import ROOT, best_of, report
+from money import Money, CURRENCY, RateTable
+from money.parsing import parse_money
+from money.formatting import format_money
+
+SEED = 20121
+
+BENCHMARKS = []
+
+
+def benchmark(group, number=10000):
+    """
+    Registers a fixture function. It is called once and returns either the
+    callable to time, or a dict of name -> callable for several benchmarks
+    sharing the fixture.
+    """
+    def register(fixture):
+        BENCHMARKS.append((group, fixture, number))
+        return fixture
+    return register
+
+
+def _prices(count=100):
+    rng = random.Random(SEED)
+    return [Money(Decimal(rng.randint(1, 1000000)).scaleb(-2), 'USD') for i in xrange(count)]
+
+
+@benchmark('construction')
+def construction():
+    usd = CURRENCY['USD']
+    return {
+        'Money(Decimal, Currency)': lambda: Money(Decimal('19.99'), usd),
+        "Money(str, 'USD')": lambda: Money('19.99', 'USD'),
+        "Money(int, 'USD')": lambda: Money(1999, 'USD'),
+        "Money(float, 'USD')": lambda: Money(19.99, 'USD'),
+    }
+
+
+@benchmark('operators')
+def operators():
+    a, b = Money('19.99', 'USD'), Money('5.01', 'USD')
+    return {
+        'money + money': lambda: a + b,
+        'money + int': lambda: a + 5,
+        'money - money': lambda: a - b,
+        '-money': lambda: -a,
+        'money * int': lambda: a * 3,
+        'money * Decimal': lambda: a * Decimal('1.2'),
+        'money / int': lambda: a / 3,
+        'int % money': lambda: 5 % a,
+        'money == money': lambda: a == b,
+        'money < money': lambda: a < b,
+        'money > int': lambda: a > 10,
+    }
+
+
+@benchmark('conversion')
+def conversion():
+    rates = RateTable('USD', {'EUR': '0.8', 'GBP': '0.65', 'JPY': '110'})
+    price = Money('19.99', 'EUR')
+    return {
+        'convert_to(GBP)': lambda: price.convert_to('GBP', rates=rates),
+        'money + money (cross-currency)': lambda: price + Money(1, 'GBP'),
+    }
+
+
+@benchmark('allocation', number=2000)
+def allocation():
+    price = Money('100.00', 'USD')
+    return {
+        'allocate((1, 1, 1))': lambda: price.allocate((1, 1, 1)),
+        'allocate((70, 20, 10))': lambda: price.allocate((70, 20, 10)),
+    }
+
+
+@benchmark('parsing')
+def parsing():
+    price = Money()
+    return {
+        "from_string('USD 19.99')": lambda: price.from_string('USD 19.99'),
+        "parse_money('USD 19.99')": lambda: parse_money('USD 19.99'),
+        "parse_money('$1,234.50')": lambda: parse_money(u'$1,234.50'),
+    }
+
+
+@benchmark('formatting')
+def formatting():
+    price = Money('1234.5', 'USD')
+    return {
+        'repr(money)': lambda: repr(price),
+        'unicode(money)': lambda: unicode(price),
+        "format_money(money, 'en_US')": lambda: format_money(price, 'en_US'),
+        "format_money(money, 'de_DE', style='code')": lambda: format_money(price, 'de_DE', style='code'),
+    }
+
+
+@benchmark('import', number=1)
+def import_time():
+    from bench_import import run, IMPORT, LOOKUP
+    def measure(code):
+        startup = run('pass', ROOT, 5)
+        return lambda: run(code, ROOT, 5) - startup
+    return {
+        'import money': measure(IMPORT),
+        'import money + first lookups': measure(LOOKUP),
+    }
+
+
+def setup_django():
+    """
+    Configures Django for an in-memory SQLite database with the test models
+    and creates their tables. Returns False if Django is not installed.
+    """
+    try:
+        from django.conf import settings
+    except ImportError:
+        return False
+    if not settings.configured:
+        settings.configure(
+            DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+            INSTALLED_APPS=('money.tests',))
+    from django.core.management import call_command
+    call_command('syncdb', verbosity=0, interactive=False)
+    return True
+
+
+@benchmark('django', number=200)
+def django_orm():
+    if not setup_django():
+        return {}
+    from django.db.models import Q
+    from money.tests.models import TestMoneyModel
+    for price in _prices():
+        TestMoneyModel.objects.create(name='fixture', price=price)
+    instance = TestMoneyModel.objects.all()[0]
+    instance.price
+    pks = list(TestMoneyModel.objects.values_list('pk', flat=True)[:100])
+
+    def read_price():
+        row = TestMoneyModel(name='x', price=Money('1.00', 'USD'))
+        return row.price
+
+    return {
+        'MoneyFieldProxy.__get__ (cached)': lambda: instance.price,
+        'MoneyFieldProxy.__set__ + __get__': read_price,
+        'save() new row': lambda: TestMoneyModel(name='new', price=Money('9.99', 'EUR')).save(),
+        'load 100 rows + read price': lambda: [row.price for row in
+                                               TestMoneyModel.objects.filter(pk__in=pks)],
+        'filter(price__gt=Money)': lambda: list(TestMoneyModel.objects.filter(
+            price__gt=Money('5000.00', 'USD'))[:10]),
+        'filter(Q(price=Money) | Q(price=Money))': lambda: list(TestMoneyModel.objects.filter(
+            Q(price=Money('19.99', 'USD')) | Q(price=Money('19.99', 'EUR')))),
+        'build filter(price__gt=Money).exclude(price=Money)': lambda: TestMoneyModel.objects.filter(
+            price__gt=Money('5000.00', 'USD')).exclude(price=Money('6000.00', 'USD')),
+    }
+
+
+def run(pattern=None, quick=False):
+    results = {}
+    for group, fixture, number in BENCHMARKS:
+        cases = fixture()
+        if callable(cases):
+            cases = {fixture.__name__: cases}
+        for name, func in sorted(cases.items()):
+            key = '%s: %s' % (group, name)
+            if pattern and pattern not in key:
+                continue
+            if group == 'import':
+                results[key] = func()
+            else:
+                repeat = 3 if quick else 5
+                results[key] = best_of(func, number=max(1, number / 10) if quick else number,
+                                       repeat=repeat)
+    return results
+
+
+def main():
+    parser = optparse.OptionParser()
+    parser.add_option('--output', help='write the results to this JSON file')
+    parser.add_option('--compare', help='compare with the results in this JSON file')
+    parser.add_option('--threshold', type='float', default=1.2,
+                      help='ratio above which a benchmark counts as a regression')
+    parser.add_option('--filter', help='only run benchmarks whose name contains this')
+    parser.add_option('--quick', action='store_true', help='fewer iterations')
+    options, args = parser.parse_args()
+
+    results = run(options.filter, options.quick)
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump({'python': platform.python_version(),
+                       'platform': platform.platform(),
+                       'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                       'results': results}, f, indent=2, sort_keys=True)
+
+    baseline = {}
+    if options.compare:
+        with open(options.compare) as f:
+            baseline = json.load(f)['results']
+    rows = []
+    regressions = 0
+    for key in sorted(results):
+        row = [key, '%.3f' % (results[key] * 1e6)]
+        if options.compare:
+            if key in baseline:
+                ratio = results[key] / baseline[key]
+                regressions += ratio > options.threshold
+                row += ['%.3f' % (baseline[key] * 1e6),
+                        '%.2fx%s' % (ratio, ' !' if ratio > options.threshold else '')]
+            else:
+                row += ['-', '-']
+        rows.append(row)
+    columns = ['benchmark', 'usec']
+    if options.compare:
+        columns += ['baseline usec', 'ratio']
+    report('Benchmark suite (time per call)', rows, columns)
+    if regressions:
+        print '%d benchmark(s) slower than %.2fx the baseline' % (regressions, options.threshold)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1 +1,3 @@
-from money import *
\ No newline at end of file
+from money import *
+from arrays import MoneyArray
+from rates import RateTable, HistoricalRates, convert_many
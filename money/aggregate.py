@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Per-currency aggregation of monetary amounts.
+
+Adding Money values of different currencies converts both through the
+default currency. Reports usually want the opposite: one total per currency,
+optionally broken down by a grouping key. The functions here compute those
+totals in a single pass, summing exact integer minor units.
+"""
+from itertools import izip
+
+from money import Money, CURRENCY, _get_currency
+from arrays import MoneyArray, numpy, from_minor
+
+__all__ = ('sum_by_currency', 'group_sum', 'group_sum_arrays')
+
+
+class _Accumulator(object):
+    """
+    Hash-based accumulator of (key, currency) totals. Amounts are summed as
+    integer minor units; any precision finer than the currency's minor unit
+    is carried separately as a Decimal so that totals stay exact.
+    """
+    __slots__ = ('totals', 'residues', 'scales')
+
+    def __init__(self):
+        self.totals = {}
+        self.residues = {}
+        self.scales = {}
+
+    def add(self, key, money):
+        currency = money.currency
+        try:
+            decimals = self.scales[currency.code]
+        except KeyError:
+            decimals = self.scales[currency.code] = currency.decimals
+        minor = money.amount.scaleb(decimals)
+        integral = int(minor)
+        group = (key, currency.code)
+        self.totals[group] = self.totals.get(group, 0) + integral
+        if minor != integral:
+            self.residues[group] = self.residues.get(group, 0) + (money.amount - from_minor(integral, currency))
+
+    def result(self, keyed=True):
+        results = {}
+        for group, minor in self.totals.iteritems():
+            currency = CURRENCY[group[1]]
+            amount = from_minor(minor, currency)
+            if group in self.residues:
+                amount += self.residues[group]
+            results[group if keyed else group[1]] = Money._make(amount, currency)
+        return results
+
+
+def sum_by_currency(moneys):
+    """
+    Returns a dict mapping currency code to the total of ``moneys`` in that
+    currency. ``moneys`` may be any iterable of Money or a MoneyArray.
+
+    >>> totals = sum_by_currency([Money(1, 'USD'), Money(2, 'EUR'), Money(3, 'USD')])
+    >>> totals['USD']
+    USD  4.00
+    """
+    if isinstance(moneys, MoneyArray):
+        return dict((code, total) for (key, code), total in
+                    _group_sum_minor(moneys.minor, moneys.currencies, None).iteritems())
+    accumulator = _Accumulator()
+    for money in moneys:
+        accumulator.add(None, money)
+    return accumulator.result(keyed=False)
+
+
+def group_sum(moneys, keys):
+    """
+    Returns a dict mapping (key, currency code) pairs to totals. ``keys`` is
+    an iterable parallel to ``moneys`` giving the group of every amount.
+    ``moneys`` may be any iterable of Money or a MoneyArray, in which case
+    the totals are computed with NumPy.
+    """
+    if isinstance(moneys, MoneyArray):
+        return _group_sum_minor(moneys.minor, moneys.currencies, keys)
+    accumulator = _Accumulator()
+    for money, key in izip(moneys, keys):
+        accumulator.add(key, money)
+    return accumulator.result()
+
+
+def group_sum_arrays(amounts, currencies, keys=None):
+    """
+    Like group_sum() but takes parallel sequences of amounts (in major
+    units, anything Money accepts) and currencies. Without ``keys`` the
+    result is keyed by currency code only.
+
+    Integer NumPy arrays of amounts are taken to be in minor units already
+    and are summed with NumPy.
+    """
+    if numpy and isinstance(amounts, numpy.ndarray) and amounts.dtype.kind in 'iu':
+        totals = _group_sum_minor(amounts, numpy.asarray(currencies), keys)
+    else:
+        moneys = (Money(amount, currency) for amount, currency in izip(amounts, currencies))
+        if keys is None:
+            return sum_by_currency(moneys)
+        return group_sum(moneys, keys)
+    if keys is None:
+        return dict((code, total) for (key, code), total in totals.iteritems())
+    return totals
+
+
+def _group_sum_minor(minor, codes, keys):
+    """
+    Vectorized grouping: sorts the rows by group once and sums every run of
+    equal groups with numpy.add.reduceat, which stays in exact int64.
+    """
+    result = {}
+    if not len(minor):
+        return result
+    unique_codes, code_index = numpy.unique(codes, return_inverse=True)
+    # codes such as 'usd' and 'USD' are one currency
+    currencies = [_get_currency(code) for code in unique_codes.tolist()]
+    normalized, remap = numpy.unique([c.code for c in currencies], return_inverse=True)
+    if len(normalized) != len(unique_codes):
+        code_index = remap[code_index]
+    currencies = [_get_currency(code) for code in normalized.tolist()]
+    if keys is None:
+        unique_keys, key_index = [None], numpy.zeros(len(minor), dtype=numpy.intp)
+    else:
+        unique_keys, key_index = numpy.unique(numpy.asarray(keys), return_inverse=True)
+    group = key_index.astype(numpy.int64) * len(currencies) + code_index
+    order = numpy.argsort(group, kind='mergesort')
+    group = group[order]
+    starts = numpy.concatenate(([0], numpy.flatnonzero(numpy.diff(group)) + 1))
+    totals = numpy.add.reduceat(numpy.asarray(minor, dtype=numpy.int64)[order], starts)
+    for start, total in izip(starts, totals):
+        key, code = divmod(int(group[start]), len(currencies))
+        currency = currencies[code]
+        key = unique_keys[key]
+        if hasattr(key, 'item'):
+            key = key.item()
+        result[(key, currency.code)] = Money._make(from_minor(total, currency), currency)
+    return result
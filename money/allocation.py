@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Exact allocation of integer minor units.
+
+Amounts are split in proportion to a vector of ratios with the largest
+remainder method: every part gets the floor of its exact share and the
+minor units left over go, one each, to the parts with the largest
+fractional remainders (earlier parts win ties). The parts always add up to
+the original total.
+"""
+from decimal import Decimal
+
+from optional import numpy
+
+__all__ = ('allocate_minor', 'allocate_minor_many')
+
+INT64_MAX = 2 ** 63 - 1
+
+
+def integer_ratios(ratios):
+    """
+    Returns ``ratios`` scaled to a list of non-negative integers with the
+    same proportions.
+    """
+    if not len(ratios):
+        raise ValueError("at least one ratio is required")
+    decimals = []
+    for ratio in ratios:
+        if isinstance(ratio, (int, long)):
+            decimals.append(Decimal(ratio))
+        elif isinstance(ratio, float):
+            decimals.append(Decimal(repr(ratio)))
+        else:
+            decimals.append(Decimal(str(ratio)))
+    places = max(0, -min(d.as_tuple().exponent for d in decimals))
+    ratios = [int(d.scaleb(places)) for d in decimals]
+    if min(ratios) < 0:
+        raise ValueError("ratios must not be negative")
+    if not sum(ratios):
+        raise ValueError("ratios must not all be zero")
+    return ratios
+
+
+def allocate_minor(total, ratios):
+    """
+    Splits the integer ``total`` in proportion to ``ratios`` and returns the
+    parts as a list of integers.
+
+    >>> allocate_minor(100, (1, 1, 1))
+    [34, 33, 33]
+    """
+    ratios = integer_ratios(ratios)
+    if total < 0:
+        return [-part for part in allocate_minor(-total, ratios)]
+    denominator = sum(ratios)
+    parts, remainders = [], []
+    for ratio in ratios:
+        part, remainder = divmod(total * ratio, denominator)
+        parts.append(part)
+        remainders.append(remainder)
+    leftover = total - sum(parts)
+    # sorted() is stable, so equal remainders keep their original order
+    for i in sorted(range(len(ratios)), key=lambda i: -remainders[i])[:leftover]:
+        parts[i] += 1
+    return parts
+
+
+def allocate_minor_many(totals, ratios):
+    """
+    Splits every integer in ``totals`` in proportion to the same ``ratios``.
+    Returns a sequence with one row of parts per total: a two-dimensional
+    int64 array when NumPy is available, a list of lists otherwise.
+    """
+    ratios = integer_ratios(ratios)
+    if not numpy:
+        return [allocate_minor(total, ratios) for total in totals]
+
+    totals = numpy.asarray(totals, dtype=numpy.int64)
+    largest = max(abs(int(totals.max())), abs(int(totals.min()))) if len(totals) else 0
+    if largest * max(ratios) > INT64_MAX or sum(ratios) > INT64_MAX:
+        # the shares would overflow int64, e.g. with float ratios; this is
+        # exact in Python integers
+        return numpy.array([allocate_minor(total, ratios) for total in totals.tolist()],
+                           dtype=numpy.int64).reshape(len(totals), len(ratios))
+    signs = numpy.where(totals < 0, -1, 1)
+    magnitudes = numpy.abs(totals)
+    weights = numpy.asarray(ratios, dtype=numpy.int64)
+    parts, remainders = numpy.divmod(magnitudes[:, None] * weights, sum(ratios))
+    leftover = magnitudes - parts.sum(axis=1)
+
+    order = numpy.argsort(-remainders, axis=1, kind='mergesort')
+    rank = numpy.empty_like(order)
+    rows = numpy.arange(len(totals))[:, None]
+    rank[rows, order] = numpy.arange(len(ratios))
+    parts += rank < leftover[:, None]
+    return parts * signs[:, None]
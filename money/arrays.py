@@ -0,0 +1,411 @@
+# -*- coding: utf-8 -*-
+"""
+Vectorized monetary amounts.
+
+A MoneyArray stores amounts as a NumPy int64 array of minor units (cents for
+USD, yen for JPY, ...) scaled by ``Currency.decimals``, plus either a single
+Currency for the whole array or a parallel array of currency codes. Currency
+checks are done once per operation on the whole batch rather than once per
+element.
+
+NumPy is an optional dependency; it is only needed once a MoneyArray is
+created.
+"""
+from decimal import Decimal
+
+from optional import numpy
+
+from money import Money, Currency, CURRENCY, get_default_currency, _to_decimal, _get_currency
+from allocation import allocate_minor_many
+
+__all__ = ('MoneyArray', 'to_minor', 'from_minor')
+
+CODE_DTYPE = 'S3'
+INT64_MAX = 2 ** 63 - 1
+# _multiply_round() estimates products in float64 for integers up to
+# FLOAT_EXACT and denominators below FLOAT_LIMIT, and recomputes exactly the
+# ones within FLOAT_TOLERANCE (relative) of a rounding tie
+FLOAT_EXACT = 2 ** 53
+FLOAT_LIMIT = 10 ** 300
+FLOAT_TOLERANCE = 2e-15
+
+
+def to_minor(amount, currency):
+    """
+    Returns ``amount`` (a Decimal) as an integer number of minor units of
+    ``currency``. Raises ValueError if the amount has more precision than
+    the currency's minor unit.
+    """
+    minor = amount.scaleb(currency.decimals)
+    integral = int(minor)
+    if minor != integral:
+        raise ValueError("%s has more precision than %s allows" % (amount, currency.code))
+    return integral
+
+
+def from_minor(minor, currency):
+    """
+    Returns an integer number of minor units of ``currency`` as a Decimal
+    amount in major units.
+    """
+    return Decimal(int(minor)).scaleb(-currency.decimals)
+
+
+def _rational(value):
+    """
+    Splits a number into an integer (numerator, denominator) pair with a
+    power of ten denominator.
+    """
+    value = _to_decimal(value)
+    sign, digits, exponent = value.as_tuple()
+    numerator = int(''.join(map(str, digits)) or 0)
+    if sign:
+        numerator = -numerator
+    if exponent >= 0:
+        return numerator * 10 ** exponent, 1
+    return numerator, 10 ** -exponent
+
+
+def _rationals(values):
+    """
+    Splits an array of numbers into an integer array of numerators over a
+    common power of ten denominator, as _rational() does for one number.
+    """
+    pairs = [_rational(value) for value in values.tolist()]
+    denominator = max([d for n, d in pairs] or [1])
+    numerators = [n * (denominator // d) for n, d in pairs]
+    if _max_abs(numpy.array(numerators or [0], dtype=object)) <= INT64_MAX:
+        return numpy.array(numerators, dtype=numpy.int64).reshape(values.shape), denominator
+    return numpy.array(numerators, dtype=object).reshape(values.shape), denominator
+
+
+def _divide_round(numerator, denominator):
+    """
+    Divides an integer array by a positive integer, rounding half to even.
+    """
+    if denominator == 1:
+        return numerator
+    quotient, remainder = numpy.divmod(numerator, denominator)
+    twice = remainder * 2
+    up = (twice > denominator) | ((twice == denominator) & (quotient % 2 == 1))
+    return quotient + up
+
+
+def _max_abs(values):
+    if isinstance(values, numpy.ndarray):
+        if not values.size:
+            return 0
+        return max(abs(int(values.max())), abs(int(values.min())))
+    return abs(int(values))
+
+
+def _multiply_round(values, factor, denominator=1):
+    """
+    Returns ``values * factor / denominator`` rounded half to even, for
+    integer arrays or scalars ``values`` and ``factor`` and a positive
+    integer ``denominator``. The product is computed in int64 when it can't
+    overflow. Otherwise it is estimated in float64, and only the elements
+    whose estimate is too close to a rounding tie (or too large) to be
+    rounded safely are recomputed exactly in Python integers. Raises
+    OverflowError if the result doesn't fit in int64.
+    """
+    if (_max_abs(values) * _max_abs(factor) <= INT64_MAX and denominator <= INT64_MAX // 2
+            and getattr(factor, 'dtype', None) != object):
+        return _divide_round(values * factor, denominator)
+    values, factor = numpy.broadcast_arrays(numpy.asarray(values), numpy.asarray(factor))
+    shape = values.shape
+    values, factor = values.ravel(), factor.ravel()
+    result = numpy.zeros(len(values), dtype=numpy.int64)
+    exact = numpy.ones(len(values), dtype=bool)
+    if denominator < FLOAT_LIMIT and _max_abs(values) <= FLOAT_EXACT:
+        with numpy.errstate(all='ignore'):
+            estimate = values.astype(numpy.float64) * (factor.astype(numpy.float64) / float(denominator))
+            floor = numpy.floor(estimate)
+            fraction = estimate - floor
+            # the estimate is within a few ulps of the exact quotient
+            exact = ((numpy.abs(fraction - 0.5) <= numpy.abs(estimate) * FLOAT_TOLERANCE)
+                     | ~(numpy.abs(estimate) < 2.0 ** 62))
+        fast = ~exact
+        result[fast] = floor[fast].astype(numpy.int64) + (fraction[fast] > 0.5)
+    for i in numpy.flatnonzero(exact).tolist():
+        quotient, remainder = divmod(int(values[i]) * int(factor[i]), denominator)
+        if remainder * 2 > denominator or (remainder * 2 == denominator and quotient % 2):
+            quotient += 1
+        if not -INT64_MAX - 1 <= quotient <= INT64_MAX:
+            raise OverflowError("amounts out of the range of int64 minor units")
+        result[i] = quotient
+    return result.reshape(shape)
+
+
+class MoneyArray(object):
+    """
+    A one-dimensional array of monetary amounts.
+
+    ``minor`` is an int64 array of amounts in minor units. ``currency`` is
+    either a single Currency (or code) shared by every element, or a
+    sequence of currency codes of the same length as ``minor``.
+
+    >>> prices = MoneyArray.from_amounts(['9.99', '20.00'], 'USD')
+    >>> prices.sum()
+    USD 29.99
+    """
+    __slots__ = ('minor', 'currency', 'codes')
+
+    def __init__(self, minor, currency=None):
+        if not numpy:
+            raise ImportError("MoneyArray requires numpy")
+        self.minor = numpy.asarray(minor, dtype=numpy.int64)
+        if currency is None or isinstance(currency, (Currency, basestring)):
+            self.currency = _get_currency(currency) if currency else get_default_currency()
+            self.codes = None
+        else:
+            codes = numpy.asarray(currency, dtype=CODE_DTYPE)
+            if codes.shape != self.minor.shape:
+                raise ValueError("currency codes and amounts differ in length")
+            unique, inverse = numpy.unique(codes, return_inverse=True)
+            normalized = [_get_currency(code).code for code in unique.tolist()]
+            if len(unique) == 1:
+                self.currency = _get_currency(normalized[0])
+                self.codes = None
+            else:
+                if normalized != unique.tolist():
+                    # e.g. lower-case codes, stored as the registry's codes
+                    codes = numpy.array(normalized, dtype=CODE_DTYPE)[inverse]
+                self.currency = None
+                self.codes = codes
+
+    @classmethod
+    def _make(cls, minor, currency, codes):
+        self = object.__new__(cls)
+        self.minor = minor
+        self.currency = currency
+        self.codes = codes
+        return self
+
+    @classmethod
+    def from_money(cls, moneys):
+        """
+        Builds a MoneyArray from an iterable of Money values.
+        """
+        minor, codes = [], []
+        for money in moneys:
+            minor.append(to_minor(money.amount, money.currency))
+            codes.append(money.currency.code)
+        return cls(minor, codes)
+
+    @classmethod
+    def from_amounts(cls, amounts, currency=None):
+        """
+        Builds a single-currency MoneyArray from an iterable of amounts in
+        major units (anything Money accepts as an amount).
+        """
+        currency = _get_currency(currency) if currency else get_default_currency()
+        return cls([to_minor(_to_decimal(a), currency) for a in amounts], currency)
+
+    #
+    # Container protocol
+    #
+
+    def __len__(self):
+        return len(self.minor)
+
+    def __iter__(self):
+        for i in xrange(len(self.minor)):
+            yield self[i]
+
+    def __getitem__(self, index):
+        minor = self.minor[index]
+        if isinstance(minor, numpy.ndarray):
+            if self.codes is None:
+                return self._make(minor, self.currency, None)
+            return MoneyArray(minor, self.codes[index])
+        currency = self.currency or CURRENCY[self.codes[index]]
+        return Money._make(from_minor(minor, currency), currency)
+
+    def __repr__(self):
+        return 'MoneyArray(%r)' % (list(self),)
+
+    @property
+    def currencies(self):
+        """
+        The currency code of every element as an array.
+        """
+        if self.codes is None:
+            return numpy.repeat(numpy.array(self.currency.code, dtype=CODE_DTYPE), len(self.minor))
+        return self.codes
+
+    def to_money(self):
+        """
+        Returns the amounts as a list of Money.
+        """
+        return list(self)
+
+    #
+    # Arithmetic
+    #
+
+    def _check_currency(self, other):
+        """
+        Checks that ``other`` (a MoneyArray or Money) has the same currency as
+        this array, element by element, and returns the (currency, codes)
+        pair for the result.
+        """
+        if isinstance(other, Money):
+            if self.currency is not None and self.currency == other.currency:
+                return self.currency, None
+        elif len(other.minor) != len(self.minor):
+            raise ValueError("MoneyArray lengths differ")
+        elif self.currency is not None and other.currency is not None:
+            if self.currency == other.currency:
+                return self.currency, None
+        elif self.codes is not None and other.codes is not None:
+            if self.codes is other.codes or numpy.array_equal(self.codes, other.codes):
+                return None, self.codes
+        raise TypeError('currency mismatch')
+
+    def _scales(self):
+        """
+        Number of minor units per major unit, as a scalar or per element.
+        """
+        if self.codes is None:
+            return 10 ** self.currency.decimals
+        unique, inverse = numpy.unique(self.codes, return_inverse=True)
+        scales = numpy.array([10 ** CURRENCY[c].decimals for c in unique], dtype=numpy.int64)
+        return scales[inverse]
+
+    def _coerce_scalar(self, other):
+        """
+        Returns a plain number as minor units of every element, which is how
+        Money treats numbers added to it: as amounts in major units.
+        """
+        numerator, denominator = _rational(other)
+        return _multiply_round(numpy.asarray(self._scales(), dtype=numpy.int64), numerator, denominator)
+
+    def __add__(self, other):
+        if isinstance(other, (MoneyArray, Money)):
+            currency, codes = self._check_currency(other)
+            if isinstance(other, Money):
+                return self._make(self.minor + to_minor(other.amount, other.currency), currency, codes)
+            return self._make(self.minor + other.minor, currency, codes)
+        return self._make(self.minor + self._coerce_scalar(other), self.currency, self.codes)
+
+    def __sub__(self, other):
+        if isinstance(other, (MoneyArray, Money)):
+            currency, codes = self._check_currency(other)
+            if isinstance(other, Money):
+                return self._make(self.minor - to_minor(other.amount, other.currency), currency, codes)
+            return self._make(self.minor - other.minor, currency, codes)
+        return self._make(self.minor - self._coerce_scalar(other), self.currency, self.codes)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __neg__(self):
+        return self._make(-self.minor, self.currency, self.codes)
+
+    def __pos__(self):
+        return self
+
+    def __mul__(self, other):
+        if isinstance(other, (MoneyArray, Money)):
+            raise TypeError('can not multiply monetary quantities')
+        if isinstance(other, numpy.ndarray):
+            if other.dtype.kind in 'iub':
+                return self._make(_multiply_round(self.minor, other), self.currency, self.codes)
+            numerators, denominator = _rationals(other)
+            return self._make(_multiply_round(self.minor, numerators, denominator), self.currency, self.codes)
+        numerator, denominator = _rational(other)
+        return self._make(_multiply_round(self.minor, numerator, denominator), self.currency, self.codes)
+
+    def __rmod__(self, other):
+        """
+        Calculates a percentage of every amount, rounded half to even to the
+        minor unit. E.g. ``5 % prices``.
+        """
+        if isinstance(other, (MoneyArray, Money)):
+            raise TypeError('invalid monetary operation')
+        numerator, denominator = _rational(other)
+        return self._make(_multiply_round(self.minor, numerator, denominator * 100), self.currency, self.codes)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    #
+    # Comparisons, elementwise, returning boolean arrays
+    #
+
+    def _other_minor(self, other):
+        if isinstance(other, Money):
+            return to_minor(other.amount, other.currency)
+        return other.minor
+
+    def __eq__(self, other):
+        if isinstance(other, (MoneyArray, Money)):
+            if isinstance(other, Money):
+                other_codes = other.currency.code
+            elif other.codes is None:
+                other_codes = other.currency.code
+            else:
+                other_codes = other.codes
+            equal = self.minor == self._other_minor(other)
+            if self.codes is None and isinstance(other_codes, str):
+                if self.currency.code == other_codes:
+                    return equal
+                return numpy.zeros(len(self.minor), dtype=bool)
+            return equal & (self.currencies == other_codes)
+        if isinstance(other, numpy.ndarray):
+            return (self.minor == 0) & (other == 0)
+        if other == 0:
+            return self.minor == 0
+        return numpy.zeros(len(self.minor), dtype=bool)
+
+    def __ne__(self, other):
+        return ~self.__eq__(other)
+
+    def __lt__(self, other):
+        self._check_currency(other)
+        return self.minor < self._other_minor(other)
+
+    def __le__(self, other):
+        self._check_currency(other)
+        return self.minor <= self._other_minor(other)
+
+    def __gt__(self, other):
+        self._check_currency(other)
+        return self.minor > self._other_minor(other)
+
+    def __ge__(self, other):
+        self._check_currency(other)
+        return self.minor >= self._other_minor(other)
+
+    __hash__ = None
+
+    #
+    # Reductions
+    #
+
+    def sum(self):
+        """
+        Returns the total as Money. All elements must share one currency.
+        """
+        if self.currency is None:
+            raise TypeError('can not sum different currencies')
+        return Money._make(from_minor(self.minor.sum(), self.currency), self.currency)
+
+    def allocate(self, ratios):
+        """
+        Allocates every amount to several accounts in proportion to the same
+        ``ratios``. Returns one MoneyArray per ratio; for every element the
+        parts add up exactly to the original amount.
+        """
+        parts = allocate_minor_many(self.minor, ratios)
+        return [self._make(numpy.ascontiguousarray(parts[:, i]), self.currency, self.codes)
+                for i in xrange(parts.shape[1])]
+
+    def cumsum(self):
+        """
+        Returns the running totals as a MoneyArray.
+        """
+        if self.currency is None:
+            raise TypeError('can not sum different currencies')
+        return self._make(numpy.cumsum(self.minor), self.currency, None)
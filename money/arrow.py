@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Conversion between MoneyArray and Apache Arrow, and Parquet files.
+
+In Arrow a column of amounts is a struct array of
+
+* ``amount``: decimal128(38, scale), where the scale is by default the
+  largest number of decimals among the currencies of the column;
+* ``currency``: the currency codes, dictionary-encoded with int16 indexes.
+
+Parquet files can't hold that struct, so they store the two fields as
+top-level ``amount`` and ``currency`` columns instead.
+
+The currency indexes are passed to and from Arrow without copying. Decimal
+amounts are 128-bit in Arrow and int64 minor units in a MoneyArray, so
+converting them takes one vectorized pass; reading them back is a view of
+the Arrow buffer whenever every currency uses the column's scale.
+pyarrow is an optional dependency.
+"""
+from money import CURRENCY, _get_currency
+from arrays import MoneyArray, numpy, CODE_DTYPE, INT64_MAX
+from optional import pyarrow, parquet
+
+__all__ = ('to_arrow', 'to_table', 'from_arrow', 'write_parquet', 'read_parquet')
+
+PRECISION = 38
+# amounts are scaled in int64, which holds 10 ** 18
+MAX_SCALE = 18
+
+
+def _decimal_array(values, scale):
+    """
+    Builds a decimal128 Arrow array from int64 ``values`` scaled by
+    10 ** scale, writing the 128-bit two's complement words directly.
+    """
+    words = numpy.empty((len(values), 2), dtype='<i8')
+    words[:, 0] = values
+    words[:, 1] = values >> 63
+    return pyarrow.Array.from_buffers(pyarrow.decimal128(PRECISION, scale), len(values),
+                                      [None, pyarrow.py_buffer(words)])
+
+
+def _columns(moneys, scale):
+    """
+    Returns the amount and currency Arrow arrays of ``moneys``.
+    """
+    if not isinstance(moneys, MoneyArray):
+        moneys = MoneyArray.from_money(moneys)
+    if moneys.codes is None:
+        codes = [moneys.currency.code]
+        indexes = numpy.zeros(len(moneys), dtype=numpy.int16)
+    else:
+        codes, indexes = numpy.unique(moneys.codes, return_inverse=True)
+        indexes = indexes.astype(numpy.int16)
+    decimals = numpy.array([CURRENCY[code].decimals for code in codes], dtype=numpy.int64)
+    if scale is None:
+        scale = int(decimals.max()) if len(decimals) else 0
+    if (decimals > scale).any():
+        raise ValueError("scale %d is too small for the currencies %s" % (scale, ', '.join(codes)))
+    if scale > MAX_SCALE:
+        raise ValueError("scale %d is larger than the maximum of %d" % (scale, MAX_SCALE))
+    factors = 10 ** (scale - decimals)
+    if (factors == 1).all():
+        values = moneys.minor
+    else:
+        limits = (INT64_MAX // factors)[indexes]
+        if ((moneys.minor > limits) | (moneys.minor < -limits)).any():
+            raise OverflowError("amounts too large to scale to %d decimals" % scale)
+        values = moneys.minor * factors[indexes]
+    currency = pyarrow.DictionaryArray.from_arrays(
+        pyarrow.array(indexes), pyarrow.array([str(code) for code in codes], type=pyarrow.string()))
+    return _decimal_array(values, scale), currency
+
+
+def to_arrow(moneys, scale=None):
+    """
+    Converts a MoneyArray or an iterable of Money to an Arrow struct array
+    with ``amount`` and ``currency`` fields. ``scale`` is the number of
+    decimals of the amounts and must be at least the decimals of every
+    currency in ``moneys``.
+    """
+    amount, currency = _columns(moneys, scale)
+    return pyarrow.StructArray.from_arrays([amount, currency], ['amount', 'currency'])
+
+
+def to_table(moneys, scale=None):
+    """
+    Converts a MoneyArray or an iterable of Money to an Arrow table with
+    ``amount`` and ``currency`` columns.
+    """
+    amount, currency = _columns(moneys, scale)
+    return pyarrow.Table.from_arrays([amount, currency], ['amount', 'currency'])
+
+
+def _from_arrays(amount, currency):
+    """
+    Builds a MoneyArray from a decimal128 amount array and a currency code
+    array, dictionary-encoded or not.
+    """
+    if amount.null_count or currency.null_count:
+        raise ValueError("null amounts or currencies can't be converted to Money")
+    if not isinstance(currency, pyarrow.DictionaryArray):
+        currency = currency.dictionary_encode()
+    codes = [str(code) for code in currency.dictionary.to_pylist()]
+    indexes = currency.indices.to_numpy()
+
+    scale = amount.type.scale
+    words = numpy.frombuffer(amount.buffers()[1], dtype='<i8').reshape(-1, 2)
+    words = words[amount.offset:amount.offset + len(amount)]
+    minor = words[:, 0]
+    if (words[:, 1] != minor >> 63).any():
+        raise ValueError("amount too large for a MoneyArray")
+    decimals = numpy.array([_get_currency(code).decimals for code in codes], dtype=numpy.int64)
+    if len(codes) and (decimals != scale).any():
+        if numpy.abs(scale - decimals).max() > MAX_SCALE:
+            raise ValueError("scale %d is too far from the decimals of the currencies %s"
+                             % (scale, ', '.join(codes)))
+        factors = (10 ** numpy.abs(scale - decimals))[indexes]
+        down = (decimals < scale)[indexes]
+        remainders = numpy.where(down, minor % factors, 0)
+        if remainders.any():
+            raise ValueError("amounts have more decimals than their currency allows")
+        limits = INT64_MAX // factors
+        if (~down & ((minor > limits) | (minor < -limits))).any():
+            raise OverflowError("amounts too large to scale to the decimals of their currency")
+        minor = numpy.where(down, minor // factors, minor * factors)
+    if len(codes) == 1:
+        return MoneyArray._make(minor, _get_currency(codes[0]), None)
+    return MoneyArray(minor, numpy.array(codes, dtype=CODE_DTYPE)[indexes])
+
+
+def from_arrow(data):
+    """
+    Converts an Arrow struct array (or chunked array) as written by
+    to_arrow(), or a table with ``amount`` and ``currency`` columns, to a
+    MoneyArray. The amounts must fit the minor unit of their currency.
+    """
+    if isinstance(data, pyarrow.Table):
+        chunks = zip(data.column('amount').chunks, data.column('currency').chunks)
+    else:
+        chunks = data.chunks if isinstance(data, pyarrow.ChunkedArray) else [data]
+        chunks = [(chunk.field('amount'), chunk.field('currency')) for chunk in chunks]
+    arrays = [_from_arrays(amount, currency) for amount, currency in chunks]
+    if len(arrays) == 1:
+        return arrays[0]
+    if not arrays:
+        return MoneyArray([])
+    return MoneyArray(numpy.concatenate([array.minor for array in arrays]),
+                      numpy.concatenate([array.currencies for array in arrays]))
+
+
+def write_parquet(path, moneys, scale=None, **kwargs):
+    """
+    Writes a MoneyArray or an iterable of Money to the Parquet file
+    ``path``, as ``amount`` and ``currency`` columns. Other keyword
+    arguments are passed to pyarrow.parquet.write_table().
+    """
+    parquet.write_table(to_table(moneys, scale), path, **kwargs)
+
+
+def read_parquet(path):
+    """
+    Reads the ``amount`` and ``currency`` columns of the Parquet file
+    ``path`` into a MoneyArray. The currency codes are read
+    dictionary-encoded rather than as one string per row.
+    """
+    return from_arrow(parquet.read_table(path, columns=['amount', 'currency'],
+                                         read_dictionary=['currency']))
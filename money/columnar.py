@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+A compact binary columnar file format for large collections of amounts.
+
+A file holds, in this order:
+
+* a 32-byte header: the magic string, a format version, the number of
+  currencies and the number of rows;
+* the amounts as a little-endian int64 column of minor units;
+* the currencies as a little-endian uint16 column of indexes into the
+  currency table;
+* the currency table: for every currency its three-byte ASCII code and
+  one byte with the number of decimals its minor units were written with.
+
+Storing the decimals keeps a file readable after a currency's decimals
+change in the registry: amounts are rescaled to the current decimals when
+they are read.
+
+ColumnarWriter streams MoneyArray batches (for instance from
+money.io.read_batches) to a file. ColumnarFile memory-maps a file and
+exposes both columns as read-only NumPy views of the mapping, so opening a
+file costs the same whatever its size and totals are computed without
+creating any Money objects.
+"""
+import mmap
+import shutil
+import struct
+import tempfile
+
+from decimal import Decimal
+
+from money import Money, _get_currency
+from arrays import MoneyArray, numpy, CODE_DTYPE, _multiply_round
+
+__all__ = ('ColumnarWriter', 'ColumnarFile', 'write_columns')
+
+MAGIC = 'PYMONEY\0'
+VERSION = 2
+# bytes per currency in the currency table: code and decimals
+CURRENCY_SIZE = 4
+# magic, version, reserved, number of currencies, number of rows
+HEADER = struct.Struct('<8sHHIQ')
+HEADER_SIZE = 32
+MINOR_DTYPE = '<i8'
+INDEX_DTYPE = '<u2'
+MAX_CURRENCIES = 65535
+
+
+class ColumnarWriter(object):
+    """
+    Writes a columnar file. Amounts are appended with write() in as many
+    batches as needed; the file is complete once close() is called.
+
+    >>> with ColumnarWriter('ledger.money') as writer:
+    ...     for batch in read_batches('ledger.csv'):
+    ...         writer.write(batch)
+    """
+
+    def __init__(self, path):
+        if not numpy:
+            raise ImportError("the columnar format requires numpy")
+        self.path = path
+        self.rows = 0
+        self.codes = []
+        self.decimals = []
+        self._indexes = {}
+        self._file = open(path, 'wb')
+        self._file.write('\0' * HEADER_SIZE)
+        # the currency column follows the complete amount column, so it is
+        # spooled to a temporary file until close()
+        self._spool = tempfile.TemporaryFile()
+
+    def _index(self, code):
+        try:
+            return self._indexes[code]
+        except KeyError:
+            if len(self.codes) == MAX_CURRENCIES:
+                raise ValueError("too many currencies for the columnar format")
+            decimals = _get_currency(code).decimals
+            index = self._indexes[code] = len(self.codes)
+            self.codes.append(code)
+            self.decimals.append(decimals)
+            return index
+
+    def write(self, moneys):
+        """
+        Appends a MoneyArray, or an iterable of Money, to the file.
+        """
+        if not isinstance(moneys, MoneyArray):
+            moneys = MoneyArray.from_money(moneys)
+        if moneys.codes is None:
+            indexes = numpy.empty(len(moneys), dtype=INDEX_DTYPE)
+            indexes.fill(self._index(moneys.currency.code))
+        else:
+            unique, inverse = numpy.unique(moneys.codes, return_inverse=True)
+            table = numpy.array([self._index(code) for code in unique], dtype=INDEX_DTYPE)
+            indexes = table[inverse]
+        self._file.write(numpy.asarray(moneys.minor, dtype=MINOR_DTYPE).tostring())
+        self._spool.write(indexes.tostring())
+        self.rows += len(moneys)
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._spool.seek(0)
+        shutil.copyfileobj(self._spool, self._file)
+        self._spool.close()
+        self._file.write(''.join([code + chr(decimals) for code, decimals in zip(self.codes, self.decimals)]))
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0, len(self.codes), self.rows))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_columns(path, moneys):
+    """
+    Writes a MoneyArray, an iterable of Money or an iterable of MoneyArray
+    batches to a new columnar file at ``path``.
+    """
+    with ColumnarWriter(path) as writer:
+        if isinstance(moneys, MoneyArray):
+            writer.write(moneys)
+            return
+        batch = []
+        for item in moneys:
+            if isinstance(item, MoneyArray):
+                writer.write(item)
+            else:
+                batch.append(item)
+        if batch:
+            writer.write(batch)
+
+
+def _sum_by_index(values, indexes, count):
+    """
+    Returns the exact sums of the int64 ``values`` grouped by ``indexes``
+    (0 <= index < count) as Python integers. The values are split into
+    21-bit parts that numpy.bincount sums exactly in float64, so the
+    totals take one pass and can't overflow.
+    """
+    values = numpy.asarray(values, dtype=numpy.int64)
+    low = values & 0x1fffff
+    middle = (values >> 21) & 0x1fffff
+    high = values >> 42
+    sums = [numpy.bincount(indexes, weights=part, minlength=count) for part in (low, middle, high)]
+    return [int(l) + (int(m) << 21) + (int(h) << 42) for l, m, h in zip(*sums)]
+
+
+class ColumnarFile(object):
+    """
+    A memory-mapped columnar file. ``minor`` and ``indexes`` are read-only
+    NumPy views of the two columns, ``codes`` is the currency table that
+    ``indexes`` refers to and ``decimals`` the number of decimals of the
+    minor units of each currency in the file; nothing is read from disk
+    until it is used.
+
+    >>> with ColumnarFile('ledger.money') as ledger:
+    ...     totals = ledger.sum_by_currency()
+    """
+
+    def __init__(self, path):
+        if not numpy:
+            raise ImportError("the columnar format requires numpy")
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._open()
+
+    def _open(self):
+        if len(self._map) < HEADER_SIZE:
+            raise ValueError("%s is not a columnar money file" % self.path)
+        magic, version, reserved, count, rows = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError("%s is not a columnar money file" % self.path)
+        if version != VERSION:
+            raise ValueError("unsupported columnar format version %d" % version)
+        size = CURRENCY_SIZE
+        index_offset = HEADER_SIZE + rows * 8
+        codes_offset = index_offset + rows * 2
+        if len(self._map) != codes_offset + count * size:
+            raise ValueError("%s is truncated" % self.path)
+        self.minor = numpy.frombuffer(self._map, dtype=MINOR_DTYPE, count=rows, offset=HEADER_SIZE)
+        self.indexes = numpy.frombuffer(self._map, dtype=INDEX_DTYPE, count=rows, offset=index_offset)
+        table = [self._map[i:i + size] for i in xrange(codes_offset, codes_offset + count * size, size)]
+        self.codes = [entry[:3] for entry in table]
+        self.currencies = [_get_currency(code) for code in self.codes]
+        self.decimals = [ord(entry[3]) for entry in table]
+
+    def __len__(self):
+        return len(self.minor)
+
+    def __getitem__(self, index):
+        """
+        Returns one amount as Money, or a slice of the file as a MoneyArray
+        (see to_array()).
+        """
+        if isinstance(index, slice):
+            return self.to_array(index)
+        i = self.indexes[index]
+        return Money._make(Decimal(int(self.minor[index])).scaleb(-self.decimals[i]), self.currencies[i])
+
+    def _rescale(self, minor, indexes):
+        """
+        Converts minor units written with the file's decimals to the
+        current decimals of their currencies.
+        """
+        rescaled = None
+        for i, (currency, decimals) in enumerate(zip(self.currencies, self.decimals)):
+            if currency.decimals == decimals:
+                continue
+            if rescaled is None:
+                minor = rescaled = minor.copy()
+            rows = indexes == i
+            if currency.decimals > decimals:
+                minor[rows] = _multiply_round(minor[rows], 10 ** (currency.decimals - decimals))
+            else:
+                values, remainders = numpy.divmod(minor[rows], 10 ** (decimals - currency.decimals))
+                if remainders.any():
+                    raise ValueError("amounts in %s have more precision than it now allows" % currency.code)
+                minor[rows] = values
+        return minor
+
+    def to_array(self, index=slice(None)):
+        """
+        Returns the rows selected by ``index`` (a slice, by default all
+        rows) as a MoneyArray. The amounts of a slice are a view of the
+        file, not a copy, unless they have to be rescaled to the current
+        decimals of their currency.
+        """
+        minor = self._rescale(self.minor[index], self.indexes[index])
+        indexes = self.indexes[index]
+        if len(self.codes) == 1:
+            return MoneyArray._make(minor, self.currencies[0], None)
+        codes = numpy.array(self.codes, dtype=CODE_DTYPE)[indexes]
+        return MoneyArray(minor, codes)
+
+    def sum_by_currency(self):
+        """
+        Returns a dict mapping currency code to the total of that currency,
+        computed exactly in a single pass over the mapped columns.
+        """
+        totals = _sum_by_index(self.minor, self.indexes, len(self.codes))
+        result = {}
+        for currency, decimals, total in zip(self.currencies, self.decimals, totals):
+            result[currency.code] = Money._make(Decimal(total).scaleb(-decimals), currency)
+        return result
+
+    def close(self):
+        """
+        Drops the file's references to the mapping. The mapping itself is
+        released once the last array viewing it is gone, so arrays taken
+        from the file stay valid.
+        """
+        self.minor = self.indexes = self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
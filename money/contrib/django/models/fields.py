@@ -1,10 +1,14 @@
-from django.db import models
-from django.utils.encoding import smart_unicode
+from decimal import Decimal
+
+from django.db import models, connections, transaction
+from django.db.backends.util import truncate_name
+from django.db.models.signals import post_syncdb
 from django.utils.translation import ugettext_lazy as _
 from money.contrib.django import forms
 from money import Money
+from money.money import _get_currency
 
-__all__ = ('MoneyField', 'currency_field_name', 'NotSupportedLookup')
+__all__ = ('MoneyField', 'currency_field_name', 'NotSupportedLookup', 'sql_money_indexes')
 
 currency_field_name = lambda name: "%s_currency" % name
 
@@ -24,30 +28,49 @@ class MoneyFieldProxy(object):
     of callig to_python() on our MoneyField class, it stores the two
     different parts separately, and updates them whenever something is assigned.
     If the attribute is read, it builds the instance "on-demand" with the
-    current data.
+    current data. Currencies are looked up once per code and proxy, and
+    decimals loaded from the database are stored as they are, so loading
+    many rows costs little more than with a plain DecimalField.
     (see: http://blog.elsdoerfer.name/2008/01/08/fuzzydates-or-one-django-model-field-multiple-database-columns/)
     """
     def __init__(self, field):
         self.field = field
+        self.name = field.name
         self.currency_field_name = currency_field_name(self.field.name)
+        # currency code as stored on the model -> Currency
+        self._currencies = {}
+
+    def _currency(self, code):
+        try:
+            return self._currencies[code]
+        except KeyError:
+            if not code:
+                # Money falls back to the default currency
+                return None
+            currency = self._currencies[code] = _get_currency(code)
+            return currency
 
     def _money_from_obj(self, obj):
-        return Money(obj.__dict__[self.field.name], obj.__dict__[self.currency_field_name])
+        return Money(obj.__dict__[self.name], self._currency(obj.__dict__[self.currency_field_name]))
 
     def __get__(self, obj, type=None):
         if obj is None:
             raise AttributeError('Can only be accessed via an instance.')
-        if not isinstance(obj.__dict__[self.field.name], Money):
-            obj.__dict__[self.field.name] = self._money_from_obj(obj)
-        return obj.__dict__[self.field.name]
+        value = obj.__dict__[self.name]
+        if not isinstance(value, Money):
+            value = obj.__dict__[self.name] = self._money_from_obj(obj)
+        return value
 
     def __set__(self, obj, value):
         if isinstance(value, Money):
-            obj.__dict__[self.field.name] = value.amount
-            setattr(obj, self.currency_field_name, smart_unicode(value.currency))
+            obj.__dict__[self.name] = value.amount
+            obj.__dict__[self.currency_field_name] = value.currency.code
+        elif isinstance(value, Decimal):
+            # values loaded from the database
+            obj.__dict__[self.name] = value
         else:
             if value: value = str(value)
-            obj.__dict__[self.field.name] = self.field.to_python(value)
+            obj.__dict__[self.name] = self.field.to_python(value)
 
 
 class CurrencyField(models.CharField):
@@ -67,6 +90,13 @@ class CurrencyField(models.CharField):
 
 
 class MoneyField(models.DecimalField):
+    """
+    A Money amount stored as a decimal column and a currency column.
+
+    With ``currency_index=True`` syncdb creates a composite index on
+    (currency, amount), which lookups against Money values such as
+    ``price__gte=Money(100, 'USD')`` can use.
+    """
     description = _('An amount and type of currency')
 
     # Don't extend SubfieldBase since we need to have access to both fields when
@@ -75,7 +105,8 @@ class MoneyField(models.DecimalField):
 
     def __init__(self, verbose_name=None, name=None,
                  max_digits=None, decimal_places=None,
-                 default=None, default_currency=None, blank=True, **kwargs):
+                 default=None, default_currency=None, blank=True, currency_index=False, **kwargs):
+        self.currency_index = currency_index
         # We add the currency field except when using frozen south orm. See introspection rules below.
         self.add_currency_field = not kwargs.pop('no_currency_field', False)
         if isinstance(default, Money):
@@ -148,6 +179,80 @@ class MoneyField(models.DecimalField):
         return super(MoneyField, self).formfield(**defaults)
 
 
+def _money_indexes(model, connection):
+    qn = connection.ops.quote_name
+    table = model._meta.db_table
+    for field in model._meta.local_fields:
+        if not (isinstance(field, MoneyField) and field.currency_index and field.add_currency_field):
+            continue
+        currency = model._meta.get_field(currency_field_name(field.name))
+        name = truncate_name('%s_%s_money' % (table, field.column), connection.ops.max_name_length())
+        yield name, 'CREATE INDEX %s ON %s (%s, %s);' % (
+            qn(name), qn(table), qn(currency.column), qn(field.column))
+
+
+def sql_money_indexes(model, connection):
+    """
+    Returns the CREATE INDEX statements of the composite (currency, amount)
+    indexes of the MoneyFields of ``model`` with ``currency_index``.
+    Django versions without composite index support don't create these
+    themselves, so they are created by the post_syncdb handler below.
+    """
+    return [sql for name, sql in _money_indexes(model, connection)]
+
+
+# queries listing the names of the indexes of a table, by database vendor;
+# the introspection of Django 1.3 only reports single-column indexes
+INDEX_NAME_QUERIES = {
+    'sqlite': ('PRAGMA index_list(%s)', 1),
+    'postgresql': ('SELECT indexname FROM pg_indexes WHERE tablename = %s', 0),
+    'mysql': ('SHOW INDEX FROM %s', 2),
+    'oracle': ('SELECT index_name FROM user_indexes WHERE table_name = UPPER(%s)', 0),
+}
+
+
+def _index_names(cursor, connection, table):
+    """
+    Returns the lower-cased names of the indexes of ``table``, or None if
+    they can't be listed on this database.
+    """
+    try:
+        sql, column = INDEX_NAME_QUERIES[connection.vendor]
+    except KeyError:
+        return None
+    if connection.vendor in ('sqlite', 'mysql'):
+        cursor.execute(sql % connection.ops.quote_name(table))
+    else:
+        cursor.execute(sql, [table])
+    return set(row[column].lower() for row in cursor.fetchall())
+
+
+def create_money_indexes(sender, created_models, verbosity=1, db=None, **kwargs):
+    """
+    post_syncdb handler creating the currency indexes of the tables syncdb
+    has just created for the application ``sender``. Indexes that already
+    exist, e.g. when flush sends post_syncdb again, are left alone.
+    """
+    connection = connections[db or 'default']
+    cursor = connection.cursor()
+    for model in models.get_models(sender):
+        if model not in created_models:
+            continue
+        indexes = list(_money_indexes(model, connection))
+        if not indexes:
+            continue
+        existing = _index_names(cursor, connection, model._meta.db_table)
+        for name, sql in indexes:
+            if existing is not None and name.lower() in existing:
+                continue
+            if verbosity >= 2:
+                print "Installing currency index for %s.%s model" % (model._meta.app_label, model._meta.object_name)
+            cursor.execute(sql)
+        transaction.commit_unless_managed(using=connection.alias)
+
+post_syncdb.connect(create_money_indexes)
+
+
 # South introspection rules
 # (see http://south.aeracode.org/docs/customfields.html#extending-introspection)
 try:
@@ -164,7 +269,8 @@ try:
         rules=[
             (   (MoneyField,),
                 [],
-                {'no_currency_field': ('add_currency_field', {})}
+                {'no_currency_field': ('add_currency_field', {}),
+                 'currency_index': ('currency_index', {'default': False})}
             )
         ]
     )
@@ -1,85 +1,256 @@
-from django.db import models
+from decimal import Decimal
+
+from django.db import models, connections, transaction
+from django.db.models.fields import FieldDoesNotExist
+from django.db.models import Q, Sum, Avg, Min, Max, Count
 from django.db.models.query import QuerySet
-from django.utils.encoding import smart_unicode
+from django.db.models.sql.constants import LOOKUP_SEP, QUERY_TERMS
+from money import Money
+from money.money import _get_currency, _to_decimal
 from fields import currency_field_name
 
 __all__ = ('QuerysetWithMoney', 'MoneyManager',)
 
 
-class QuerysetWithMoney(QuerySet):
-    
-    def _update_params(self, kwargs):
-        from django.db.models.sql.constants import LOOKUP_SEP
-        from money import Money
-        to_append = {}
-        for name, value in kwargs.items():
-            if isinstance(value, Money):
-                path = name.split(LOOKUP_SEP)
-                if len(path) > 1:
-                    field_name = currency_field_name(path[0])
-                else:
-                    field_name = currency_field_name(name)
-                to_append[field_name] = smart_unicode(value.currency)
-        kwargs.update(to_append)
-        return kwargs
-        
-    def dates(self, *args, **kwargs):
-        kwargs = self._update_params(kwargs)
-        return super(QuerysetWithMoney, self).dates(*args, **kwargs)
+def _currency_lookup(name):
+    """
+    Returns the lookup of the currency column that goes with the MoneyField
+    lookup ``name``, e.g. 'order__price_currency' for 'order__price__gt'.
+    """
+    path = name.split(LOOKUP_SEP)
+    if len(path) > 1 and path[-1] in QUERY_TERMS:
+        path.pop()
+    path[-1] = currency_field_name(path[-1])
+    return LOOKUP_SEP.join(path)
+
 
-    def distinct(self, *args, **kwargs):
-        kwargs = self._update_params(kwargs)
-        return super(QuerysetWithMoney, self).distinct(*args, **kwargs)
+def _money_children(children, inline):
+    """
+    Rewrites the children of a Q node so that every lookup against a Money
+    value is preceded by an exact lookup on its currency column. In an AND
+    node both lookups are added to the node itself, otherwise they are
+    grouped in a new AND node.
+    """
+    result = []
+    for child in children:
+        if isinstance(child, Q):
+            result.append(_money_q(child))
+            continue
+        name, value = child
+        if not isinstance(value, Money):
+            result.append(child)
+            continue
+        currency = (_currency_lookup(name), value.currency.code)
+        if inline:
+            result.extend((currency, child))
+        else:
+            result.append(Q(currency, child))
+    return result
 
-    def extra(self, *args, **kwargs):
-        kwargs = self._update_params(kwargs)
-        return super(QuerysetWithMoney, self).extra(*args, **kwargs)
 
-    def get(self, *args, **kwargs):
-        kwargs = self._update_params(kwargs)
-        return super(QuerysetWithMoney, self).get(*args, **kwargs)
+def _money_q(q):
+    clone = Q()
+    clone.connector = q.connector
+    clone.negated = q.negated
+    clone.children = _money_children(q.children, q.connector == Q.AND)
+    return clone
 
-    def get_or_create(self, **kwargs):
-        kwargs = self._update_params(kwargs)
-        return super(QuerysetWithMoney, self).get_or_create(**kwargs)
 
-    def filter(self, *args, **kwargs):
-        kwargs = self._update_params(kwargs)
-        return super(QuerysetWithMoney, self).filter(*args, **kwargs)
+# the most parameters and rows a single INSERT may have, by database vendor;
+# SQLite is built with a limit of 999 parameters and 500 compound SELECTs
+MAX_INSERT_PARAMS = {'sqlite': 999}
+MAX_INSERT_ROWS = {'sqlite': 500}
+DEFAULT_MAX_INSERT_PARAMS = 65535
 
-    def complex_filter(self, *args, **kwargs):
-        kwargs = self._update_params(kwargs)
-        return super(QuerysetWithMoney, self).complex_filter(*args, **kwargs)
 
-    def exclude(self, *args, **kwargs):
-        kwargs = self._update_params(kwargs)
-        return super(QuerysetWithMoney, self).exclude(*args, **kwargs)
+def _batches(objs, batch_size):
+    batch_size = batch_size or len(objs)
+    for i in xrange(0, len(objs), batch_size):
+        yield objs[i:i + batch_size]
 
-    def in_bulk(self, *args, **kwargs):
-        kwargs = self._update_params(kwargs)
-        return super(QuerysetWithMoney, self).in_bulk(*args, **kwargs)
 
-    def iterator(self, *args, **kwargs):
-        kwargs = self._update_params(kwargs)
-        return super(QuerysetWithMoney, self).iterator(*args, **kwargs)
+def _max_insert_rows(fields, connection):
+    params = MAX_INSERT_PARAMS.get(connection.vendor, DEFAULT_MAX_INSERT_PARAMS)
+    rows = max(1, params // max(1, len(fields)))
+    return min(rows, MAX_INSERT_ROWS.get(connection.vendor, rows))
 
-    def latest(self, *args, **kwargs):
-        kwargs = self._update_params(kwargs)
-        return super(QuerysetWithMoney, self).latest(*args, **kwargs)
 
-    def order_by(self, *args, **kwargs):
-        kwargs = self._update_params(kwargs)
-        return super(QuerysetWithMoney, self).order_by(*args, **kwargs)
+def _insert_sql(model, fields, rows, connection):
+    """
+    Returns an INSERT statement for ``rows`` rows of ``fields`` at once.
+    """
+    qn = connection.ops.quote_name
+    placeholders = ', '.join(['%s'] * len(fields))
+    if connection.vendor == 'oracle':
+        values = ' UNION ALL '.join(['SELECT %s FROM DUAL' % placeholders] * rows)
+    else:
+        values = 'VALUES ' + ', '.join(['(%s)' % placeholders] * rows)
+    return 'INSERT INTO %s (%s) %s' % (
+        qn(model._meta.db_table), ', '.join([qn(f.column) for f in fields]), values)
+
+
+def _exponent(model, name):
+    """
+    Returns the quantum of the DecimalField ``name`` of ``model``, following
+    relations as in a lookup, or None if the field can't be resolved.
+    """
+    path = name.split(LOOKUP_SEP)
+    try:
+        for part in path[:-1]:
+            model = model._meta.get_field(part).rel.to
+        field = model._meta.get_field(path[-1])
+    except (FieldDoesNotExist, AttributeError):
+        return None
+    places = getattr(field, 'decimal_places', None)
+    if places is None:
+        return None
+    return Decimal(1).scaleb(-places)
+
+
+class QuerysetWithMoney(QuerySet):
+    """
+    A QuerySet that adds the currency to lookups against Money values:
+    ``filter(price__gt=Money(10, 'USD'))`` is the same as
+    ``filter(price_currency='USD', price__gt=10)``. This works for keyword
+    arguments and Q objects alike, in filter(), exclude(), get(),
+    get_or_create() and complex_filter().
+    """
+
+    def _filter_or_exclude(self, negate, *args, **kwargs):
+        args = _money_children(args + tuple(kwargs.items()), True)
+        return super(QuerysetWithMoney, self)._filter_or_exclude(negate, *args)
 
-    def select_related(self, *args, **kwargs):
-        kwargs = self._update_params(kwargs)
-        return super(QuerysetWithMoney, self).select_related(*args, **kwargs)
+    def complex_filter(self, filter_obj):
+        if isinstance(filter_obj, Q):
+            filter_obj = _money_q(filter_obj)
+        return super(QuerysetWithMoney, self).complex_filter(filter_obj)
 
-    def values(self, *args, **kwargs):
-        kwargs = self._update_params(kwargs)
-        return super(QuerysetWithMoney, self).values(*args, **kwargs)
+    def aggregate_by_currency(self, field_name, function=Sum, currency=None, rates=None):
+        """
+        Aggregates the MoneyField ``field_name`` with ``function`` (Sum, Avg,
+        Min or Max) in a single query grouped by currency, and returns a
+        dict mapping currency code to Money.
+
+        With ``currency``, the per-currency results are converted to that
+        currency (with ``rates``, see Money.convert_to()) and combined into
+        a single Money, or None if there are no rows. Averages are weighted
+        by the number of rows in each currency.
+
+        >>> Thing.objects.aggregate_by_currency('price')
+        {'EUR': EUR 120.00, 'USD': USD 310.50}
+        >>> Thing.objects.filter(sold=True).aggregate_by_currency('price', Max, 'USD', rates)
+        USD 99.00
+        """
+        if function not in (Sum, Avg, Min, Max):
+            raise ValueError("unsupported aggregate %r" % function)
+        currency_name = _currency_lookup(field_name)
+        if function is Avg:
+            # averages are computed here from exact totals and counts, which
+            # also weights them correctly when currencies are combined
+            aggregates = {'value': Sum(field_name), 'count': Count(field_name)}
+        else:
+            aggregates = {'value': function(field_name)}
+        rows = self.order_by().values(currency_name).annotate(**aggregates)
+        exponent = _exponent(self.model, field_name)
+
+        results = {}
+        counts = {}
+        for row in rows:
+            value = row['value']
+            if value is None:
+                continue
+            # some backends return floats, e.g. SQLite for sums of decimals
+            value = _to_decimal(value)
+            if exponent is not None:
+                value = value.quantize(exponent)
+            # '' and NULL both stand for the default currency
+            money = Money(value, row[currency_name] or None)
+            code = money.currency.code
+            if code in results:
+                if function is Min:
+                    money = min(results[code], money)
+                elif function is Max:
+                    money = max(results[code], money)
+                else:
+                    money = results[code] + money
+            results[code] = money
+            if 'count' in row:
+                counts[code] = counts.get(code, 0) + row['count']
+        if currency is None:
+            if function is Avg:
+                for code, total in results.items():
+                    results[code] = Money(total.amount / counts[code], total.currency)
+            return results
+        if not results:
+            return None
+        currency = _get_currency(currency)
+        converted = [money.convert_to(currency, rates) for money in results.itervalues()]
+        if function is Sum:
+            return sum(converted, Money(0, currency))
+        if function is Avg:
+            total = sum(converted, Money(0, currency))
+            return Money(total.amount / sum(counts.itervalues()), currency)
+        if function is Min:
+            return min(converted)
+        return max(converted)
+
+    def update(self, **kwargs):
+        """
+        Updates the selected rows; a Money value sets both the amount and
+        the currency column of its MoneyField.
+        """
+        for name, value in kwargs.items():
+            if isinstance(value, Money):
+                kwargs[currency_field_name(name)] = value.currency.code
+        return super(QuerysetWithMoney, self).update(**kwargs)
+
+    def bulk_create(self, objs, batch_size=None):
+        """
+        Inserts the model instances ``objs`` with one statement per batch of
+        ``batch_size`` instances (by default as many as the database allows
+        in one statement, 999 parameters on SQLite). The amount and
+        currency columns of every MoneyField are both written. As with
+        Django's own bulk_create(), save() isn't called, no signals are sent
+        and primary keys aren't set on the instances.
+        """
+        objs = list(objs)
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be a positive number")
+        if hasattr(QuerySet, 'bulk_create'):
+            for batch in _batches(objs, batch_size):
+                super(QuerysetWithMoney, self).bulk_create(batch)
+            return objs
+        if self.model._meta.parents:
+            raise ValueError("Can't bulk create an inherited model")
+
+        connection = connections[self.db]
+        cursor = connection.cursor()
+        fields = self.model._meta.local_fields
+        with_pk = [obj for obj in objs if obj.pk is not None]
+        without_pk = [obj for obj in objs if obj.pk is None]
+        for fields, group in ((fields, with_pk),
+                              ([f for f in fields if not isinstance(f, models.AutoField)], without_pk)):
+            if not group:
+                continue
+            size = _max_insert_rows(fields, connection)
+            if batch_size:
+                size = min(size, batch_size)
+            for batch in _batches(group, size):
+                params = []
+                for obj in batch:
+                    params.extend([f.get_db_prep_save(f.pre_save(obj, True), connection=connection)
+                                   for f in fields])
+                cursor.execute(_insert_sql(self.model, fields, len(batch), connection), params)
+        transaction.commit_unless_managed(using=self.db)
+        return objs
 
 
 class MoneyManager(models.Manager):
     def get_query_set(self):
         return QuerysetWithMoney(self.model)
+
+    def aggregate_by_currency(self, *args, **kwargs):
+        return self.get_query_set().aggregate_by_currency(*args, **kwargs)
+
+    def bulk_create(self, *args, **kwargs):
+        return self.get_query_set().bulk_create(*args, **kwargs)
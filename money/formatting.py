@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+Locale-aware formatting of monetary amounts.
+
+A locale is described by its positive and negative patterns, in which ``¤``
+stands for the currency and ``#`` for the number, and by its grouping and
+decimal separators. For every (locale, currency, style) combination the
+pattern is compiled once into a prefix, a suffix and the separators, and
+cached, so formatting an amount is a little integer arithmetic and string
+concatenation. Amounts are rounded according to the currency's rounding
+policy (see money.rounding) and shown with ``Currency.decimals`` decimals.
+
+format_many() formats a list of Money or a MoneyArray in one call, working
+directly on the minor units of a MoneyArray.
+"""
+from decimal import ROUND_HALF_EVEN
+
+from money import _get_currency
+from arrays import MoneyArray
+from rounding import round_amount
+
+__all__ = ('LOCALES', 'register_locale', 'set_default_locale', 'get_default_locale',
+           'format_money', 'format_many')
+
+NBSP = u'\xa0'
+
+# locale -> (positive pattern, negative pattern, grouping separator, decimal separator)
+LOCALES = {
+    'en_US': (u'¤#', u'-¤#', u',', u'.'),
+    'en_GB': (u'¤#', u'-¤#', u',', u'.'),
+    'de_DE': (u'#\xa0¤', u'-#\xa0¤', u'.', u','),
+    'de_CH': (u'¤\xa0#', u'¤-#', u'\u2019', u'.'),
+    'fr_FR': (u'#\xa0¤', u'-#\xa0¤', u'\u202f', u','),
+    'es_ES': (u'#\xa0¤', u'-#\xa0¤', u'.', u','),
+    'it_IT': (u'#\xa0¤', u'-#\xa0¤', u'.', u','),
+    'nl_NL': (u'¤\xa0#', u'¤\xa0-#', u'.', u','),
+    'pt_BR': (u'¤\xa0#', u'-¤\xa0#', u'.', u','),
+    'ru_RU': (u'#\xa0¤', u'-#\xa0¤', u'\xa0', u','),
+    'ja_JP': (u'¤#', u'-¤#', u',', u'.'),
+    'zh_CN': (u'¤#', u'-¤#', u',', u'.'),
+}
+
+STYLES = ('symbol', 'code', 'plain')
+
+DEFAULT_LOCALE = 'en_US'
+
+# (locale, currency code, style) -> compiled pattern
+_patterns = {}
+
+
+def _normalize(locale):
+    return locale.replace('-', '_')
+
+
+def register_locale(locale, positive, negative, group, decimal):
+    """
+    Adds or replaces a locale. ``positive`` and ``negative`` are patterns
+    such as u'¤#' and u'-¤#'.
+    """
+    for pattern in (positive, negative):
+        if pattern.count(u'#') != 1:
+            raise ValueError("a pattern must contain one '#': %r" % pattern)
+    locale = _normalize(locale)
+    LOCALES[locale] = (positive, negative, group, decimal)
+    for key in [key for key in _patterns if key[0] == locale]:
+        del _patterns[key]
+
+
+def set_default_locale(locale='en_US'):
+    global DEFAULT_LOCALE
+    locale = _normalize(locale)
+    if locale not in LOCALES:
+        raise ValueError("unknown locale %r" % locale)
+    DEFAULT_LOCALE = locale
+
+
+def get_default_locale():
+    return DEFAULT_LOCALE
+
+
+def _affixes(pattern, currency, style):
+    """
+    Splits ``pattern`` around the number into a prefix and a suffix with the
+    currency filled in. Codes and the 'plain' style get the spacing right:
+    a code is never glued to the number and 'plain' drops the currency
+    with its spacing.
+    """
+    prefix, suffix = pattern.split(u'#')
+    if style == 'plain':
+        return prefix.replace(u'¤', u'').strip(), suffix.replace(u'¤', u'').strip()
+    text = currency.symbol if style == 'symbol' else u''
+    if not text:
+        text = unicode(currency.code)
+        if prefix.endswith(u'¤'):
+            prefix += NBSP
+        elif prefix.endswith(u'¤-'):
+            prefix = prefix[:-1] + NBSP + u'-'
+        if suffix.startswith(u'¤'):
+            suffix = NBSP + suffix
+    return prefix.replace(u'¤', text), suffix.replace(u'¤', text)
+
+
+def _compile(locale, currency, style):
+    try:
+        positive, negative, group, decimal = LOCALES[locale]
+    except KeyError:
+        raise ValueError("unknown locale %r" % locale)
+    if style not in STYLES:
+        raise ValueError("unknown style %r" % style)
+    pattern = (_affixes(positive, currency, style), _affixes(negative, currency, style),
+               currency.decimals, 10 ** currency.decimals, group, decimal)
+    _patterns[(locale, currency.code, style)] = pattern
+    return pattern
+
+
+def _pattern(locale, currency, style):
+    locale = _normalize(locale)
+    try:
+        return _patterns[(locale, currency.code, style)]
+    except KeyError:
+        return _compile(locale, currency, style)
+
+
+def _format_minor(pattern, minor):
+    """
+    Formats an integer number of minor units with a compiled pattern.
+    """
+    (prefix, suffix), negative, decimals, scale, group, decimal = pattern
+    if minor < 0:
+        minor = -minor
+        prefix, suffix = negative
+    whole, fraction = divmod(minor, scale)
+    text = u'{:,d}'.format(whole)
+    if group != u',':
+        text = text.replace(u',', group)
+    if decimals:
+        text = u'%s%s%0*d' % (text, decimal, decimals, fraction)
+    return prefix + text + suffix
+
+
+def _to_minor(money, decimals):
+    amount = round_amount(money.amount, money.currency)
+    sign, digits, exponent = amount.as_tuple()
+    if exponent != -decimals:
+        # a rounding policy with other decimals than the currency's
+        return int(amount.scaleb(decimals).to_integral_value(ROUND_HALF_EVEN))
+    minor = int(''.join(map(str, digits)))
+    return -minor if sign else minor
+
+
+def format_money(money, locale=None, style='symbol'):
+    """
+    Formats ``money`` for ``locale`` (by default the default locale).
+    ``style`` is 'symbol' (the currency symbol, or the code if the currency
+    has none), 'code' or 'plain' (no currency).
+
+    >>> format_money(Money('-1234.5', 'EUR'), 'de_DE')
+    u'-1.234,50\\xa0\\u20ac'
+    """
+    pattern = _pattern(locale or DEFAULT_LOCALE, money.currency, style)
+    return _format_minor(pattern, _to_minor(money, pattern[2]))
+
+
+def format_many(moneys, locale=None, style='symbol'):
+    """
+    Formats a list of Money or a MoneyArray and returns a list of unicode
+    strings. Patterns are looked up once per currency.
+    """
+    locale = locale or DEFAULT_LOCALE
+    if isinstance(moneys, MoneyArray):
+        if moneys.codes is None:
+            pattern = _pattern(locale, moneys.currency, style)
+            return [_format_minor(pattern, minor) for minor in moneys.minor.tolist()]
+        patterns = {}
+        result = []
+        for minor, code in zip(moneys.minor.tolist(), moneys.codes.tolist()):
+            try:
+                pattern = patterns[code]
+            except KeyError:
+                pattern = patterns[code] = _pattern(locale, _get_currency(code), style)
+            result.append(_format_minor(pattern, minor))
+        return result
+    patterns = {}
+    result = []
+    for money in moneys:
+        currency = money.currency
+        try:
+            pattern = patterns[currency.code]
+        except KeyError:
+            pattern = patterns[currency.code] = _pattern(locale, currency, style)
+        result.append(_format_minor(pattern, _to_minor(money, pattern[2])))
+    return result
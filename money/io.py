@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming ingestion of monetary amounts from CSV and TSV files.
+
+read_batches() reads a file row by row through the csv module and yields
+fixed-size batches, so a ledger of any size is processed in constant
+memory. Every batch is either a MoneyArray or a list of Money. Currency
+codes are checked against the registry once per distinct code, and
+amounts are converted straight to integer minor units without building a
+Decimal for every row where possible.
+"""
+import csv
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+
+from money import Money, CURRENCY, get_default_currency, _get_currency
+from arrays import MoneyArray, numpy, to_minor, CODE_DTYPE, INT64_MAX
+
+__all__ = ('read_batches',)
+
+
+def _minor_units(text, decimals):
+    """
+    Converts a plain decimal string such as '-12.5' to an integer number of
+    minor units, or returns None if ``text`` needs the slower Decimal path
+    (exponents, more decimals than the currency has, ...).
+    """
+    whole, point, fraction = text.partition('.')
+    sign = 1
+    if whole[:1] in ('-', '+'):
+        if whole[0] == '-':
+            sign = -1
+        whole = whole[1:]
+    if len(fraction) > decimals or not (whole or fraction):
+        return None
+    digits = whole + fraction + '0' * (decimals - len(fraction))
+    if not digits.isdigit():
+        return None
+    return sign * int(digits)
+
+
+def _column_index(column, names):
+    if isinstance(column, (int, long)):
+        return column
+    if names is None:
+        raise ValueError("column %r given by name but the file has no header" % column)
+    try:
+        return names.index(column)
+    except ValueError:
+        raise ValueError("no column named %r" % column)
+
+
+def read_batches(f, amount_column='amount', currency_column='currency', currency=None,
+                 batch_size=10000, delimiter=',', header=True, arrays=True, errors=None):
+    """
+    Reads monetary amounts from the CSV file ``f`` (a file name or a file
+    object) and yields them in batches of up to ``batch_size`` rows.
+
+    ``amount_column`` and ``currency_column`` are column names (looked up in
+    the header row) or zero-based column indexes. Without a currency column
+    every amount is in ``currency``, or the default currency. Use
+    ``delimiter='\\t'`` for TSV files.
+
+    With ``arrays`` (the default) every batch is a MoneyArray, which needs
+    NumPy and amounts that fit the minor unit of their currency; otherwise
+    it's a list of Money. Rows that can't be read are skipped; if
+    ``errors`` is a list, a (row number, row, error) tuple is appended to it
+    for each of them, rows being numbered from 0 after the header.
+
+    >>> for batch in read_batches('ledger.csv', batch_size=50000):
+    ...     totals = sum_by_currency(batch)
+    """
+    if arrays and not numpy:
+        raise ImportError("MoneyArray batches require numpy")
+    if isinstance(f, basestring):
+        with open(f, 'rb') as f:
+            for batch in read_batches(f, amount_column, currency_column, currency,
+                                      batch_size, delimiter, header, arrays, errors):
+                yield batch
+        return
+
+    reader = csv.reader(f, delimiter=delimiter)
+    names = next(reader, None) if header else None
+    if header and names is None:
+        return
+    amount_index = _column_index(amount_column, names)
+    currency_index = None if currency_column is None else _column_index(currency_column, names)
+    fixed = _get_currency(currency) if currency else get_default_currency()
+
+    # currency code -> Currency, filled in once per distinct code
+    currencies = {}
+    number = 0
+    while True:
+        rows = list(islice(reader, batch_size))
+        if not rows:
+            return
+        minors, codes, moneys = [], [], []
+        for row in rows:
+            try:
+                if currency_index is None:
+                    row_currency = fixed
+                else:
+                    code = row[currency_index]
+                    try:
+                        row_currency = currencies[code]
+                    except KeyError:
+                        row_currency = currencies[code] = _get_currency(code.strip())
+                text = row[amount_index].strip()
+                if arrays:
+                    minor = _minor_units(text, row_currency.decimals)
+                    if minor is None:
+                        minor = to_minor(Decimal(text), row_currency)
+                    if not -INT64_MAX - 1 <= minor <= INT64_MAX:
+                        raise OverflowError("%s is too large for a MoneyArray" % text)
+                    minors.append(minor)
+                    codes.append(row_currency.code)
+                else:
+                    amount = Decimal(text)
+                    if not amount.is_finite():
+                        raise ValueError("%s is not a finite amount" % text)
+                    moneys.append(Money._make(amount, row_currency))
+            except (IndexError, KeyError, ValueError, InvalidOperation, OverflowError), error:
+                if errors is not None:
+                    errors.append((number, row, error))
+            number += 1
+        if arrays:
+            yield _make_array(minors, codes)
+        else:
+            yield moneys
+
+
+def _make_array(minors, codes):
+    minor = numpy.array(minors, dtype=numpy.int64)
+    distinct = set(codes)
+    if len(distinct) == 1:
+        return MoneyArray._make(minor, CURRENCY[distinct.pop()], None)
+    if not distinct:
+        return MoneyArray._make(minor, get_default_currency(), None)
+    return MoneyArray._make(minor, None, numpy.array(codes, dtype=CODE_DTYPE))
@@ -0,0 +1,420 @@
+# -*- coding: utf-8 -*-
+"""
+ISO 4217 currency data as plain literals.
+
+Importing this module only loads constants; the Currency objects in
+money.CURRENCY are built from CURRENCIES the first time each one is looked
+up. Rows are (numeric, name, symbol, decimals, countries), keyed by the
+alphabetic code.
+"""
+
+#
+# Definitions of ISO 4217 Currencies
+# Source: http://www.iso.org/iso/support/faqs/faqs_widely_used_standards/widely_used_standards_other/currency_codes/currency_codes_list-1.htm
+# Symbols: http://www.xe.com/symbols.php
+#
+
+CURRENCIES = {
+    'BZD': ('084', 'Belize Dollar', u"", 2, ('BELIZE',)),
+    'YER': ('886', 'Yemeni Rial', u"", 2, ('YEMEN',)),
+    'XBA': ('955', 'Bond Markets Units European Composite Unit (EURCO)', u"", 2, ()),
+    'SLL': ('694', 'Leone', u"", 2, ('SIERRA LEONE',)),
+    'ERN': ('232', 'Nakfa', u"", 2, ('ERITREA',)),
+    'NGN': ('566', 'Naira', u"₦", 2, ('NIGERIA',)),
+    'CRC': ('188', 'Costa Rican Colon', u"₡", 2, ('COSTA RICA',)),
+    'VEF': ('937', 'Bolivar Fuerte', u"", 2, ('VENEZUELA',)),
+    'LAK': ('418', 'Kip', u"₭", 2, ('LAO PEOPLES DEMOCRATIC REPUBLIC',)),
+    'DZD': ('012', 'Algerian Dinar', u"", 2, ('ALGERIA',)),
+    'SZL': ('748', 'Lilangeni', u"", 2, ('SWAZILAND',)),
+    'MOP': ('446', 'Pataca', u"", 2, ('MACAO',)),
+    'BYR': ('974', 'Belarussian Ruble', u"", 2, ('BELARUS',)),
+    'MUR': ('480', 'Mauritius Rupee', u"", 2, ('MAURITIUS',)),
+    'WST': ('882', 'Tala', u"", 2, ('SAMOA',)),
+    'LRD': ('430', 'Liberian Dollar', u"", 2, ('LIBERIA',)),
+    'MMK': ('104', 'Kyat', u"", 2, ('MYANMAR',)),
+    'KGS': ('417', 'Som', u"", 2, ('KYRGYZSTAN',)),
+    'PYG': ('600', 'Guarani', u"₲", 0, ('PARAGUAY',)),
+    'IDR': ('360', 'Rupiah', u"", 2, ('INDONESIA',)),
+    'XBD': ('958', 'European Unit of Account 17(E.U.A.-17)', u"", 2, ()),
+    'GTQ': ('320', 'Quetzal', u"", 2, ('GUATEMALA',)),
+    'CAD': ('124', 'Canadian Dollar', u"$", 2, ('CANADA',)),
+    'AWG': ('533', 'Aruban Guilder', u"", 2, ('ARUBA',)),
+    'TTD': ('780', 'Trinidad and Tobago Dollar', u"", 2, ('TRINIDAD AND TOBAGO',)),
+    'PKR': ('586', 'Pakistan Rupee', u"", 2, ('PAKISTAN',)),
+    'XBC': ('957', 'European Unit of Account 9(E.U.A.-9)', u"", 2, ()),
+    'UZS': ('860', 'Uzbekistan Sum', u"", 2, ('UZBEKISTAN',)),
+    'XCD': ('951', 'East Caribbean Dollar', u"", 2, ('ANGUILLA', 'ANTIGUA AND BARBUDA', 'DOMINICA', 'GRENADA', 'MONTSERRAT', 'SAINT KITTS AND NEVIS', 'SAINT LUCIA', 'SAINT VINCENT AND THE GRENADINES')),
+    'VUV': ('548', 'Vatu', u"", 0, ('VANUATU',)),
+    'KMF': ('174', 'Comoro Franc', u"", 0, ('COMOROS',)),
+    'AZN': ('944', 'Azerbaijanian Manat', u"", 2, ('AZERBAIJAN',)),
+    'XPD': ('964', 'Palladium', u"", 2, ()),
+    'MNT': ('496', 'Tugrik', u"₮", 2, ('MONGOLIA',)),
+    'ANG': ('532', 'Netherlands Antillian Guilder', u"", 2, ('NETHERLANDS ANTILLES',)),
+    'LBP': ('422', 'Lebanese Pound', u"", 2, ('LEBANON',)),
+    'KES': ('404', 'Kenyan Shilling', u"", 2, ('KENYA',)),
+    'GBP': ('826', 'Pound Sterling', u"£", 2, ('UNITED KINGDOM',)),
+    'SEK': ('752', 'Swedish Krona', u"", 2, ('SWEDEN',)),
+    'AFN': ('971', 'Afghani', u"", 2, ('AFGHANISTAN',)),
+    'KZT': ('398', 'Tenge', u"₸", 2, ('KAZAKHSTAN',)),
+    'ZMK': ('894', 'Kwacha', u"", 2, ('ZAMBIA',)),
+    'SKK': ('703', 'Slovak Koruna', u"", 2, ('SLOVAKIA',)),
+    'DKK': ('208', 'Danish Krone', u"", 2, ('DENMARK', 'FAROE ISLANDS', 'GREENLAND')),
+    'TMM': ('795', 'Manat', u"", 2, ('TURKMENISTAN',)),
+    'AMD': ('051', 'Armenian Dram', u"", 2, ('ARMENIA',)),
+    'SCR': ('690', 'Seychelles Rupee', u"", 2, ('SEYCHELLES',)),
+    'FJD': ('242', 'Fiji Dollar', u"", 2, ('FIJI',)),
+    'SHP': ('654', 'Saint Helena Pound', u"", 2, ('SAINT HELENA',)),
+    'ALL': ('008', 'Lek', u"", 2, ('ALBANIA',)),
+    'TOP': ('776', 'Paanga', u"", 2, ('TONGA',)),
+    'UGX': ('800', 'Uganda Shilling', u"", 0, ('UGANDA',)),
+    'OMR': ('512', 'Rial Omani', u"", 3, ('OMAN',)),
+    'DJF': ('262', 'Djibouti Franc', u"", 0, ('DJIBOUTI',)),
+    'BND': ('096', 'Brunei Dollar', u"", 2, ('BRUNEI DARUSSALAM',)),
+    'TND': ('788', 'Tunisian Dinar', u"", 3, ('TUNISIA',)),
+    'SBD': ('090', 'Solomon Islands Dollar', u"", 2, ('SOLOMON ISLANDS',)),
+    'GHS': ('936', 'Ghana Cedi', u"₵", 2, ('GHANA',)),
+    'GNF': ('324', 'Guinea Franc', u"", 0, ('GUINEA',)),
+    'CVE': ('132', 'Cape Verde Escudo', u"", 2, ('CAPE VERDE',)),
+    'ARS': ('032', 'Argentine Peso', u"", 2, ('ARGENTINA',)),
+    'GMD': ('270', 'Dalasi', u"", 2, ('GAMBIA',)),
+    'ZWD': ('716', 'Zimbabwe Dollar', u"", 2, ('ZIMBABWE',)),
+    'MWK': ('454', 'Kwacha', u"", 2, ('MALAWI',)),
+    'BDT': ('050', 'Taka', u"", 2, ('BANGLADESH',)),
+    'KWD': ('414', 'Kuwaiti Dinar', u"", 3, ('KUWAIT',)),
+    'EUR': ('978', 'Euro', u"€", 2, ('ANDORRA', 'AUSTRIA', 'BELGIUM', 'FINLAND', 'FRANCE', 'FRENCH GUIANA', 'FRENCH SOUTHERN TERRITORIES', 'GERMANY', 'GREECE', 'GUADELOUPE', 'IRELAND', 'ITALY', 'LUXEMBOURG', 'MARTINIQUE', 'MAYOTTE', 'MONACO', 'MONTENEGRO', 'NETHERLANDS', 'PORTUGAL', 'R.UNION', 'SAINT PIERRE AND MIQUELON', 'SAN MARINO', 'SLOVENIA', 'SPAIN')),
+    'CHF': ('756', 'Swiss Franc', u"Fr.", 2, ('LIECHTENSTEIN',)),
+    'XAG': ('961', 'Silver', u"", 2, ()),
+    'SRD': ('968', 'Surinam Dollar', u"", 2, ('SURINAME',)),
+    'DOP': ('214', 'Dominican Peso', u"", 2, ('DOMINICAN REPUBLIC',)),
+    'PEN': ('604', 'Nuevo Sol', u"", 2, ('PERU',)),
+    'KPW': ('408', 'North Korean Won', u"", 2, ('KOREA',)),
+    'SGD': ('702', 'Singapore Dollar', u"", 2, ('SINGAPORE',)),
+    'TWD': ('901', 'New Taiwan Dollar', u"", 2, ('TAIWAN',)),
+    'USD': ('840', 'US Dollar', u"$", 2, ('AMERICAN SAMOA', 'BRITISH INDIAN OCEAN TERRITORY', 'ECUADOR', 'GUAM', 'MARSHALL ISLANDS', 'MICRONESIA', 'NORTHERN MARIANA ISLANDS', 'PALAU', 'PUERTO RICO', 'TIMOR-LESTE', 'TURKS AND CAICOS ISLANDS', 'UNITED STATES MINOR OUTLYING ISLANDS', 'VIRGIN ISLANDS (BRITISH)', 'VIRGIN ISLANDS (U.S.)')),
+    'BGN': ('975', 'Bulgarian Lev', u"", 2, ('BULGARIA',)),
+    'MAD': ('504', 'Moroccan Dirham', u"", 2, ('MOROCCO', 'WESTERN SAHARA')),
+    'XXX': ('999', 'XXX', u"", 2, ()),
+    'SAR': ('682', 'Saudi Riyal', u"", 2, ('SAUDI ARABIA',)),
+    'AUD': ('036', 'Australian Dollar', u"$", 2, ('AUSTRALIA', 'CHRISTMAS ISLAND', 'COCOS (KEELING) ISLANDS', 'HEARD ISLAND AND MCDONALD ISLANDS', 'KIRIBATI', 'NAURU', 'NORFOLK ISLAND', 'TUVALU')),
+    'KYD': ('136', 'Cayman Islands Dollar', u"", 2, ('CAYMAN ISLANDS',)),
+    'KRW': ('410', 'Won', u"₩", 0, ('KOREA',)),
+    'GIP': ('292', 'Gibraltar Pound', u"", 2, ('GIBRALTAR',)),
+    'TRY': ('949', 'New Turkish Lira', u"₺", 2, ('TURKEY',)),
+    'XAU': ('959', 'Gold', u"", 2, ()),
+    'CZK': ('203', 'Czech Koruna', u"Kč", 2, ('CZECH REPUBLIC',)),
+    'JMD': ('388', 'Jamaican Dollar', u"", 2, ('JAMAICA',)),
+    'BSD': ('044', 'Bahamian Dollar', u"", 2, ('BAHAMAS',)),
+    'BWP': ('072', 'Pula', u"", 2, ('BOTSWANA',)),
+    'GYD': ('328', 'Guyana Dollar', u"", 2, ('GUYANA',)),
+    'XTS': ('963', 'Codes specifically reserved for testing purposes', u"", 2, ()),
+    'LYD': ('434', 'Libyan Dinar', u"", 3, ('LIBYAN ARAB JAMAHIRIYA',)),
+    'EGP': ('818', 'Egyptian Pound', u"", 2, ('EGYPT',)),
+    'THB': ('764', 'Baht', u"฿", 2, ('THAILAND',)),
+    'MKD': ('807', 'Denar', u"", 2, ('MACEDONIA',)),
+    'SDG': ('938', 'Sudanese Pound', u"", 2, ('SUDAN',)),
+    'AED': ('784', 'UAE Dirham', u"", 2, ('UNITED ARAB EMIRATES',)),
+    'JOD': ('400', 'Jordanian Dinar', u"", 3, ('JORDAN',)),
+    'JPY': ('392', 'Yen', u"¥", 0, ('JAPAN',)),
+    'ZAR': ('710', 'Rand', u"", 2, ('SOUTH AFRICA',)),
+    'HRK': ('191', 'Croatian Kuna', u"", 2, ('CROATIA',)),
+    'AOA': ('973', 'Kwanza', u"", 2, ('ANGOLA',)),
+    'RWF': ('646', 'Rwanda Franc', u"", 0, ('RWANDA',)),
+    'CUP': ('192', 'Cuban Peso', u"", 2, ('CUBA',)),
+    'XFO': ('Nil', 'Gold-Franc', u"", 2, ()),
+    'BBD': ('052', 'Barbados Dollar', u"", 2, ('BARBADOS',)),
+    'PGK': ('598', 'Kina', u"", 2, ('PAPUA NEW GUINEA',)),
+    'LKR': ('144', 'Sri Lanka Rupee', u"", 2, ('SRI LANKA',)),
+    'RON': ('946', 'New Leu', u"", 2, ('ROMANIA',)),
+    'PLN': ('985', 'Zloty', u"zł", 2, ('POLAND',)),
+    'IQD': ('368', 'Iraqi Dinar', u"", 3, ('IRAQ',)),
+    'TJS': ('972', 'Somoni', u"", 2, ('TAJIKISTAN',)),
+    'MDL': ('498', 'Moldovan Leu', u"", 2, ('MOLDOVA',)),
+    'MYR': ('458', 'Malaysian Ringgit', u"", 2, ('MALAYSIA',)),
+    'CNY': ('156', 'Yuan Renminbi', u"", 2, ('CHINA',)),
+    'LVL': ('428', 'Latvian Lats', u"", 2, ('LATVIA',)),
+    'INR': ('356', 'Indian Rupee', u"₹", 2, ('INDIA',)),
+    'FKP': ('238', 'Falkland Islands Pound', u"", 2, ('FALKLAND ISLANDS (MALVINAS)',)),
+    'NIO': ('558', 'Cordoba Oro', u"", 2, ('NICARAGUA',)),
+    'PHP': ('608', 'Philippine Peso', u"₱", 2, ('PHILIPPINES',)),
+    'HNL': ('340', 'Lempira', u"", 2, ('HONDURAS',)),
+    'HKD': ('344', 'Hong Kong Dollar', u"", 2, ('HONG KONG',)),
+    'NZD': ('554', 'New Zealand Dollar', u"", 2, ('COOK ISLANDS', 'NEW ZEALAND', 'NIUE', 'PITCAIRN', 'TOKELAU')),
+    'BRL': ('986', 'Brazilian Real', u"R$", 2, ('BRAZIL',)),
+    'RSD': ('941', 'Serbian Dinar', u"", 2, ('SERBIA',)),
+    'XBB': ('956', 'European Monetary Unit (E.M.U.-6)', u"", 2, ()),
+    'EEK': ('233', 'Kroon', u"", 2, ('ESTONIA',)),
+    'SOS': ('706', 'Somali Shilling', u"", 2, ('SOMALIA',)),
+    'MZN': ('943', 'Metical', u"", 2, ('MOZAMBIQUE',)),
+    'XFU': ('Nil', 'UIC-Franc', u"", 2, ()),
+    'NOK': ('578', 'Norwegian Krone', u"", 2, ('BOUVET ISLAND', 'NORWAY', 'SVALBARD AND JAN MAYEN')),
+    'ISK': ('352', 'Iceland Krona', u"", 0, ('ICELAND',)),
+    'GEL': ('981', 'Lari', u"", 2, ('GEORGIA',)),
+    'ILS': ('376', 'New Israeli Sheqel', u"₪", 2, ('ISRAEL',)),
+    'HUF': ('348', 'Forint', u"", 2, ('HUNGARY',)),
+    'UAH': ('980', 'Hryvnia', u"₴", 2, ('UKRAINE',)),
+    'RUB': ('643', 'Russian Ruble', u"руб", 2, ('RUSSIAN FEDERATION',)),
+    'IRR': ('364', 'Iranian Rial', u"", 2, ('IRAN',)),
+    'BMD': ('060', 'Bermudian Dollar', u"", 2, ('BERMUDA',)),
+    'MGA': ('969', 'Malagasy Ariary', u"", 2, ('MADAGASCAR',)),
+    'MVR': ('462', 'Rufiyaa', u"", 2, ('MALDIVES',)),
+    'QAR': ('634', 'Qatari Rial', u"", 2, ('QATAR',)),
+    'VND': ('704', 'Dong', u"₫", 0, ('VIET NAM',)),
+    'MRO': ('478', 'Ouguiya', u"", 2, ('MAURITANIA',)),
+    'NPR': ('524', 'Nepalese Rupee', u"", 2, ('NEPAL',)),
+    'TZS': ('834', 'Tanzanian Shilling', u"", 2, ('TANZANIA',)),
+    'BIF': ('108', 'Burundi Franc', u"", 0, ('BURUNDI',)),
+    'XPT': ('962', 'Platinum', u"", 2, ()),
+    'KHR': ('116', 'Riel', u"", 2, ('CAMBODIA',)),
+    'SYP': ('760', 'Syrian Pound', u"", 2, ('SYRIAN ARAB REPUBLIC',)),
+    'BHD': ('048', 'Bahraini Dinar', u"", 3, ('BAHRAIN',)),
+    'XDR': ('960', 'SDR', u"", 2, ('INTERNATIONAL MONETARY FUND (I.M.F)',)),
+    'STD': ('678', 'Dobra', u"", 2, ('SAO TOME AND PRINCIPE',)),
+    'BAM': ('977', 'Convertible Marks', u"", 2, ('BOSNIA AND HERZEGOVINA',)),
+    'LTL': ('440', 'Lithuanian Litas', u"", 2, ('LITHUANIA',)),
+    'ETB': ('230', 'Ethiopian Birr', u"", 2, ('ETHIOPIA',)),
+    'XPF': ('953', 'CFP Franc', u"", 0, ('FRENCH POLYNESIA', 'NEW CALEDONIA', 'WALLIS AND FUTUNA')),
+}
+
+# Dictionary of currencies by ISO country code
+# Source: http://www.panalpina.com/www/global/en/tools_resources/unit_converter/currency_codes.html
+# and http://www.oanda.com/help/currency-iso-code-country
+# Countries commented out do not have a currency entry above, but should.
+#
+
+COUNTRY_CURRENCIES = {
+   'AF': 'AFN',
+   'AL': 'ALL',
+   'DZ': 'DZD',
+   'AS': 'EUR',
+   'AD': 'EUR',
+   'AO': 'AOA',
+   'AI': 'XCD',
+   'AG': 'XCD',
+   'AR': 'ARS',
+   'AM': 'AMD',
+   'AW': 'ANG',
+   'AU': 'AUD',
+   'AT': 'EUR',
+   'AZ': 'AZN',
+   'BS': 'BSD',
+   'BH': 'BHD',
+   'BD': 'BDT',
+   'BB': 'BBD',
+   'BY': 'BYR',
+   'BE': 'EUR',
+   'BZ': 'BZD',
+   #'BJ': 'XOF',
+   'BM': 'BMD',
+   #'BT': 'BTN',
+   #'BO': 'BOB',
+   'BA': 'BAM',
+   'BW': 'BWP',
+   'BV': 'NOK',
+   'BR': 'BRL',
+   'IO': 'USD',
+   'BN': 'BND',
+   'BG': 'BGN',
+   #'BF': 'XOF',
+   'BI': 'BIF',
+   'KH': 'KHR',
+   #'CM': 'XAF',
+   'CA': 'CAD',
+   'CV': 'CVE',
+   'KY': 'KYD',
+   #'CF': 'XAF',
+   #'TD': 'XAF',
+   #'CL': 'CLP',
+   'CN': 'CNY',
+   'CX': 'AUD',
+   'CC': 'AUD',
+   #'CO': 'COP',
+   'KM': 'KMF',
+   #'CG': 'XAF',
+   #'CD': 'CDF',
+   'CK': 'NZD',
+   'CR': 'CRC',
+   'HR': 'HRK',
+   'CU': 'CUP',
+   'CY': 'EUR',
+   'CZ': 'CZK',
+   'DK': 'DKK',
+   'DJ': 'DJF',
+   'DM': 'XCD',
+   'DO': 'DOP',
+   'TP': 'IDR',
+   #'EC': 'ECS',
+   'EG': 'EGP',
+   #'SV': 'SVC',
+   #'GQ': 'XAF',
+   'ER': 'ERN',
+   'EE': 'EEK',
+   'ET': 'ETB',
+   'FK': 'FKP',
+   'FO': 'DKK',
+   'FJ': 'FJD',
+   'FI': 'EUR',
+   'FR': 'EUR',
+   'GF': 'EUR',
+   'PF': 'XPF',
+   'TF': 'EUR',
+   #'GA': 'XAF',
+   'GM': 'GMD',
+   'GE': 'GEL',
+   'DE': 'EUR',
+   'GH': 'GHS',
+   'GI': 'GIP',
+   'GR': 'EUR',
+   'GL': 'DKK',
+   'GD': 'XCD',
+   'GP': 'EUR',
+   'GU': 'USD',
+   'GT': 'GTQ',
+   'GN': 'GNF',
+   #'GW': 'XOF',
+   'GY': 'GYD',
+   #'HT': 'HTG',
+   'HM': 'AUD',
+   'HN': 'HNL',
+   'HK': 'HKD',
+   'HU': 'HUF',
+   'IS': 'ISK',
+   'IN': 'INR',
+   'ID': 'IDR',
+   'IR': 'IRR',
+   'IQ': 'IQD',
+   'IE': 'EUR',
+   'IL': 'ILS',
+   'IT': 'EUR',
+   #'CI': 'XOF',
+   'JM': 'JMD',
+   'JP': 'JPY',
+   'JO': 'JOD',
+   'KZ': 'KZT',
+   'KE': 'KES',
+   'KI': 'AUD',
+   'KP': 'KPW',
+   'KR': 'KRW',
+   'KW': 'KWD',
+   'KG': 'KGS',
+   'LA': 'LAK',
+   'LV': 'LVL',
+   'LB': 'LBP',
+   #'LS': 'LSL',
+   'LR': 'LRD',
+   'LY': 'LYD',
+   'LI': 'CHF',
+   'LT': 'LTL',
+   'LU': 'EUR',
+   'MO': 'MOP',
+   'MK': 'MKD',
+   #'MG': 'MGF',
+   'MW': 'MWK',
+   'MY': 'MYR',
+   'MV': 'MVR',
+   #'ML': 'XOF',
+   'MT': 'EUR',
+   'MH': 'USD',
+   'MQ': 'EUR',
+   'MR': 'MRO',
+   'MU': 'MUR',
+   'YT': 'EUR',
+   #'MX': 'MXN',
+   'FM': 'USD',
+   'MD': 'MDL',
+   'MC': 'EUR',
+   'MN': 'MNT',
+   'MS': 'XCD',
+   'MA': 'MAD',
+   'MZ': 'MZN',
+   'MM': 'MMK',
+   'NA': 'ZAR',
+   'NR': 'AUD',
+   'NP': 'NPR',
+   'NL': 'EUR',
+   'AN': 'ANG',
+   'NC': 'XPF',
+   'NZ': 'NZD',
+   'NI': 'NIO',
+   #'NE': 'XOF',
+   'NG': 'NGN',
+   'NU': 'NZD',
+   'NF': 'AUD',
+   'MP': 'USD',
+   'NO': 'NOK',
+   'OM': 'OMR',
+   'PK': 'PKR',
+   'PW': 'USD',
+   #'PA': 'PAB',
+   'PG': 'PGK',
+   'PY': 'PYG',
+   'PE': 'PEN',
+   'PH': 'PHP',
+   'PN': 'NZD',
+   'PL': 'PLN',
+   'PT': 'EUR',
+   'PR': 'USD',
+   'QA': 'QAR',
+   'RE': 'EUR',
+   'RO': 'RON',
+   'RU': 'RUB',
+   'RW': 'RWF',
+   'KN': 'XCD',
+   'LC': 'XCD',
+   'VC': 'XCD',
+   'WS': 'WST',
+   'SM': 'EUR',
+   'ST': 'STD',
+   'SA': 'SAR',
+   #'SN': 'XOF',
+   'SC': 'SCR',
+   'SL': 'SLL',
+   'SG': 'SGD',
+   'SK': 'SKK',
+   'SI': 'EUR',
+   'SB': 'SBD',
+   'SO': 'SOS',
+   'ZA': 'ZAR',
+   'GS': 'GBP',
+   'ES': 'EUR',
+   'LK': 'LKR',
+   'SD': 'SDG',
+   'SR': 'SRD',
+   'SJ': 'NOK',
+   'SZ': 'SZL',
+   'SE': 'SEK',
+   'CH': 'CHF',
+   'SY': 'SYP',
+   'TW': 'TWD',
+   'TJ': 'TJS',
+   'TZ': 'TZS',
+   'TH': 'THB',
+   #'TG': 'XOF',
+   'TK': 'NZD',
+   'TO': 'TOP',
+   'TT': 'TTD',
+   'TN': 'TND',
+   'TR': 'TRY',
+   'TM': 'TMM',
+   'TC': 'USD',
+   'TV': 'AUD',
+   'UG': 'UGX',
+   'UA': 'UAH',
+   'AE': 'AED',
+   'GB': 'GBP',
+   'US': 'USD',
+   'UM': 'USD',
+   #'UY': 'UYU',
+   'UZ': 'UZS',
+   'VU': 'VUV',
+   'VA': 'EUR',
+   #'VE': 'VEF',
+   'VN': 'VND',
+   'VG': 'USD',
+   'VI': 'USD',
+   'WF': 'XPF',
+   'EH': 'MAD',
+   'YE': 'YER',
+   #'YU': 'YUN',
+   'ZM': 'ZMK',
+   'ZW': 'ZWD',
+}
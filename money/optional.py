@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Deferred imports of optional dependencies.
+
+NumPy, msgpack and friends take longer to import than the rest of the package
+together, so modules refer to them through an OptionalModule that imports
+the real module on first use. ``bool(numpy)`` tells whether it is installed.
+"""
+from importlib import import_module
+
+__all__ = ('OptionalModule', 'numpy', 'msgpack', 'pyarrow', 'parquet')
+
+_MISSING = object()
+
+
+class OptionalModule(object):
+    """
+    Stands in for the module ``name`` and imports it the first time one of
+    its attributes is used. Accessing an attribute of a module that is not
+    installed raises ImportError.
+    """
+
+    def __init__(self, name):
+        self.__name = name
+        self.__module = None
+
+    def __load(self):
+        if self.__module is None:
+            try:
+                module = import_module(self.__name)
+            except ImportError:
+                module = _MISSING
+            else:
+                # Later lookups find the attributes directly
+                self.__dict__.update(module.__dict__)
+            self.__module = module
+        return self.__module
+
+    def __nonzero__(self):
+        return self.__load() is not _MISSING
+
+    def __getattr__(self, attr):
+        module = self.__load()
+        if module is _MISSING:
+            raise ImportError("%s is required for this operation" % self.__name)
+        return getattr(module, attr)
+
+    def __repr__(self):
+        return '<optional module %r>' % self.__name
+
+
+numpy = OptionalModule('numpy')
+msgpack = OptionalModule('msgpack')
+pyarrow = OptionalModule('pyarrow')
+parquet = OptionalModule('pyarrow.parquet')
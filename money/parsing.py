@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+Parsing of monetary amounts from strings.
+
+A MoneyParser matches a whole input with one precompiled regular expression
+and accepts the formats found in typical data feeds:
+
+    USD 10.00    10.00 USD    usd10    $10.00    10 руб
+    1,234.50     -USD 10      USD -10  $-10      (10.00)   10.00- EUR
+
+Currency codes are matched case-insensitively, thousands separators are
+dropped and a leading or trailing minus sign or accounting parentheses make
+the amount negative. Inputs without a currency get the parser's currency,
+or the default currency if it has none.
+
+parse_many() parses a stream of strings and reports the invalid ones
+instead of stopping at the first error.
+"""
+import re
+from decimal import Decimal
+
+from money import Money, CURRENCY, get_default_currency, _get_currency, \
+    IncorrectMoneyInputError
+
+__all__ = ('MoneyParser', 'parse_money', 'parse_many')
+
+# Currencies to use for symbols shared by several currencies
+DEFAULT_SYMBOLS = {u'$': 'USD'}
+
+
+class MoneyParser(object):
+    """
+    A parser for one number format.
+
+    ``currency`` is used for inputs that carry no currency; by default it is
+    the default currency at the time of parsing. ``symbols`` maps currency
+    symbols to currencies (or codes), on top of the symbols of the currency
+    registry; it is needed for symbols such as '$' that several currencies
+    share. ``thousands`` and ``decimal`` are the separators of the number
+    format, e.g. ``MoneyParser(thousands='.', decimal=',')`` for '1.234,50'.
+
+    >>> parser = MoneyParser(symbols={u'$': 'CAD'})
+    >>> parser.parse(u'$1,234.50')
+    CAD 1234.50
+    """
+
+    def __init__(self, currency=None, symbols=DEFAULT_SYMBOLS, thousands=',', decimal='.'):
+        if thousands == decimal:
+            raise ValueError("the thousands and decimal separators must differ")
+        self.currency = _get_currency(currency) if currency else None
+        self.thousands = thousands
+        self.decimal = decimal
+        self._symbols = self._symbol_table(symbols or {})
+        self._pattern = self._compile()
+
+    @staticmethod
+    def _symbol_table(symbols):
+        """
+        Maps every known symbol to its Currency, or to None if the symbol is
+        shared by several currencies and ``symbols`` doesn't choose one.
+        """
+        table = {}
+        for symbol in CURRENCY.symbols():
+            currencies = CURRENCY.by_symbol(symbol)
+            table[symbol] = currencies[0] if len(currencies) == 1 else None
+        for symbol, currency in symbols.iteritems():
+            table[symbol] = _get_currency(currency)
+        return table
+
+    def _compile(self):
+        thousands, decimal = re.escape(self.thousands), re.escape(self.decimal)
+        symbols = '|'.join(re.escape(symbol) for symbol in
+                           sorted(self._symbols, key=len, reverse=True))
+        currency = r'(?:(?P<%%s_code>[A-Za-z]{3})|(?P<%%s_symbol>%s))' % (symbols or '(?!)')
+        number = (r'(?P<number>\d{1,3}(?:%(t)s\d{3})+(?:%(d)s\d*)?|\d+(?:%(d)s\d*)?|%(d)s\d+)'
+                  % {'t': thousands, 'd': decimal})
+        return re.compile(
+            r'\s*(?P<open>\()?\s*(?P<sign>[-+])?\s*'
+            r'(?:' + currency % ('pre', 'pre') + r'\s*)?'
+            r'(?P<inner_sign>[-+])?\s*' + number + r'(?P<trailing_sign>-)?'
+            r'\s*(?:' + currency % ('post', 'post') + r')?'
+            r'\s*(?P<close>\))?\s*\Z',
+            re.UNICODE)
+
+    def _currency(self, code, symbol):
+        if code:
+            try:
+                return CURRENCY[code.upper()]
+            except KeyError:
+                raise IncorrectMoneyInputError("unknown currency %r" % code)
+        if symbol:
+            currency = self._symbols[symbol]
+            if currency is None:
+                default = self.currency or get_default_currency()
+                if default.symbol != symbol:
+                    raise IncorrectMoneyInputError("ambiguous currency symbol %r" % symbol)
+                currency = default
+            return currency
+        return self.currency or get_default_currency()
+
+    def match(self, s):
+        """
+        Parses ``s`` and returns an (amount, currency) pair, raising
+        IncorrectMoneyInputError if ``s`` is not a monetary amount.
+        """
+        match = self._pattern.match(s)
+        if match is None:
+            raise IncorrectMoneyInputError("can not parse %r" % (s,))
+        (opening, sign, pre_code, pre_symbol, inner_sign, number, trailing_sign,
+         post_code, post_symbol, closing) = match.groups()
+        if (pre_code or pre_symbol) and (post_code or post_symbol):
+            raise IncorrectMoneyInputError("more than one currency in %r" % (s,))
+        if opening or closing or inner_sign or trailing_sign:
+            if (opening is None) != (closing is None):
+                raise IncorrectMoneyInputError("unbalanced parentheses in %r" % (s,))
+            signs = [x for x in (sign, inner_sign, trailing_sign) if x]
+            if len(signs) + bool(opening) > 1:
+                raise IncorrectMoneyInputError("more than one sign in %r" % (s,))
+            sign = opening and '-' or signs and signs[0]
+
+        if self.thousands in number:
+            number = number.replace(self.thousands, '')
+        if self.decimal != '.':
+            number = number.replace(self.decimal, '.')
+        amount = Decimal(number)
+        if sign == '-':
+            amount = -amount
+        return amount, self._currency(pre_code or post_code, pre_symbol or post_symbol)
+
+    def parse(self, s):
+        """
+        Parses ``s`` into a new Money, raising IncorrectMoneyInputError if
+        ``s`` is not a monetary amount.
+        """
+        amount, currency = self.match(s)
+        return Money._make(amount, currency)
+
+    def parse_many(self, values, errors=None):
+        """
+        Parses every string in ``values`` and yields one Money per string,
+        or None for strings that can't be parsed. If ``errors`` is a list,
+        an (index, value, error) tuple is appended to it for every invalid
+        string. Values are parsed lazily, so ``values`` can be a file or any
+        other stream.
+        """
+        match, make = self.match, Money._make
+        for index, value in enumerate(values):
+            try:
+                amount, currency = match(value)
+            except (IncorrectMoneyInputError, TypeError), error:
+                if errors is not None:
+                    errors.append((index, value, error))
+                yield None
+                continue
+            yield make(amount, currency)
+
+
+# currency code (or None) -> MoneyParser with the default number format,
+# for the currencies of CURRENCY as of version _parsers_version
+_parsers = {}
+_parsers_version = None
+
+def _get_parser(currency):
+    global _parsers_version
+    if _parsers_version != CURRENCY._version:
+        _parsers.clear()
+        _parsers_version = CURRENCY._version
+    code = _get_currency(currency).code if currency else None
+    try:
+        return _parsers[code]
+    except KeyError:
+        parser = _parsers[code] = MoneyParser(code)
+        return parser
+
+
+def parse_money(s, currency=None):
+    """
+    Parses ``s`` into a Money with a MoneyParser for the default number
+    format. ``currency`` is used if ``s`` carries no currency.
+
+    >>> parse_money('1,000.50 EUR')
+    EUR 1000.50
+    """
+    return _get_parser(currency).parse(s)
+
+
+def parse_many(values, currency=None, errors=None):
+    """
+    Parses a stream of strings like parse_money(); see
+    MoneyParser.parse_many().
+    """
+    return _get_parser(currency).parse_many(values, errors)
@@ -0,0 +1,389 @@
+# -*- coding: utf-8 -*-
+"""
+Exchange rate tables.
+
+A RateTable holds one rate per currency against a base currency and answers
+cross-rate queries between any two of them with a single dict lookup; cross
+rates are computed on first use and memoized. The whole set of rates is
+replaced atomically by refresh(), so readers never see a mix of old and new
+rates.
+
+HistoricalRates keeps a time series of rates per currency pair and looks up
+the rate in effect at a given time with a binary search.
+
+convert_many() converts whole arrays of amounts, applying each source
+currency's rate once to all of its amounts.
+"""
+import csv
+from bisect import bisect_right
+from datetime import datetime
+from decimal import Decimal, ROUND_HALF_EVEN
+from itertools import izip
+
+from money import Money, Currency, CURRENCY, get_default_currency, _to_decimal, _get_currency
+from arrays import MoneyArray, numpy, to_minor, from_minor, _rational, _multiply_round
+from rounding import round_amount, get_rounding_policy
+
+__all__ = ('RateTable', 'HistoricalRates', 'UnknownRateError', 'parse_timestamp',
+           'convert_many')
+
+
+class UnknownRateError(KeyError):
+    def __init__(self, from_code, to_code):
+        KeyError.__init__(self, from_code, to_code)
+        self.from_code = from_code
+        self.to_code = to_code
+    def __str__(self):
+        return "No exchange rate from %s to %s" % (self.from_code, self.to_code)
+
+
+def currency_code(currency):
+    """
+    Returns the code of a Currency or currency code, checking that it is a
+    registered currency.
+    """
+    if isinstance(currency, Currency):
+        return currency.code
+    return _get_currency(currency).code
+
+
+class _RateState(object):
+    """
+    One immutable snapshot of a RateTable: the base currency, the rate of
+    every currency against it and the memoized cross rates. RateTable only
+    ever replaces its snapshot as a whole.
+    """
+    __slots__ = ('base', 'rates', 'cross')
+
+    def __init__(self, base, rates):
+        self.base = currency_code(base)
+        self.rates = {self.base: Decimal(1)}
+        for currency, rate in rates.iteritems():
+            rate = _to_decimal(rate)
+            if rate <= 0:
+                raise ValueError("exchange rates must be positive")
+            self.rates[currency_code(currency)] = rate
+        self.cross = {}
+
+
+class RateTable(object):
+    """
+    Exchange rates of several currencies against a base currency.
+
+    ``rates`` maps currencies (or codes) to the number of units of that
+    currency one unit of ``base`` buys:
+
+    >>> table = RateTable('USD', {'EUR': '0.9', 'GBP': '0.8'})
+    >>> table.rate('EUR', 'GBP')
+    Decimal('0.8888888888888888888888888889')
+    >>> Money(9, 'EUR').convert_to('USD', rates=table)
+    USD 10.00
+    """
+
+    def __init__(self, base, rates, precompute=False):
+        self._state = self._build(base, rates, precompute)
+
+    @staticmethod
+    def _build(base, rates, precompute):
+        state = _RateState(base, rates)
+        if precompute:
+            for from_code, from_rate in state.rates.iteritems():
+                for to_code, to_rate in state.rates.iteritems():
+                    state.cross[(from_code, to_code)] = to_rate / from_rate
+        return state
+
+    @property
+    def base(self):
+        return CURRENCY[self._state.base]
+
+    def __contains__(self, currency):
+        return currency_code(currency) in self._state.rates
+
+    def __len__(self):
+        return len(self._state.rates)
+
+    def refresh(self, rates, base=None, precompute=False):
+        """
+        Replaces every rate in the table at once. The new snapshot is built
+        completely before it is swapped in, so concurrent readers see either
+        the old rates or the new ones, never a mix.
+        """
+        if base is None:
+            base = self._state.base
+        self._state = self._build(base, rates, precompute)
+
+    def rate(self, from_currency, to_currency):
+        """
+        Returns the number of units of ``to_currency`` that one unit of
+        ``from_currency`` buys.
+        """
+        state = self._state
+        key = (currency_code(from_currency), currency_code(to_currency))
+        try:
+            return state.cross[key]
+        except KeyError:
+            pass
+        try:
+            rate = state.rates[key[1]] / state.rates[key[0]]
+        except KeyError:
+            raise UnknownRateError(*key)
+        state.cross[key] = rate
+        return rate
+
+    def convert(self, money, currency):
+        """
+        Returns ``money`` converted to ``currency``.
+        """
+        return money.convert_to(currency, rates=self)
+
+
+TIMESTAMP_FORMATS = ('%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S')
+
+def parse_timestamp(value):
+    """
+    Parses an ISO 8601 date or date and time (without time zone) into a
+    datetime.
+    """
+    value = value.strip()
+    for format in TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(value, format)
+        except ValueError:
+            pass
+    raise ValueError("Unrecognized timestamp %r" % value)
+
+
+class HistoricalRates(object):
+    """
+    Exchange rates over time. For every currency pair the rates are kept in
+    timestamp order, and the rate as of a time T is the last one set at or
+    before T. A pair can also be looked up in the opposite direction, in
+    which case the inverse rate is returned.
+
+    Timestamps can be any comparable values (datetimes, dates, epoch
+    seconds) as long as they are used consistently.
+
+    >>> history = HistoricalRates([(date(2010, 1, 1), 'EUR', 'USD', '1.4'),
+    ...                            (date(2010, 6, 1), 'EUR', 'USD', '1.2')])
+    >>> history.rate('EUR', 'USD', date(2010, 3, 15))
+    Decimal('1.4')
+    """
+
+    def __init__(self, rates=()):
+        self._series = {}
+        self.load(rates)
+
+    def __contains__(self, pair):
+        key = (currency_code(pair[0]), currency_code(pair[1]))
+        return key in self._series or (key[1], key[0]) in self._series
+
+    def add(self, from_currency, to_currency, at, rate):
+        """
+        Sets the rate of a currency pair from time ``at`` on, replacing any
+        rate already set for exactly that time.
+        """
+        key = (currency_code(from_currency), currency_code(to_currency))
+        times, values = self._series.setdefault(key, ([], []))
+        rate = _to_decimal(rate)
+        i = bisect_right(times, at)
+        if i and times[i - 1] == at:
+            values[i - 1] = rate
+        else:
+            times.insert(i, at)
+            values.insert(i, rate)
+
+    def load(self, rates):
+        """
+        Bulk loads (at, from_currency, to_currency, rate) tuples. Every pair
+        is sorted once after loading rather than kept sorted row by row.
+        Later rows win over earlier ones for the same pair and time.
+        """
+        loaded = {}
+        for at, from_currency, to_currency, rate in rates:
+            key = (currency_code(from_currency), currency_code(to_currency))
+            loaded.setdefault(key, []).append((at, _to_decimal(rate)))
+        for key, rows in loaded.iteritems():
+            if key in self._series:
+                rows = zip(*self._series[key]) + rows
+            # sort() is stable: for equal times the later row comes last
+            rows.sort(key=lambda row: row[0])
+            times, values = [], []
+            for at, rate in rows:
+                if times and times[-1] == at:
+                    values[-1] = rate
+                else:
+                    times.append(at)
+                    values.append(rate)
+            self._series[key] = (times, values)
+
+    def load_csv(self, f, delimiter=',', header=True, parse_time=parse_timestamp):
+        """
+        Bulk loads rates from a CSV file object with timestamp, from currency,
+        to currency and rate columns. Timestamps are parsed with
+        ``parse_time``; by default ISO 8601 dates and times are accepted.
+        Blank lines are skipped.
+        """
+        reader = csv.reader(f, delimiter=delimiter)
+        if header:
+            next(reader, None)
+        self.load((parse_time(at), from_code, to_code, rate.strip())
+                  for at, from_code, to_code, rate in (row for row in reader if any(row)))
+
+    def _lookup(self, from_code, to_code):
+        """
+        Returns (times, rates, inverted) for a pair, using the series of the
+        opposite pair if only that one is known.
+        """
+        try:
+            times, values = self._series[(from_code, to_code)]
+            return times, values, False
+        except KeyError:
+            pass
+        try:
+            times, values = self._series[(to_code, from_code)]
+            return times, values, True
+        except KeyError:
+            raise UnknownRateError(from_code, to_code)
+
+    def rate(self, from_currency, to_currency, at=None):
+        """
+        Returns the rate from ``from_currency`` to ``to_currency`` in effect
+        at time ``at``, or the latest rate if ``at`` is None. The latter
+        lets a HistoricalRates stand in for a RateTable, e.g. as the default
+        store of set_default_rates().
+        """
+        from_code, to_code = currency_code(from_currency), currency_code(to_currency)
+        if from_code == to_code:
+            return Decimal(1)
+        times, values, inverted = self._lookup(from_code, to_code)
+        i = len(times) if at is None else bisect_right(times, at)
+        if not i:
+            raise UnknownRateError(from_code, to_code)
+        if inverted:
+            return 1 / values[i - 1]
+        return values[i - 1]
+
+    def rates_at(self, from_currency, to_currency, times):
+        """
+        Returns the rates of one currency pair at each of ``times``, in the
+        same order. The queries are sorted once and merged with the rate
+        series instead of being searched for one by one.
+        """
+        from_code, to_code = currency_code(from_currency), currency_code(to_currency)
+        if from_code == to_code:
+            return [Decimal(1)] * len(times)
+        series, values, inverted = self._lookup(from_code, to_code)
+        result = [None] * len(times)
+        inverses = {}
+        j, count = 0, len(series)
+        for i in sorted(xrange(len(times)), key=times.__getitem__):
+            at = times[i]
+            while j < count and series[j] <= at:
+                j += 1
+            if not j:
+                raise UnknownRateError(from_code, to_code)
+            if inverted:
+                try:
+                    result[i] = inverses[j]
+                except KeyError:
+                    result[i] = inverses[j] = 1 / values[j - 1]
+            else:
+                result[i] = values[j - 1]
+        return result
+
+    def convert_at(self, moneys, currency, times):
+        """
+        Converts every Money in ``moneys`` to ``currency`` at the matching
+        time in ``times``. Queries are grouped by source currency and each
+        group is resolved with rates_at().
+        """
+        currency = _get_currency(currency)
+        moneys = list(moneys)
+        times = list(times)
+        groups = {}
+        for i, money in enumerate(moneys):
+            groups.setdefault(money.currency.code, []).append(i)
+        result = [None] * len(moneys)
+        for code, indexes in groups.iteritems():
+            rates = self.rates_at(code, currency, [times[i] for i in indexes])
+            for i, rate in izip(indexes, rates):
+                money = moneys[i]
+                result[i] = money._make(money.amount * rate, currency)
+        return result
+
+
+def convert_many(amounts, from_currencies, to_currency, rates):
+    """
+    Converts many amounts to ``to_currency`` with the rate store ``rates``
+    (anything with a ``rate(from_currency, to_currency)`` method, such as a
+    RateTable). Results are rounded according to the rounding policy of
+    ``to_currency`` (see money.rounding; by default half to even to
+    ``Currency.decimals``).
+
+    ``amounts`` is a sequence of amounts in major units (anything Money
+    accepts) with ``from_currencies`` either a parallel sequence of
+    currencies or a single currency for all of them; a list of Money is
+    returned. The amounts are grouped by source currency and each group is
+    converted with a single rate lookup.
+
+    ``amounts`` can also be a MoneyArray (``from_currencies`` is then
+    ignored), in which case a MoneyArray is returned. Each currency's block
+    is multiplied by the rate as an integer fraction, in int64 where the
+    product fits, and rounded half to even like the Decimal path. Rates
+    with more digits, such as computed cross rates, are applied through a
+    float64 estimate, and only amounts close to a rounding tie are
+    recomputed exactly. Target currencies with another rounding policy are
+    converted element by element through Decimal. Amounts already in
+    ``to_currency`` need no rate.
+    """
+    to_currency = _get_currency(to_currency)
+    if isinstance(amounts, MoneyArray):
+        return _convert_array(amounts, to_currency, rates)
+
+    if from_currencies is None or isinstance(from_currencies, (Currency, basestring)):
+        currency = _get_currency(from_currencies) if from_currencies else get_default_currency()
+        groups = {currency.code: range(len(amounts))}
+    else:
+        groups = {}
+        for i, currency in enumerate(from_currencies):
+            groups.setdefault(currency, []).append(i)
+
+    result = [None] * len(amounts)
+    for currency, indexes in groups.iteritems():
+        currency = _get_currency(currency)
+        if currency == to_currency:
+            rate = Decimal(1)
+        else:
+            rate = rates.rate(currency, to_currency)
+        for i in indexes:
+            amount = amounts[i]
+            if not isinstance(amount, Decimal):
+                amount = _to_decimal(amount or 0)
+            result[i] = Money._make(round_amount(amount * rate, to_currency), to_currency)
+    return result
+
+
+def _convert_array(array, to_currency, rates):
+    """
+    convert_many() for a MoneyArray: one exact multiply per source currency
+    block.
+    """
+    if array.codes is None:
+        blocks = [(array.currency, slice(None))]
+    else:
+        blocks = [(CURRENCY[code], array.codes == code) for code in numpy.unique(array.codes)]
+    policy = get_rounding_policy(to_currency.code)
+    exact = policy.rounding == ROUND_HALF_EVEN and policy.decimals is None and policy.increment is None
+    minor = numpy.empty(len(array), dtype=numpy.int64)
+    for currency, index in blocks:
+        if currency == to_currency:
+            rate = Decimal(1)
+        else:
+            rate = rates.rate(currency, to_currency)
+        if exact:
+            numerator, denominator = _rational(rate.scaleb(to_currency.decimals - currency.decimals))
+            minor[index] = _multiply_round(array.minor[index], numerator, denominator)
+        else:
+            minor[index] = [to_minor(round_amount(from_minor(value, currency) * rate, to_currency), to_currency)
+                            for value in array.minor[index].tolist()]
+    return MoneyArray._make(minor, to_currency, None)
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Per-currency rounding policies.
+
+A RoundingPolicy says how amounts of a currency are rounded: the Decimal
+rounding mode, the number of decimals (by default ``Currency.decimals``) and
+optionally a cash rounding increment such as 0.05 CHF. The quantize exponent
+and settings of every currency are computed once and cached, so rounding an
+amount costs a dict lookup plus the quantize itself.
+"""
+from decimal import Decimal, ROUND_HALF_EVEN
+
+__all__ = ('RoundingPolicy', 'set_rounding_policy', 'get_rounding_policy',
+           'clear_quantizer_cache', 'round_amount')
+
+
+class RoundingPolicy(object):
+    """
+    How to round amounts of a currency. ``decimals`` defaults to the
+    currency's own decimals; ``increment`` rounds to a multiple of a cash
+    unit (e.g. ``RoundingPolicy(increment='0.05')``).
+    """
+    __slots__ = ('rounding', 'decimals', 'increment')
+
+    def __init__(self, rounding=ROUND_HALF_EVEN, decimals=None, increment=None):
+        self.rounding = rounding
+        self.decimals = decimals
+        if increment is not None:
+            increment = Decimal(str(increment))
+            if increment <= 0:
+                raise ValueError("the rounding increment must be positive")
+        self.increment = increment
+
+    def round(self, amount, currency):
+        """
+        Rounds the Decimal ``amount`` of ``currency`` with this policy.
+        """
+        decimals = currency.decimals if self.decimals is None else self.decimals
+        return _round(amount, Decimal(1).scaleb(-decimals), self.rounding, self.increment)
+
+    def __repr__(self):
+        return 'RoundingPolicy(rounding=%r, decimals=%r, increment=%r)' % (
+            self.rounding, self.decimals, self.increment)
+
+DEFAULT_ROUNDING_POLICY = RoundingPolicy()
+
+ROUNDING_POLICIES = {}
+
+# currency code -> (exponent, rounding mode, increment)
+_quantizers = {}
+
+
+def set_rounding_policy(code, policy=None):
+    """
+    Sets the rounding policy of the currency with the given code, or
+    restores the default policy if ``policy`` is None.
+    """
+    if policy is None:
+        ROUNDING_POLICIES.pop(code, None)
+    else:
+        ROUNDING_POLICIES[code] = policy
+    _quantizers.pop(code, None)
+
+
+def get_rounding_policy(code):
+    return ROUNDING_POLICIES.get(code, DEFAULT_ROUNDING_POLICY)
+
+
+def clear_quantizer_cache():
+    """
+    Forgets the cached quantizers, e.g. after a currency's decimals changed.
+    """
+    _quantizers.clear()
+
+
+def _round(amount, exponent, rounding, increment):
+    if increment is not None:
+        amount = (amount / increment).to_integral_value(rounding) * increment
+    return amount.quantize(exponent, rounding)
+
+
+def _quantizer(currency):
+    policy = get_rounding_policy(currency.code)
+    decimals = policy.decimals
+    if decimals is None:
+        decimals = currency.decimals
+    quantizer = (Decimal(1).scaleb(-decimals), policy.rounding, policy.increment)
+    _quantizers[currency.code] = quantizer
+    return quantizer
+
+
+def round_amount(amount, currency):
+    """
+    Rounds the Decimal ``amount`` according to the rounding policy of
+    ``currency``.
+    """
+    try:
+        exponent, rounding, increment = _quantizers[currency.code]
+    except KeyError:
+        exponent, rounding, increment = _quantizer(currency)
+    if increment is None:
+        return amount.quantize(exponent, rounding)
+    return _round(amount, exponent, rounding, increment)
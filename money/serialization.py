@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Exact JSON and msgpack serialization of Money.
+
+In JSON a Money is the object ``{"amount": "10.50", "currency": "USD"}``
+with the amount as a string, so no precision is lost to floats. In msgpack
+it is an extension type (code MSGPACK_EXT_TYPE) holding the currency code
+and the amount as a string, separated by a space.
+
+The encoder and decoder hooks plug into the ``json`` and ``msgpack``
+modules. dumps_many()/loads_many() and packb_many()/unpackb_many() handle
+whole lists of Money without building an intermediate dict per value;
+packb_many() stores the codes and amounts as two columns. msgpack is an
+optional dependency.
+"""
+import json
+from decimal import Decimal
+
+from money import Money, _get_currency
+from optional import msgpack
+
+__all__ = ('MoneyJSONEncoder', 'money_object_hook', 'dumps', 'loads', 'dumps_many',
+           'loads_many', 'msgpack_default', 'msgpack_ext_hook', 'packb', 'unpackb',
+           'packb_many', 'unpackb_many')
+
+MSGPACK_EXT_TYPE = 77
+
+
+class MoneyJSONEncoder(json.JSONEncoder):
+    """
+    A JSONEncoder that encodes Money (and any other JSON-serializable value)
+    and plain Decimals, the latter as strings.
+
+    >>> json.dumps({'price': Money('9.99', 'USD')}, cls=MoneyJSONEncoder)
+    '{"price": {"amount": "9.99", "currency": "USD"}}'
+    """
+
+    def default(self, obj):
+        if isinstance(obj, Money):
+            return {'amount': str(obj.amount), 'currency': obj.currency.code}
+        if isinstance(obj, Decimal):
+            return str(obj)
+        return json.JSONEncoder.default(self, obj)
+
+
+def money_object_hook(obj):
+    """
+    A ``json.loads`` object hook that turns encoded Money objects back into
+    Money and leaves every other object alone.
+    """
+    if len(obj) == 2 and 'amount' in obj and 'currency' in obj:
+        return Money._make(Decimal(obj['amount']), _get_currency(obj['currency']))
+    return obj
+
+
+def dumps(obj, **kwargs):
+    """
+    json.dumps() with Money support.
+    """
+    return json.dumps(obj, cls=MoneyJSONEncoder, **kwargs)
+
+
+def loads(s, **kwargs):
+    """
+    json.loads() with Money support.
+    """
+    return json.loads(s, object_hook=money_object_hook, **kwargs)
+
+
+def dumps_many(moneys):
+    """
+    Encodes a sequence of Money as a JSON array. The array is built with
+    string formatting alone; amounts and currency codes never need escaping.
+    """
+    return '[%s]' % ','.join(['{"amount":"%s","currency":"%s"}' % (money.amount, money.currency.code)
+                              for money in moneys])
+
+
+def loads_many(s):
+    """
+    Decodes a JSON array of encoded Money into a list of Money. Each
+    currency code is looked up once.
+    """
+    currencies = {}
+    result = []
+    for obj in json.loads(s):
+        code = obj['currency']
+        try:
+            currency = currencies[code]
+        except KeyError:
+            currency = currencies[code] = _get_currency(code)
+        result.append(Money._make(Decimal(obj['amount']), currency))
+    return result
+
+
+def msgpack_default(obj):
+    """
+    A ``default`` hook for msgpack.packb() that encodes Money as an
+    extension type.
+    """
+    if isinstance(obj, Money):
+        return msgpack.ExtType(MSGPACK_EXT_TYPE, ('%s %s' % (obj.currency.code, obj.amount)).encode('utf-8'))
+    raise TypeError("can not serialize %r" % (obj,))
+
+
+def msgpack_ext_hook(code, data):
+    """
+    An ``ext_hook`` for msgpack.unpackb() that decodes Money.
+    """
+    if code == MSGPACK_EXT_TYPE:
+        code, amount = data.split(' ', 1)
+        return Money._make(Decimal(amount), _get_currency(code.decode('utf-8')))
+    return msgpack.ExtType(code, data)
+
+
+def packb(obj, **kwargs):
+    """
+    msgpack.packb() with Money support.
+    """
+    return msgpack.packb(obj, default=msgpack_default, use_bin_type=True, **kwargs)
+
+
+def unpackb(data, **kwargs):
+    """
+    msgpack.unpackb() with Money support.
+    """
+    return msgpack.unpackb(data, ext_hook=msgpack_ext_hook, raw=False, **kwargs)
+
+
+def packb_many(moneys):
+    """
+    Encodes a sequence of Money for unpackb_many(). The values are stored
+    column-wise, as a msgpack array of two arrays: the currency codes and
+    the amounts as strings. This avoids an extension object per value.
+    """
+    codes, amounts = [], []
+    for money in moneys:
+        codes.append(money.currency.code)
+        amounts.append(str(money.amount))
+    return msgpack.packb([codes, amounts], use_bin_type=True)
+
+
+def unpackb_many(data):
+    """
+    Decodes the output of packb_many() into a list of Money. Each currency
+    code is looked up once.
+    """
+    codes, amounts = msgpack.unpackb(data, raw=False)
+    currencies = {}
+    result = []
+    for code, amount in zip(codes, amounts):
+        try:
+            currency = currencies[code]
+        except KeyError:
+            currency = currencies[code] = _get_currency(code)
+        result.append(Money._make(Decimal(amount), currency))
+    return result
@@ -5,7 +5,7 @@ from money import Money
 
 class TestMoneyModel(models.Model):
     name = models.CharField(max_length=100)
-    price = MoneyField(max_digits=12, decimal_places=3)
+    price = MoneyField(max_digits=12, decimal_places=3, currency_index=True)
 
     def __unicode__(self):
         return self.name + " " + str(self.price)
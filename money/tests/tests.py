@@ -1,8 +1,40 @@
+import copy
+import json
+import os
+import pickle
+import random
+import shutil
+import struct
+import tempfile
+from datetime import date, datetime
+from decimal import Decimal, ROUND_UP
+from StringIO import StringIO
+
+from django.db import connection
+from django.db.models import get_app
+from django.db.models import Q, Sum, Avg, Min, Max, Count
 from django.test import TestCase
+from django.utils.unittest import skipIf
 
 from money.tests.models import TestMoneyModel, TestMoneyModel_0_USD, TestMoneyModel_USD
-from money.contrib.django.models.fields import NotSupportedLookup
-from money import Money, CURRENCY
+from money.contrib.django.models.fields import NotSupportedLookup, sql_money_indexes, create_money_indexes
+from money import set_default_rates, set_auto_rounding, RoundingPolicy, set_rounding_policy, get_rounding_policy, Money, FrozenMoney, MoneyCache, interned, Currency, CURRENCY, CURRENCY_BY_COUNTRY, LazyRegistry, \
+    IncorrectMoneyInputError
+from money import iso4217
+from money.money import CurrencyRegistry
+from money.parsing import MoneyParser, parse_money, parse_many
+from money.io import read_batches
+from money.columnar import ColumnarWriter, ColumnarFile, write_columns
+from money import serialization
+from money import formatting
+from money import arrow
+from money.words import number_to_words, spell_out_many
+from money.formatting import LOCALES, register_locale, set_default_locale, format_money, format_many
+from money.optional import msgpack, pyarrow, parquet
+from money.arrays import MoneyArray, numpy
+from money.allocation import allocate_minor, allocate_minor_many
+from money.rates import RateTable, HistoricalRates, UnknownRateError, convert_many
+from money.aggregate import sum_by_currency, group_sum, group_sum_arrays
 
 
 class MoneyTestCase(TestCase):
@@ -29,6 +61,832 @@ class MoneyTestCase(TestCase):
         # But not different currencies
         self.assertFalse(ten_bucks == juu_en)
 
+    def testSlots(self):
+        usd = Money(10, 'USD')
+        self.assertFalse(hasattr(usd, '__dict__'))
+        self.assertFalse(hasattr(usd.currency, '__dict__'))
+        self.assertRaises(AttributeError, setattr, usd, 'foo', 1)
+
+        # Money is mutable and stays unhashable, Currency hashes by code
+        self.assertRaises(TypeError, hash, usd)
+        self.assertEqual(len(set([CURRENCY['USD'], Currency(code='USD')])), 1)
+
+    def testCoercion(self):
+        self.assertEqual(Money(10, 'USD').amount, Decimal('10'))
+        self.assertEqual(Money(0.1, 'USD').amount, Decimal('0.1'))
+        # str() would have truncated this to 12 significant digits
+        self.assertEqual(Money(1234567890.123456, 'USD').amount, Decimal('1234567890.123456'))
+        self.assertEqual(Money(10, u'usd').currency, CURRENCY['USD'])
+
+        usd = Money(10, 'USD')
+        self.assertEqual(usd + 0.1, Money('10.1', 'USD'))
+        self.assertEqual(usd * 3, Money(30, 'USD'))
+        self.assertEqual(5 % usd, Money('0.5', 'USD'))
+        self.assertTrue(usd > 9.99)
+        self.assertTrue(type(-usd) is Money)
+
+    def testPickle(self):
+        usd = Money('10.50', 'USD')
+        self.assertEqual(pickle.loads(pickle.dumps(usd)), usd)
+        self.assertEqual(pickle.loads(pickle.dumps(usd, 2)), usd)
+        self.assertEqual(pickle.loads(pickle.dumps(CURRENCY['EUR'])).name, 'Euro')
+
+    def testOldPickles(self):
+        # Money('10.50', 'XXX') pickled by the old-style classes of python-money 0.2
+        protocol0 = ("(imoney.money\nMoney\np0\n(dp1\nS'currency'\np2\n(imoney.money\nCurrency\np3\n"
+                     "(dp4\nS'code'\np5\nS'XXX'\np6\nsS'name'\np7\ng6\nsS'countries'\np8\n(lp9\n"
+                     "sS'symbol'\np10\nV\np11\nsS'numeric'\np12\nS'999'\np13\nsS'decimals'\np14\nI2\n"
+                     "sbsS'amount'\np15\ncdecimal\nDecimal\np16\n(S'10.50'\np17\ntp18\nRp19\nsb.")
+        protocol2 = ('\x80\x02(cmoney.money\nMoney\nq\x00oq\x01}q\x02(U\x08currencyq\x03(cmoney.money\n'
+                     'Currency\nq\x04oq\x05}q\x06(U\x04codeq\x07U\x03XXXq\x08U\x04nameq\th\x08U\t'
+                     'countriesq\n]q\x0bU\x06symbolq\x0cX\x00\x00\x00\x00q\rU\x07numericq\x0eU\x03999q'
+                     '\x0fU\x08decimalsq\x10K\x02ubU\x06amountq\x11cdecimal\nDecimal\nq\x12U\x0510.50q'
+                     '\x13\x85q\x14Rq\x15ub.')
+        for data in (protocol0, protocol2):
+            money = pickle.loads(data)
+            self.assertEqual(money.amount, Decimal('10.50'))
+            self.assertEqual(money.currency, CURRENCY['XXX'])
+            self.assertEqual((money.currency.numeric, money.currency.decimals), ('999', 2))
+            self.assertEqual(money.currency.exchange_rate, Decimal('1.0'))
+
+
+class CurrencyRegistryTestCase(TestCase):
+
+    def tearDown(self):
+        CURRENCY.pop('ZZZ', None)
+
+    def testLazyRegistry(self):
+        registry = LazyRegistry({'a': 1, 'b': 2}, lambda key, value: value * 10)
+        self.assertEqual(registry['a'], 10)
+        self.assertTrue('b' in registry)
+        self.assertEqual(registry.get('c', 'missing'), 'missing')
+        del registry['b']
+        self.assertRaises(KeyError, lambda: registry['b'])
+        registry['c'] = 3
+        self.assertEqual(sorted(registry.items()), [('a', 10), ('c', 3)])
+
+    def testFreshRegistryAsMapping(self):
+        registry = CurrencyRegistry(iso4217.CURRENCIES)
+        registry['USD']
+        self.assertEqual(len(dict(registry)), len(iso4217.CURRENCIES))
+        copied = {}
+        copied.update(registry)
+        self.assertEqual(len(copied), len(iso4217.CURRENCIES))
+        registry = CurrencyRegistry(iso4217.CURRENCIES)
+        self.assertEqual(len(copy.copy(registry)), len(iso4217.CURRENCIES))
+        self.assertEqual(len(registry.viewkeys()), len(iso4217.CURRENCIES))
+        self.assertEqual(set(registry.viewkeys()), set(iso4217.CURRENCIES))
+        self.assertEqual(dict(registry.viewitems())['EUR'].name, 'Euro')
+        restored = pickle.loads(pickle.dumps(registry, 2))
+        self.assertTrue(isinstance(restored, CurrencyRegistry))
+        self.assertEqual(restored['JPY'].decimals, 0)
+        self.assertEqual(restored.by_numeric(978).code, 'EUR')
+        self.assertEqual(dict(registry), registry)
+
+    def testLookups(self):
+        self.assertTrue(CURRENCY['USD'] is CURRENCY['USD'])
+        self.assertEqual(CURRENCY_BY_COUNTRY['DK'], CURRENCY['DKK'])
+        self.assertEqual(CURRENCY.by_numeric('840'), CURRENCY['USD'])
+        self.assertEqual(CURRENCY.by_numeric(36), CURRENCY['AUD'])
+        self.assertRaises(KeyError, CURRENCY.by_numeric, '000')
+        self.assertEqual(CURRENCY.by_country('Greenland'), [CURRENCY['DKK']])
+        self.assertEqual(CURRENCY.by_country('Atlantis'), [])
+        self.assertEqual([c.code for c in CURRENCY.by_symbol(u'$')], ['AUD', 'CAD', 'USD'])
+
+    def testIsoDecimals(self):
+        for code in ('BIF', 'DJF', 'GNF', 'ISK', 'JPY', 'KMF', 'KRW', 'PYG', 'RWF', 'UGX', 'VND', 'VUV', 'XPF'):
+            self.assertEqual(CURRENCY[code].decimals, 0, code)
+        for code in ('BHD', 'IQD', 'JOD', 'KWD', 'LYD', 'OMR', 'TND'):
+            self.assertEqual(CURRENCY[code].decimals, 3, code)
+        self.assertEqual(Money('1.2345', 'KWD').round().amount, Decimal('1.234'))
+        self.assertEqual(Money('1500.5', 'KRW').round().amount, Decimal('1500'))
+
+    def testCustomCurrency(self):
+        CURRENCY['ZZZ'] = Currency(code='ZZZ', numeric='001', symbol=u'Z', countries=['Nowhere'])
+        self.assertEqual(CURRENCY.by_numeric(1).code, 'ZZZ')
+        self.assertEqual(CURRENCY.by_symbol(u'Z'), [CURRENCY['ZZZ']])
+        self.assertEqual(CURRENCY.by_country('NOWHERE'), [CURRENCY['ZZZ']])
+        CURRENCY['ZZZ'] = Currency(code='ZZZ', numeric='002', countries=['USA'])
+        self.assertRaises(KeyError, CURRENCY.by_numeric, 1)
+        self.assertEqual(CURRENCY.by_symbol(u'Z'), [])
+        self.assertEqual(CURRENCY.by_numeric(2).code, 'ZZZ')
+        del CURRENCY['ZZZ']
+        self.assertRaises(KeyError, CURRENCY.by_numeric, 2)
+        self.assertEqual(CURRENCY.by_country('USA'), [])
+
+
+class ParsingTestCase(TestCase):
+
+    def testFormats(self):
+        for value, expected in [('USD 10.00', Money('10.00', 'USD')),
+                                ('10.00 usd', Money('10.00', 'USD')),
+                                ('EUR10', Money(10, 'EUR')),
+                                (u'$1,234.50', Money('1234.50', 'USD')),
+                                (u'\xa3 3', Money(3, 'GBP')),
+                                (u'10 \u0440\u0443\u0431', Money(10, 'RUB')),
+                                ('-USD 10', Money(-10, 'USD')),
+                                ('USD -10', Money(-10, 'USD')),
+                                ('(USD 1,000.00)', Money(-1000, 'USD')),
+                                ('10.50- EUR', Money('-10.50', 'EUR')),
+                                (' .5 ', Money('0.5', 'XXX'))]:
+            self.assertEqual(parse_money(value), expected, value)
+        self.assertEqual(parse_money('7', 'JPY'), Money(7, 'JPY'))
+        self.assertEqual(parse_money('USD 7', 'JPY'), Money(7, 'USD'))
+
+    def testInvalid(self):
+        for value in ['', 'USD', '1,23', '--1', '(1', '-(1)', 'USD 1 EUR', 'ABC 1', '1.2.3']:
+            self.assertRaises(IncorrectMoneyInputError, parse_money, value)
+
+    def testParser(self):
+        parser = MoneyParser('EUR', symbols={u'$': 'CAD'}, thousands='.', decimal=',')
+        self.assertEqual(parser.parse(u'$1.234,5'), Money('1234.5', 'CAD'))
+        self.assertEqual(parser.parse('2,25'), Money('2.25', 'EUR'))
+        self.assertRaises(IncorrectMoneyInputError, MoneyParser(symbols={}).parse, u'$1')
+        self.assertEqual(MoneyParser('AUD', symbols={}).parse(u'$1'), Money(1, 'AUD'))
+
+    def testParseMany(self):
+        errors = []
+        values = iter(['USD 1', 'nonsense', None, '2 EUR'])
+        result = list(parse_many(values, 'JPY', errors=errors))
+        self.assertEqual(result, [Money(1, 'USD'), None, None, Money(2, 'EUR')])
+        self.assertEqual([(index, value) for index, value, error in errors], [(1, 'nonsense'), (2, None)])
+        self.assertEqual(list(parse_many(['3'], 'JPY')), [Money(3, 'JPY')])
+
+    def testFromString(self):
+        price = Money(1, 'USD')
+        price.from_string('(GBP 2.50)')
+        self.assertEqual(price, Money('-2.50', 'GBP'))
+        self.assertRaises(IncorrectMoneyInputError, price.from_string, 'GBP')
+        price.from_string(Decimal('3.5'))
+        self.assertEqual(price, Money('3.5', 'XXX'))
+        price.from_string(7)
+        self.assertEqual(price, Money(7, 'XXX'))
+        self.assertRaises(IncorrectMoneyInputError, price.from_string, None)
+
+    def testRegisteredCurrency(self):
+        self.assertRaises(IncorrectMoneyInputError, parse_money, u'\xa4 5')
+        CURRENCY['ZZZ'] = Currency(code='ZZZ', symbol=u'\xa4')
+        try:
+            self.assertEqual(parse_money(u'\xa4 5'), Money(5, 'ZZZ'))
+            self.assertEqual(parse_money('zzz 5'), Money(5, 'ZZZ'))
+            CURRENCY['ZZZ'] = Currency(code='ZZZ', symbol=u'\xa5\xa5')
+            self.assertRaises(IncorrectMoneyInputError, parse_money, u'\xa4 5')
+            self.assertEqual(parse_money(u'\xa5\xa5 5').currency, CURRENCY['ZZZ'])
+        finally:
+            del CURRENCY['ZZZ']
+        self.assertRaises(IncorrectMoneyInputError, parse_money, 'ZZZ 5')
+
+    def testLazySymbolTable(self):
+        registry = CurrencyRegistry(iso4217.CURRENCIES)
+        self.assertTrue(u'\u20ac' in registry.symbols())
+        self.assertEqual(len(registry._data), 0)
+
+
+class ReadBatchesTestCase(TestCase):
+
+    LEDGER = ("id,amount,currency\n"
+              "1,10.50,USD\n"
+              "2,-3,eur\n"
+              "3,oops,USD\n"
+              "4,1,XYZ\n"
+              "5,7,JPY\n"
+              "6,1.005,USD\n"
+              "7,2.5e1,USD\n")
+
+    def testMoneyBatches(self):
+        errors = []
+        batches = list(read_batches(StringIO(self.LEDGER), batch_size=3, arrays=False, errors=errors))
+        self.assertEqual(batches, [[Money('10.50', 'USD'), Money(-3, 'EUR')],
+                                   [Money(7, 'JPY'), Money('1.005', 'USD')],
+                                   [Money(25, 'USD')]])
+        self.assertEqual([(number, row[0]) for number, row, error in errors], [(2, '3'), (3, '4')])
+
+    @skipIf(not numpy, "numpy is not installed")
+    def testArrayBatches(self):
+        errors = []
+        batches = list(read_batches(StringIO(self.LEDGER), batch_size=4, errors=errors))
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(batches[0].to_money(), [Money('10.50', 'USD'), Money(-3, 'EUR')])
+        self.assertEqual(list(batches[0].codes), ['USD', 'EUR'])
+        self.assertEqual(batches[1].to_money(), [Money(7, 'JPY'), Money(25, 'USD')])
+        self.assertEqual([number for number, row, error in errors], [2, 3, 5])
+
+    @skipIf(not numpy, "numpy is not installed")
+    def testColumns(self):
+        batches = list(read_batches(StringIO("1\t2.5\n2\t3\n"), 1, None, 'EUR',
+                                    delimiter='\t', header=False))
+        self.assertEqual(batches[0].to_money(), [Money('2.5', 'EUR'), Money(3, 'EUR')])
+        self.assertRaises(ValueError, list, read_batches(StringIO(self.LEDGER), amount_column='price'))
+
+    def testOutOfRangeAmounts(self):
+        ledger = "amount,currency\n1,USD\ninf,USD\n-Infinity,USD\nnan,USD\n%d,USD\n2,USD\n" % 2 ** 62
+        for arrays in ((False, True) if numpy else (False,)):
+            errors = []
+            batches = list(read_batches(StringIO(ledger), arrays=arrays, errors=errors))
+            moneys = [money for batch in batches for money in batch]
+            self.assertEqual(moneys[0], Money(1, 'USD'))
+            self.assertEqual(moneys[-1], Money(2, 'USD'))
+            self.assertEqual([number for number, row, error in errors], [1, 2, 3, 4] if arrays else [1, 2, 3])
+
+
+@skipIf(not numpy, "numpy is not installed")
+class ColumnarTestCase(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'ledger.money')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        CURRENCY.pop('ZZZ', None)
+
+    def testRoundTrip(self):
+        with ColumnarWriter(self.path) as writer:
+            writer.write(MoneyArray.from_amounts(['1.50', '-2'], 'USD'))
+            writer.write(MoneyArray([100, 7, 250], ['EUR', 'JPY', 'USD']))
+            writer.write([Money(3, 'JPY')])
+        ledger = ColumnarFile(self.path)
+        self.assertEqual(len(ledger), 6)
+        self.assertEqual(ledger.codes, ['USD', 'EUR', 'JPY'])
+        self.assertEqual(list(ledger.minor), [150, -200, 100, 7, 250, 3])
+        self.assertEqual(list(ledger.indexes), [0, 0, 1, 2, 0, 2])
+        self.assertFalse(ledger.minor.flags.writeable)
+        self.assertEqual(ledger[3], Money(7, 'JPY'))
+        self.assertEqual(ledger[1:3].to_money(), [Money(-2, 'USD'), Money(1, 'EUR')])
+        self.assertEqual(ledger.sum_by_currency(),
+                         {'USD': Money(2, 'USD'), 'EUR': Money(1, 'EUR'), 'JPY': Money(10, 'JPY')})
+        array = ledger.to_array()
+        ledger.close()
+        self.assertEqual(array.to_money()[-1], Money(3, 'JPY'))
+
+    def testWriteColumns(self):
+        write_columns(self.path, [Money(1, 'GBP'), Money('2.5', 'GBP')])
+        with ColumnarFile(self.path) as ledger:
+            self.assertEqual(ledger.to_array().currency, CURRENCY['GBP'])
+            self.assertEqual(ledger.sum_by_currency(), {'GBP': Money('3.5', 'GBP')})
+        write_columns(self.path, [])
+        with ColumnarFile(self.path) as ledger:
+            self.assertEqual(len(ledger), 0)
+            self.assertEqual(ledger.sum_by_currency(), {})
+
+    def testChangedDecimals(self):
+        CURRENCY['ZZZ'] = Currency(code='ZZZ', decimals=2)
+        write_columns(self.path, [Money('1.50', 'ZZZ'), Money(2, 'ZZZ'), Money(1, 'USD')])
+        CURRENCY['ZZZ'] = Currency(code='ZZZ', decimals=3)
+        with ColumnarFile(self.path) as ledger:
+            self.assertEqual(ledger.decimals, [2, 2])
+            self.assertEqual(ledger[0], Money('1.5', 'ZZZ'))
+            self.assertEqual(list(ledger.to_array().minor), [1500, 2000, 100])
+            self.assertEqual(ledger.sum_by_currency()['ZZZ'], Money('3.5', 'ZZZ'))
+        CURRENCY['ZZZ'] = Currency(code='ZZZ', decimals=0)
+        with ColumnarFile(self.path) as ledger:
+            self.assertEqual(ledger[0], Money('1.5', 'ZZZ'))
+            self.assertRaises(ValueError, ledger.to_array)
+            self.assertEqual(ledger[1:].to_money(), [Money(2, 'ZZZ'), Money(1, 'USD')])
+
+    def testVersion(self):
+        with open(self.path, 'wb') as f:
+            f.write(struct.pack('<8sHHIQ', 'PYMONEY\0', 1, 0, 1, 1) + '\0' * 8)
+            f.write(struct.pack('<qH', 150, 0) + 'USD')
+        self.assertRaises(ValueError, ColumnarFile, self.path)
+
+    def testExactTotals(self):
+        write_columns(self.path, MoneyArray([2 ** 62, 2 ** 62, -1, 5], ['USD', 'USD', 'EUR', 'EUR']))
+        with ColumnarFile(self.path) as ledger:
+            totals = ledger.sum_by_currency()
+        self.assertEqual(totals['USD'].amount, Decimal(2 ** 63).scaleb(-2))
+        self.assertEqual(totals['EUR'], Money('0.04', 'EUR'))
+
+    def testInvalidFile(self):
+        with open(self.path, 'wb') as f:
+            f.write('id,amount,currency\n' * 4)
+        self.assertRaises(ValueError, ColumnarFile, self.path)
+        write_columns(self.path, MoneyArray([1, 2], 'USD'))
+        with open(self.path, 'r+b') as f:
+            f.truncate(40)
+        self.assertRaises(ValueError, ColumnarFile, self.path)
+
+
+class SerializationTestCase(TestCase):
+
+    MONEYS = [Money('10.50', 'USD'), Money('-1.234', 'KWD'), Money(7, 'JPY'), Money('1E+2', 'EUR')]
+
+    def assertExact(self, moneys, expected):
+        self.assertEqual([(m.amount.as_tuple(), m.currency) for m in moneys],
+                         [(m.amount.as_tuple(), m.currency) for m in expected])
+
+    def testJSON(self):
+        data = serialization.dumps({'price': Money('0.125', 'JPY'), 'rate': Decimal('1.5')})
+        self.assertEqual(json.loads(data), {'price': {'amount': '0.125', 'currency': 'JPY'}, 'rate': '1.5'})
+        price = serialization.loads(data)['price']
+        self.assertExact([price], [Money('0.125', 'JPY')])
+        self.assertEqual(serialization.loads('{"amount": "1"}'), {'amount': '1'})
+        self.assertRaises(TypeError, serialization.dumps, object())
+
+    def testJSONMany(self):
+        data = serialization.dumps_many(self.MONEYS)
+        self.assertEqual(json.loads(data), json.loads(serialization.dumps(self.MONEYS)))
+        self.assertExact(serialization.loads_many(data), self.MONEYS)
+        self.assertEqual(serialization.loads_many(serialization.dumps_many([])), [])
+
+    @skipIf(not msgpack, "msgpack is not installed")
+    def testMsgpack(self):
+        data = serialization.packb({'prices': self.MONEYS, 'name': u'caf\xe9'})
+        decoded = serialization.unpackb(data)
+        self.assertEqual(decoded['name'], u'caf\xe9')
+        self.assertExact(decoded['prices'], self.MONEYS)
+        self.assertExact(serialization.unpackb_many(serialization.packb_many(self.MONEYS)), self.MONEYS)
+
+    @skipIf(not msgpack, "msgpack is not installed")
+    def testMsgpackCodeLength(self):
+        CURRENCY['XY'] = Currency(code='XY')
+        CURRENCY['ZZZZ'] = Currency(code='ZZZZ')
+        try:
+            moneys = [Money('1.5', 'XY'), Money(-2, 'ZZZZ'), Money(3, 'USD')]
+            self.assertExact(serialization.unpackb(serialization.packb(moneys)), moneys)
+        finally:
+            del CURRENCY['XY']
+            del CURRENCY['ZZZZ']
+
+
+@skipIf(not pyarrow, "pyarrow is not installed")
+class ArrowTestCase(TestCase):
+
+    def setUp(self):
+        self.moneys = MoneyArray([150, -200, 7, 5], ['USD', 'EUR', 'JPY', 'USD'])
+
+    def testStructArray(self):
+        struct = arrow.to_arrow(self.moneys)
+        self.assertEqual(struct.type.num_children, 2)
+        amount, currency = struct.field('amount'), struct.field('currency')
+        self.assertEqual(amount.type, pyarrow.decimal128(38, 2))
+        self.assertEqual(amount.to_pylist(), [Decimal('1.50'), Decimal('-2.00'), Decimal('7.00'), Decimal('0.05')])
+        self.assertEqual(currency.dictionary.to_pylist(), ['EUR', 'JPY', 'USD'])
+        self.assertEqual(currency.indices.to_pylist(), [2, 0, 1, 2])
+        self.assertEqual(arrow.from_arrow(struct).to_money(), self.moneys.to_money())
+        self.assertEqual(arrow.from_arrow(struct[1:3]).to_money(), [Money(-2, 'EUR'), Money(7, 'JPY')])
+
+    def testScale(self):
+        struct = arrow.to_arrow([Money('1.5', 'USD'), Money(3, 'JPY')], scale=4)
+        self.assertEqual(struct.field('amount').to_pylist(), [Decimal('1.5000'), Decimal('3.0000')])
+        self.assertEqual(arrow.from_arrow(struct).to_money(), [Money('1.5', 'USD'), Money(3, 'JPY')])
+        self.assertRaises(ValueError, arrow.to_arrow, self.moneys, 0)
+        amount = pyarrow.array([Decimal('1.234')], type=pyarrow.decimal128(10, 3))
+        table = pyarrow.Table.from_arrays([amount, pyarrow.array([u'USD'])], ['amount', 'currency'])
+        self.assertRaises(ValueError, arrow.from_arrow, table)
+
+    def testScaleOverflow(self):
+        self.assertRaises(ValueError, arrow.to_arrow, MoneyArray([100], 'USD'), 20)
+        struct = arrow.to_arrow(MoneyArray([100], 'USD'), 18)
+        self.assertEqual(struct.field('amount').to_pylist(), [Decimal('1.000000000000000000')])
+        self.assertRaises(OverflowError, arrow.to_arrow, MoneyArray([10 ** 17], 'USD'), 4)
+        self.assertRaises(OverflowError, arrow.to_arrow, MoneyArray([-10 ** 17], 'USD'), 4)
+
+        def table(amounts, scale):
+            amount = pyarrow.array(amounts, type=pyarrow.decimal128(38, scale))
+            return pyarrow.Table.from_arrays([amount, pyarrow.array([u'USD'] * len(amounts))],
+                                             ['amount', 'currency'])
+        self.assertEqual(arrow.from_arrow(table([Decimal(10 ** 16)], 0)).to_money(), [Money(10 ** 16, 'USD')])
+        self.assertRaises(OverflowError, arrow.from_arrow, table([Decimal(10 ** 17)], 0))
+        self.assertRaises(OverflowError, arrow.from_arrow, table([Decimal(-10 ** 17)], 0))
+        self.assertRaises(ValueError, arrow.from_arrow, table([Decimal(0)], 25))
+
+    def testChunks(self):
+        chunked = pyarrow.chunked_array([arrow.to_arrow(self.moneys), arrow.to_arrow(MoneyArray([1], 'GBP'))])
+        self.assertEqual(arrow.from_arrow(chunked).to_money(), self.moneys.to_money() + [Money('0.01', 'GBP')])
+        single = arrow.from_arrow(arrow.to_table(MoneyArray([1, 2], 'JPY')))
+        self.assertEqual(single.currency, CURRENCY['JPY'])
+        self.assertEqual(list(single.minor), [1, 2])
+
+    def testParquet(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'ledger.parquet')
+            arrow.write_parquet(path, self.moneys)
+            self.assertEqual(arrow.read_parquet(path).to_money(), self.moneys.to_money())
+            self.assertEqual(parquet.read_table(path).column('amount').type, pyarrow.decimal128(38, 2))
+        finally:
+            shutil.rmtree(directory)
+
+
+class FormattingTestCase(TestCase):
+
+    def tearDown(self):
+        set_default_locale()
+        set_rounding_policy('CHF')
+
+    def testLocales(self):
+        price = Money('-1234567.891', 'EUR')
+        self.assertEqual(format_money(price), u'-\u20ac1,234,567.89')
+        self.assertEqual(format_money(price, 'de_DE'), u'-1.234.567,89\xa0\u20ac')
+        self.assertEqual(format_money(price, 'fr-FR'), u'-1\u202f234\u202f567,89\xa0\u20ac')
+        self.assertEqual(format_money(price, 'de_CH'), u'\u20ac-1\u2019234\u2019567.89')
+        self.assertEqual(format_money(Money('1234.5', 'JPY'), 'ja_JP'), u'\xa51,234')
+        self.assertEqual(format_money(Money('0.125', 'USD')), u'$0.12')
+        set_default_locale('nl_NL')
+        self.assertEqual(format_money(Money(-5, 'GBP')), u'\xa3\xa0-5,00')
+        self.assertRaises(ValueError, format_money, price, 'xx_XX')
+
+    def testStyles(self):
+        price = Money('-1234.5', 'USD')
+        self.assertEqual(format_money(price, style='code'), u'-USD\xa01,234.50')
+        self.assertEqual(format_money(price, 'de_DE', style='code'), u'-1.234,50\xa0USD')
+        self.assertEqual(format_money(price, 'de_DE', style='plain'), u'-1.234,50')
+        self.assertEqual(format_money(Money(3, 'DKK')), u'DKK\xa03.00')
+        self.assertRaises(ValueError, format_money, price, style='long')
+
+    def testRoundingPolicy(self):
+        set_rounding_policy('CHF', RoundingPolicy(increment='0.05'))
+        self.assertEqual(format_money(Money('1.03', 'CHF'), 'de_CH'), u'Fr.\xa01.05')
+        set_rounding_policy('CHF', RoundingPolicy(decimals=3))
+        self.assertEqual(format_money(Money('1.0049', 'CHF'), 'de_CH'), u'Fr.\xa01.00')
+
+    def testLocaleSpelling(self):
+        price = Money('1.5', 'EUR')
+        self.assertEqual(format_money(price, 'en-US'), format_money(price, 'en_US'))
+        format_many([price], 'en-US')
+        self.assertEqual([key for key in formatting._patterns if key[0] == 'en-US'], [])
+
+    def testRegisterLocale(self):
+        register_locale('en_IE', u'\xa4#', u'(\xa4#)', u',', u'.')
+        try:
+            self.assertEqual(format_money(Money(-5, 'EUR'), 'en_IE'), u'(\u20ac5.00)')
+        finally:
+            del LOCALES['en_IE']
+        self.assertRaises(ValueError, register_locale, 'en_IE', u'\xa4', u'-\xa4', u',', u'.')
+
+    def testFormatMany(self):
+        moneys = [Money('1.5', 'USD'), Money(-2, 'EUR'), Money(7, 'JPY')]
+        expected = [u'1,50\xa0$', u'-2,00\xa0\u20ac', u'7\xa0\xa5']
+        self.assertEqual(format_many(moneys, 'de_DE'), expected)
+        if numpy:
+            self.assertEqual(format_many(MoneyArray.from_money(moneys), 'de_DE'), expected)
+            self.assertEqual(format_many(MoneyArray([1, -2], 'USD')), [u'$0.01', u'-$0.02'])
+
+
+class SpellOutTestCase(TestCase):
+
+    def testNumbers(self):
+        for n, text in [(0, 'zero'), (13, 'thirteen'), (40, 'forty'), (101, 'one hundred one'),
+                        (999, 'nine hundred ninety-nine'), (1000, 'one thousand'),
+                        (1002003, 'one million two thousand three'), (-21, 'minus twenty-one')]:
+            self.assertEqual(number_to_words(n), text)
+        self.assertRaises(ValueError, number_to_words, 10 ** 40)
+
+    def testDecimals(self):
+        # 0, 2 and 3 decimals
+        self.assertEqual(Money('1234.5', 'JPY').spell_out(), 'one thousand two hundred thirty-four Yen')
+        self.assertEqual(Money('226.17', 'USD').spell_out(),
+                         'two hundred twenty-six US Dollars and seventeen cents')
+        self.assertEqual(Money('1.01', 'USD').spell_out(), 'one US Dollar and one cent')
+        self.assertEqual(Money('3.005', 'KWD').spell_out(), 'three Kuwaiti Dinars and five fils')
+        self.assertEqual(Money('0.999', 'OMR').spell_out(),
+                         'zero Rials Omani and nine hundred ninety-nine baisa')
+
+    def testUnits(self):
+        self.assertEqual(Money(21, 'GBP').spell_out(), 'twenty-one Pounds Sterling')
+        self.assertEqual(Money('-2.5', 'DKK').spell_out(), 'minus two Danish Kroner and 50/100')
+        self.assertEqual(Money('0.005', 'EUR').spell_out(), 'zero Euros')
+
+    def testSpellOutMany(self):
+        moneys = [Money('1.5', 'USD'), Money(-2, 'JPY'), Money('0.01', 'GBP')]
+        expected = ['one US Dollar and fifty cents', 'minus two Yen', 'zero Pounds Sterling and one penny']
+        self.assertEqual(spell_out_many(moneys), expected)
+        if numpy:
+            self.assertEqual(spell_out_many(MoneyArray.from_money(moneys)), expected)
+
+
+class FrozenMoneyTestCase(TestCase):
+
+    def testImmutable(self):
+        price = FrozenMoney(10, 'USD')
+        self.assertRaises(AttributeError, setattr, price, 'amount', Decimal(20))
+        self.assertRaises(AttributeError, price.from_string, 'USD 20')
+        self.assertEqual(price, Money(10, 'USD'))
+        self.assertTrue(isinstance(price + 1, FrozenMoney))
+        self.assertEqual(pickle.loads(pickle.dumps(price, 2)), price)
+
+    def testHash(self):
+        prices = set([FrozenMoney(10, 'USD'), FrozenMoney('10.00', 'USD'), FrozenMoney(10, 'EUR')])
+        self.assertEqual(len(prices), 2)
+        self.assertEqual(hash(FrozenMoney(0, 'USD')), hash(0))
+        self.assertEqual({FrozenMoney(5, 'USD'): 'five'}[FrozenMoney('5.0', 'USD')], 'five')
+
+    def testInterning(self):
+        cache = MoneyCache(maxsize=2)
+        zero = cache.get(0, 'USD')
+        self.assertTrue(cache.get(0, 'USD') is zero)
+        cache.get(1, 'USD')
+        cache.get(0, 'USD')
+        cache.get(2, 'USD')
+        # 1 was the least recently used entry and was evicted
+        self.assertEqual(len(cache), 2)
+        self.assertTrue(cache.get(0, 'USD') is zero)
+        self.assertTrue(interned('19.99', 'USD') is interned('19.99', 'USD'))
+
+    def testInterningKeepsExponent(self):
+        cache = MoneyCache()
+        self.assertEqual(str(cache.get(Decimal('10'), 'USD').amount), '10')
+        self.assertEqual(str(cache.get(Decimal('10.00'), 'USD').amount), '10.00')
+        self.assertEqual(str(cache.get(Decimal('-0'), 'USD').amount), '-0')
+        self.assertEqual(str(cache.get(Decimal('0'), 'USD').amount), '0')
+        self.assertEqual(str(cache.get(10.0, 'USD').amount), '10.0')
+        self.assertEqual(str(cache.get(10, 'USD').amount), '10')
+        self.assertTrue(cache.get(Decimal('10.00'), 'USD') is cache.get(Decimal('10.00'), 'USD'))
+        self.assertEqual(len(cache), 6)
+
+
+@skipIf(not numpy, "numpy is not installed")
+class MoneyArrayTestCase(TestCase):
+
+    def testArithmetic(self):
+        prices = MoneyArray.from_amounts(['9.99', '20.00', '0.05'], 'USD')
+        self.assertEqual(list(prices.minor), [999, 2000, 5])
+        self.assertEqual(prices.sum(), Money('30.04', 'USD'))
+        self.assertEqual((prices + prices).to_money(), [Money('19.98', 'USD'), Money(40, 'USD'), Money('0.10', 'USD')])
+        self.assertEqual((prices - Money(1, 'USD'))[0], Money('8.99', 'USD'))
+        self.assertEqual((prices + 1)[2], Money('1.05', 'USD'))
+        # Results are rounded half to even to the minor unit
+        self.assertEqual(list((prices * Decimal('1.5')).minor), [1498, 3000, 8])
+        self.assertEqual(list((10 % prices).minor), [100, 200, 0])
+        self.assertEqual(list(prices.cumsum().minor), [999, 2999, 3004])
+        self.assertRaises(TypeError, lambda: prices * prices)
+
+    def testOverflow(self):
+        # float factors have numerators too large for an int64 product
+        prices = MoneyArray.from_amounts(['100.00', '-0.05'], 'USD')
+        self.assertEqual(list((prices * (1 / 3.0)).minor), [3333, -2])
+        self.assertEqual(list((prices * (2 / 3.0)).minor), [6667, -3])
+        self.assertEqual(list(((1 / 3.0) % prices).minor), [33, 0])
+        self.assertEqual(list((prices + 1 / 3.0).minor), [10033, 28])
+        self.assertRaises(OverflowError, lambda: MoneyArray([2 ** 62], 'USD') * 4)
+        prices = MoneyArray([100, 200], 'USD')
+        self.assertRaises(OverflowError, lambda: prices * numpy.array([1e17, 2.0]))
+        self.assertEqual(list((prices * numpy.array([1e16, 0.5])).minor), [10 ** 18, 100])
+        # float factors are taken at their shortest repr, as with Money
+        self.assertEqual(list((prices * numpy.array([0.125, 1 / 3.0])).minor),
+                         [list((prices * 0.125).minor)[0], list((prices * (1 / 3.0)).minor)[1]])
+
+    def testComparisonAndMasking(self):
+        prices = MoneyArray.from_amounts([5, 15, 25], 'USD')
+        expensive = prices[prices > Money(10, 'USD')]
+        self.assertEqual(expensive.to_money(), [Money(15, 'USD'), Money(25, 'USD')])
+        self.assertEqual(list(prices == Money(5, 'USD')), [True, False, False])
+        self.assertEqual(list(prices == Money(5, 'EUR')), [False, False, False])
+        self.assertRaises(TypeError, lambda: prices < Money(10, 'EUR'))
+        self.assertEqual(list(MoneyArray([0, 0, 5], 'USD') == numpy.array([0, 1, 0])), [True, False, False])
+
+    def testMixedCurrencies(self):
+        mixed = MoneyArray.from_money([Money(1, 'USD'), Money(2, 'EUR'), Money(3, 'USD')])
+        self.assertEqual(list(mixed.currencies), ['USD', 'EUR', 'USD'])
+        self.assertEqual((mixed + mixed)[1], Money(4, 'EUR'))
+        self.assertRaises(TypeError, mixed.sum)
+        self.assertRaises(TypeError, lambda: mixed + MoneyArray.from_amounts([1, 2, 3], 'USD'))
+        self.assertEqual(mixed[mixed.currencies == 'USD'].sum(), Money(4, 'USD'))
+        self.assertRaises(ValueError, MoneyArray.from_amounts, ['0.001'], 'USD')
+
+    def testLowerCaseCodes(self):
+        mixed = MoneyArray([100, 200], ['usd', 'eur'])
+        self.assertEqual(mixed[0], Money(1, 'USD'))
+        self.assertEqual(list(mixed.currencies), ['USD', 'EUR'])
+        self.assertEqual((mixed + 1).to_money(), [Money(2, 'USD'), Money(3, 'EUR')])
+        self.assertEqual(list(mixed == MoneyArray([100, 200], ['USD', 'EUR'])), [True, True])
+        self.assertEqual(MoneyArray([1, 2], ['jpy', 'jpy']).sum(), Money(3, 'JPY'))
+
+
+class RoundingTestCase(TestCase):
+
+    def tearDown(self):
+        set_auto_rounding(False)
+        set_rounding_policy('CHF', None)
+
+    def testPolicies(self):
+        self.assertEqual(str(Money('1.025', 'USD').round().amount), '1.02')
+        self.assertEqual(str(Money('2.5', 'JPY').round().amount), '2')
+        self.assertEqual(str(Money('1.021', 'USD').round(RoundingPolicy(rounding=ROUND_UP)).amount), '1.03')
+        self.assertEqual(str(Money('1.021', 'USD').round(RoundingPolicy(decimals=1)).amount), '1.0')
+
+        set_rounding_policy('CHF', RoundingPolicy(increment='0.05'))
+        self.assertEqual(str(Money('1.024', 'CHF').round().amount), '1.00')
+        self.assertEqual(str(Money('1.026', 'CHF').round().amount), '1.05')
+        self.assertEqual(get_rounding_policy('CHF').increment, Decimal('0.05'))
+        set_rounding_policy('CHF', None)
+        self.assertEqual(str(Money('1.026', 'CHF').round().amount), '1.03')
+
+    def testAutoRounding(self):
+        price = Money(10, 'USD')
+        self.assertEqual(len(str((price * Decimal('0.333333')).amount)), 8)
+        set_auto_rounding(True)
+        self.assertEqual(str((price * Decimal('0.333333')).amount), '3.33')
+        self.assertEqual(str((1 % Money('0.99', 'USD')).amount), '0.01')
+        # Building Money directly does not round
+        self.assertEqual(str(Money('1.005', 'USD').amount), '1.005')
+
+
+class AllocationTestCase(TestCase):
+
+    def testAllocate(self):
+        parts = Money(100, 'USD').allocate((1, 1, 1))
+        self.assertEqual(parts, [Money('33.34', 'USD'), Money('33.33', 'USD'), Money('33.33', 'USD')])
+        self.assertEqual(Money(5, 'JPY').allocate((1, 1)), [Money(3, 'JPY'), Money(2, 'JPY')])
+        self.assertEqual(Money('-0.05', 'USD').allocate((1, 1)), [Money('-0.03', 'USD'), Money('-0.02', 'USD')])
+        # Amounts more precise than the currency are split at their own precision
+        self.assertEqual(Money('0.003', 'USD').allocate((1, 1)), [Money('0.002', 'USD'), Money('0.001', 'USD')])
+        self.assertEqual(sum(Money('1000.01', 'USD').allocate((0.5, 0.3, 0.2))), Money('1000.01', 'USD'))
+        self.assertRaises(ValueError, Money(1, 'USD').allocate, (0, 0))
+
+    def testAllocateAutoRounding(self):
+        set_auto_rounding(True)
+        try:
+            for total in (Money('0.003', 'USD'), Money('10.005', 'USD'), Money('1000.01', 'USD'),
+                          FrozenMoney('0.125', 'EUR')):
+                parts = total.allocate((1, 1, 1))
+                self.assertEqual(sum([part.amount for part in parts]), total.amount)
+                self.assertTrue(all(type(part) is type(total) for part in parts))
+        finally:
+            set_auto_rounding(False)
+
+    def testLargestRemainder(self):
+        self.assertEqual(allocate_minor(10, (1, 2, 3)), [2, 3, 5])
+        self.assertEqual(allocate_minor(1, (1, 1)), [1, 0])
+
+    @skipIf(not numpy, "numpy is not installed")
+    def testBatch(self):
+        totals = [100, 5, -5, 0, 123457]
+        rows = allocate_minor_many(totals, (50, 30, 20))
+        for total, row in zip(totals, rows):
+            self.assertEqual(list(row), allocate_minor(total, (50, 30, 20)))
+        parts = MoneyArray.from_amounts(['1.00', '0.05'], 'USD').allocate((1, 1, 1))
+        self.assertEqual(parts[0].to_money(), [Money('0.34', 'USD'), Money('0.02', 'USD')])
+        self.assertEqual(sum(parts).to_money(), [Money('1.00', 'USD'), Money('0.05', 'USD')])
+
+    @skipIf(not numpy, "numpy is not installed")
+    def testBatchFloatRatios(self):
+        # float ratios scale to integers too large for an int64 product
+        ratios = (1 / 3.0, 2 / 3.0)
+        totals = [10000, -5, 0]
+        rows = allocate_minor_many(totals, ratios)
+        self.assertEqual([list(row) for row in rows], [allocate_minor(total, ratios) for total in totals])
+        self.assertEqual([list(row) for row in rows], [[3333, 6667], [-2, -3], [0, 0]])
+        parts = MoneyArray.from_amounts(['100.00'], 'USD').allocate(ratios)
+        self.assertEqual([part[0] for part in parts], [Money('33.33', 'USD'), Money('66.67', 'USD')])
+
+
+class RateTableTestCase(TestCase):
+
+    def setUp(self):
+        self.table = RateTable('USD', {'EUR': '0.8', 'GBP': Decimal('0.5')})
+
+    def testRates(self):
+        self.assertEqual(self.table.rate('USD', 'EUR'), Decimal('0.8'))
+        self.assertEqual(self.table.rate(CURRENCY['EUR'], 'USD'), Decimal('1.25'))
+        self.assertEqual(self.table.rate('EUR', 'GBP'), Decimal('0.625'))
+        self.assertRaises(UnknownRateError, self.table.rate, 'USD', 'JPY')
+        self.assertRaises(KeyError, self.table.rate, 'USD', 'ZZZ')
+        self.assertTrue('GBP' in self.table)
+
+    def testConvert(self):
+        self.assertEqual(Money(10, 'EUR').convert_to('GBP', rates=self.table), Money('6.25', 'GBP'))
+        self.assertEqual(self.table.convert(Money(10, 'USD'), 'EUR'), Money(8, 'EUR'))
+        self.assertEqual(Money(10, 'USD').convert_to('USD', rates=self.table), Money(10, 'USD'))
+
+    def testRefresh(self):
+        precomputed = RateTable('USD', {'EUR': '0.8'}, precompute=True)
+        self.assertEqual(precomputed.rate('EUR', 'USD'), Decimal('1.25'))
+        self.table.rate('USD', 'EUR')
+        self.table.refresh({'EUR': 2})
+        self.assertEqual(self.table.rate('USD', 'EUR'), Decimal(2))
+        self.assertRaises(UnknownRateError, self.table.rate, 'USD', 'GBP')
+        self.table.refresh({'USD': 4}, base='EUR')
+        self.assertEqual(self.table.base, CURRENCY['EUR'])
+        self.assertEqual(self.table.rate('USD', 'EUR'), Decimal('0.25'))
+
+    def testConvertMany(self):
+        converted = convert_many(['1.005', 2, Decimal(300)], ['USD', 'EUR', 'USD'], 'EUR', self.table)
+        self.assertEqual(converted, [Money('0.80', 'EUR'), Money(2, 'EUR'), Money(240, 'EUR')])
+        self.assertEqual(convert_many(['1', '2'], 'GBP', 'USD', self.table), [Money(2, 'USD'), Money(4, 'USD')])
+        self.assertRaises(UnknownRateError, convert_many, ['1'], ['JPY'], 'USD', self.table)
+
+    @skipIf(not numpy, "numpy is not installed")
+    def testConvertManyArray(self):
+        array = MoneyArray.from_money([Money(1, 'USD'), Money('0.01', 'GBP'), Money(3, 'EUR')])
+        converted = convert_many(array, None, 'EUR', self.table)
+        self.assertEqual(converted.to_money(), [Money('0.80', 'EUR'), Money('0.02', 'EUR'), Money(3, 'EUR')])
+
+    @skipIf(not numpy, "numpy is not installed")
+    def testConvertManyArrayMatchesDecimal(self):
+        rng = random.Random(0)
+        minor = [rng.randint(-10 ** 10, 10 ** 10) for i in xrange(2000)] + [99495000]
+        table = RateTable('USD', {'JPY': '110.37', 'EUR': '0.9', 'GBP': '0.7'})
+        for source, target in (('USD', 'JPY'), ('EUR', 'GBP'), ('JPY', 'EUR')):
+            array = MoneyArray(minor, source)
+            expected = convert_many([m.amount for m in array], source, target, table)
+            self.assertEqual(convert_many(array, None, target, table).to_money(), expected)
+        self.assertEqual(convert_many(MoneyArray([99495000], 'USD'), None, 'JPY', table)[0], Money(109812632, 'JPY'))
+        # no rate is needed to convert a currency to itself
+        self.assertEqual(convert_many(MoneyArray([150, 5], 'GBP'), None, 'GBP', table).to_money(),
+                         [Money('1.50', 'GBP'), Money('0.05', 'GBP')])
+        self.assertEqual(convert_many(['1.5'], 'CHF', 'CHF', table), [Money('1.50', 'CHF')])
+        self.assertEqual(convert_many(MoneyArray([150, 100], ['CHF', 'USD']), None, 'CHF',
+                                      RateTable('USD', {'CHF': '0.9'})).to_money(),
+                         [Money('1.50', 'CHF'), Money('0.90', 'CHF')])
+        set_rounding_policy('JPY', RoundingPolicy(rounding=ROUND_UP, increment=10))
+        try:
+            array = MoneyArray(minor[:100], 'USD')
+            self.assertEqual(convert_many(array, None, 'JPY', table).to_money(),
+                             convert_many([m.amount for m in array], 'USD', 'JPY', table))
+        finally:
+            set_rounding_policy('JPY', None)
+
+    def testExchangeRateAttributes(self):
+        gbp, eur = Currency(code='GBP'), Currency(code='EUR')
+        gbp.set_exchange_rate(2)
+        eur.set_exchange_rate('1.25')
+        self.assertEqual(Money(10, gbp).convert_to(eur), Money(16, 'EUR'))
+
+
+class HistoricalRatesTestCase(TestCase):
+
+    def setUp(self):
+        self.history = HistoricalRates([
+            (date(2010, 6, 1), 'EUR', 'USD', '1.25'),
+            (date(2010, 1, 1), 'EUR', 'USD', '1.5'),
+        ])
+
+    def tearDown(self):
+        set_default_rates(None)
+
+    def testAsOf(self):
+        self.assertEqual(self.history.rate('EUR', 'USD', date(2010, 1, 1)), Decimal('1.5'))
+        self.assertEqual(self.history.rate('EUR', 'USD', date(2010, 5, 31)), Decimal('1.5'))
+        self.assertEqual(self.history.rate('EUR', 'USD', date(2011, 1, 1)), Decimal('1.25'))
+        self.assertEqual(self.history.rate('USD', 'EUR', date(2011, 1, 1)), Decimal('0.8'))
+        self.assertRaises(UnknownRateError, self.history.rate, 'EUR', 'USD', date(2009, 12, 31))
+        self.assertRaises(UnknownRateError, self.history.rate, 'EUR', 'GBP', date(2011, 1, 1))
+
+        self.history.add('EUR', 'USD', date(2010, 3, 1), 2)
+        self.assertEqual(self.history.rate('EUR', 'USD', date(2010, 5, 31)), Decimal(2))
+
+    def testConvertTo(self):
+        self.assertEqual(Money(10, 'EUR').convert_to('USD', rates=self.history, at=date(2010, 2, 1)), Money(15, 'USD'))
+        self.assertRaises(ValueError, Money(10, 'EUR').convert_to, 'USD', at=date(2010, 2, 1))
+        set_default_rates(self.history)
+        self.assertEqual(Money(10, 'USD').convert_to('EUR', at=date(2010, 7, 1)), Money(8, 'EUR'))
+        # without ``at`` the latest rate is used
+        self.assertEqual(Money(10, 'EUR').convert_to('USD'), Money('12.5', 'USD'))
+        self.assertEqual(Money(10, 'USD').convert_to('EUR', rates=self.history), Money(8, 'EUR'))
+        self.assertEqual(self.history.rate('EUR', 'USD'), Decimal('1.25'))
+
+    def testCSV(self):
+        history = HistoricalRates()
+        history.load_csv(StringIO("timestamp,from,to,rate\n"
+                                  "2010-01-02T12:00:00,GBP,USD,1.5\n"
+                                  "\n"
+                                  "2010-01-01,GBP,USD,1.6\n"
+                                  "\n"))
+        self.assertEqual(history.rate('GBP', 'USD', datetime(2010, 1, 2)), Decimal('1.6'))
+        self.assertEqual(history.rate('GBP', 'USD', datetime(2010, 1, 2, 12)), Decimal('1.5'))
+
+    def testBatch(self):
+        times = [date(2011, 1, 1), date(2010, 1, 1), date(2010, 7, 1), date(2010, 2, 1)]
+        self.assertEqual(self.history.rates_at('EUR', 'USD', times),
+                         [self.history.rate('EUR', 'USD', t) for t in times])
+        self.assertEqual(self.history.rates_at('USD', 'EUR', times),
+                         [self.history.rate('USD', 'EUR', t) for t in times])
+        converted = self.history.convert_at(
+            [Money(10, 'EUR'), Money(10, 'USD'), Money(10, 'EUR')], 'USD',
+            [date(2010, 1, 1), date(2010, 1, 1), date(2010, 6, 1)])
+        self.assertEqual(converted, [Money(15, 'USD'), Money(10, 'USD'), Money('12.5', 'USD')])
+
+
+class AggregateTestCase(TestCase):
+
+    def testSumByCurrency(self):
+        totals = sum_by_currency([Money(1, 'USD'), Money(2, 'EUR'), Money('3.001', 'USD')])
+        self.assertEqual(totals, {'USD': Money('4.001', 'USD'), 'EUR': Money(2, 'EUR')})
+        self.assertEqual(sum_by_currency([]), {})
+
+    def testGroupSum(self):
+        moneys = [Money(1, 'USD'), Money(2, 'EUR'), Money(3, 'USD'), Money(4, 'USD')]
+        totals = group_sum(moneys, ['a', 'a', 'b', 'a'])
+        self.assertEqual(totals, {
+            ('a', 'USD'): Money(5, 'USD'),
+            ('a', 'EUR'): Money(2, 'EUR'),
+            ('b', 'USD'): Money(3, 'USD'),
+        })
+        self.assertEqual(group_sum_arrays(['1', '2.5'], ['USD', 'USD']), {'USD': Money('3.5', 'USD')})
+
+    @skipIf(not numpy, "numpy is not installed")
+    def testVectorized(self):
+        moneys = [Money(1, 'USD'), Money(2, 'EUR'), Money(3, 'USD'), Money(4, 'USD')]
+        keys = ['a', 'a', 'b', 'a']
+        self.assertEqual(group_sum(MoneyArray.from_money(moneys), keys), group_sum(moneys, keys))
+        self.assertEqual(sum_by_currency(MoneyArray.from_money(moneys)), sum_by_currency(moneys))
+        totals = group_sum_arrays(numpy.array([100, 250, 5]), ['USD', 'JPY', 'USD'])
+        self.assertEqual(totals, {'USD': Money('1.05', 'USD'), 'JPY': Money(250, 'JPY')})
+        totals = group_sum_arrays(numpy.array([100, 250, 5]), ['usd', 'jpy', 'USD'], ['a', 'a', 'a'])
+        self.assertEqual(totals, {('a', 'USD'): Money('1.05', 'USD'), ('a', 'JPY'): Money(250, 'JPY')})
+
 
 class MoneyFieldTestCase(TestCase):
 
@@ -101,6 +959,21 @@ class MoneyFieldTestCase(TestCase):
         ent = TestMoneyModel.objects.filter(price__exact=Money(300, "USD")).get()
         self.assertEquals(ent.price, Money(300, "USD"))
 
+    def testLoadedInstances(self):
+        TestMoneyModel.objects.create(name='dollars', price=Money('1.50', 'USD'))
+        TestMoneyModel.objects.create(name='euros', price=Money('2.25', 'EUR'))
+        prices = dict((e.name, e.price) for e in TestMoneyModel.objects.all())
+        self.assertEqual(prices, {'dollars': Money('1.50', 'USD'), 'euros': Money('2.25', 'EUR')})
+        self.assertTrue(prices['dollars'].currency is CURRENCY['USD'])
+        self.assertTrue(isinstance(prices['euros'].amount, Decimal))
+
+        ent = TestMoneyModel.objects.get(name='euros')
+        self.assertTrue(ent.price is ent.price)
+        ent.price = Decimal('3.00')
+        self.assertEqual(ent.price, Money('3.00', 'EUR'))
+        ent.price = Money(4, 'GBP')
+        self.assertEqual((ent.price, ent.price_currency), (Money(4, 'GBP'), 'GBP'))
+
     def testDefaults(self):
         ent = TestMoneyModel_0_USD.objects.create(name='0 USD')
         ent = TestMoneyModel_0_USD.objects.get(pk=ent.id)
@@ -197,6 +1070,140 @@ class MoneyFieldTestCase(TestCase):
         self.assertEqual(qset.count(), 2)
         self.assertSameCurrency([ent.price for ent in qset], "UAH")
 
+    def testQLookups(self):
+        for code in ('USD', 'EUR'):
+            for amount in (99, 100, 101):
+                TestMoneyModel.objects.create(name='%d %s' % (amount, code), price=Money(amount, code))
+        USD100, EUR100 = Money(100, 'USD'), Money(100, 'EUR')
+
+        def names(qset):
+            return sorted(qset.values_list('name', flat=True))
+
+        self.assertEqual(names(TestMoneyModel.objects.filter(Q(price__gt=USD100) | Q(price__lt=EUR100))),
+                         ['101 USD', '99 EUR'])
+        self.assertEqual(names(TestMoneyModel.objects.filter(Q(price=USD100) | Q(name='101 EUR'))),
+                         ['100 USD', '101 EUR'])
+        self.assertEqual(names(TestMoneyModel.objects.exclude(price__gte=EUR100)),
+                         ['100 USD', '101 USD', '99 EUR', '99 USD'])
+        self.assertEqual(names(TestMoneyModel.objects.filter(~Q(price__gte=EUR100), name__endswith='EUR')),
+                         ['99 EUR'])
+        self.assertEqual(names(TestMoneyModel.objects.complex_filter(Q(price__lte=USD100))),
+                         ['100 USD', '99 USD'])
+        self.assertEqual(TestMoneyModel.objects.filter(price__gt=USD100).filter(price__lt=EUR100).count(), 0)
+        self.assertEqual(TestMoneyModel.objects.get_or_create(price=EUR100)[0].name, '100 EUR')
+
+    def testLookupQueries(self):
+        TestMoneyModel.objects.create(name='100 USD', price=Money(100, 'USD'))
+        qset = TestMoneyModel.objects.filter(Q(price=Money(100, 'USD')) | Q(price=Money(100, 'EUR')))
+        sql = str(qset.query)
+        self.assertEqual(sql.count('"price_currency" = USD'), 1)
+        self.assertEqual(sql.count('"price_currency" = EUR'), 1)
+        with self.assertNumQueries(1):
+            self.assertEqual(len(qset), 1)
+        with self.assertNumQueries(1):
+            TestMoneyModel.objects.get(price=Money(100, 'USD'))
+
+    def testAggregateByCurrency(self):
+        for amount, code in (('10.50', 'USD'), ('20.25', 'USD'), ('100', 'EUR'), ('300', 'EUR'), ('5', 'GBP')):
+            TestMoneyModel.objects.create(name=code, price=Money(amount, code))
+        objects = TestMoneyModel.objects
+        with self.assertNumQueries(1):
+            totals = objects.aggregate_by_currency('price')
+        self.assertEqual(totals, {'USD': Money('30.75', 'USD'), 'EUR': Money(400, 'EUR'), 'GBP': Money(5, 'GBP')})
+        self.assertEqual(objects.aggregate_by_currency('price', Avg)['EUR'], Money(200, 'EUR'))
+        self.assertEqual(objects.aggregate_by_currency('price', Min)['USD'], Money('10.50', 'USD'))
+        self.assertEqual(objects.exclude(name='GBP').aggregate_by_currency('price', Max),
+                         {'USD': Money('20.25', 'USD'), 'EUR': Money(300, 'EUR')})
+        self.assertEqual(objects.filter(name='JPY').aggregate_by_currency('price'), {})
+        self.assertRaises(ValueError, objects.aggregate_by_currency, 'price', Count)
+
+        rates = RateTable('USD', {'EUR': '0.5', 'GBP': '0.25'})
+        with self.assertNumQueries(1):
+            self.assertEqual(objects.aggregate_by_currency('price', Sum, 'USD', rates), Money('850.75', 'USD'))
+        self.assertEqual(objects.aggregate_by_currency('price', Avg, 'USD', rates), Money('170.15', 'USD'))
+        self.assertEqual(objects.aggregate_by_currency('price', Min, 'EUR', rates), Money('5.25', 'EUR'))
+        self.assertEqual(objects.aggregate_by_currency('price', Max, 'USD', rates), Money(600, 'USD'))
+        self.assertEqual(objects.filter(name='JPY').aggregate_by_currency('price', Sum, 'USD', rates), None)
+
+    def testAggregateByCurrencyExact(self):
+        for amount, code in (('0.1', 'EUR'), ('0.2', 'EUR'), ('0.7', 'EUR'), ('1.5', 'XXX'), ('2.5', 'XXX')):
+            TestMoneyModel.objects.create(name=code, price=Money(amount, code))
+        objects = TestMoneyModel.objects
+        self.assertEqual(str(objects.aggregate_by_currency('price')['EUR'].amount), '1.000')
+        self.assertEqual(objects.aggregate_by_currency('price', Avg)['EUR'].amount, Decimal(1) / 3)
+        # rows without a currency are merged with those in the default currency
+        objects.filter(price=Decimal('2.5')).update(price_currency='')
+        self.assertEqual(objects.aggregate_by_currency('price')['XXX'], Money(4, 'XXX'))
+        self.assertEqual(objects.aggregate_by_currency('price', Avg)['XXX'], Money(2, 'XXX'))
+        self.assertEqual(objects.aggregate_by_currency('price', Min)['XXX'], Money('1.5', 'XXX'))
+        self.assertEqual(objects.aggregate_by_currency('price', Max)['XXX'], Money('2.5', 'XXX'))
+
+    def testUpdate(self):
+        for amount in (1, 2, 3):
+            TestMoneyModel.objects.create(name='row', price=Money(amount, 'USD'))
+        with self.assertNumQueries(1):
+            self.assertEqual(TestMoneyModel.objects.filter(price__gte=Money(2, 'USD')).update(price=Money(5, 'EUR')), 2)
+        self.assertEqual(sorted((e.price.currency.code, e.price.amount) for e in TestMoneyModel.objects.all()),
+                         [('EUR', 5), ('EUR', 5), ('USD', 1)])
+        TestMoneyModel.objects.update(name='renamed')
+        self.assertEqual(TestMoneyModel.objects.filter(price=Money(1, 'USD'), name='renamed').count(), 1)
+
+    def testBulkCreate(self):
+        objs = [TestMoneyModel(name=str(i), price=Money(i, ('USD', 'EUR')[i % 2])) for i in xrange(5)]
+        with self.assertNumQueries(3):
+            self.assertEqual(TestMoneyModel.objects.bulk_create(objs, batch_size=2), objs)
+        self.assertEqual(sorted((e.name, e.price) for e in TestMoneyModel.objects.all()),
+                         [(str(i), Money(i, ('USD', 'EUR')[i % 2])) for i in xrange(5)])
+
+        # one statement for the rows with a primary key, one for the others
+        with self.assertNumQueries(2):
+            TestMoneyModel_USD.objects.bulk_create([TestMoneyModel_USD(name='default', price=7),
+                                                    TestMoneyModel_USD(name='pk', price=Money(8, 'GBP'), pk=100)])
+        self.assertEqual(TestMoneyModel_USD.objects.get(name='default').price, Money(7, 'USD'))
+        self.assertEqual(TestMoneyModel_USD.objects.get(pk=100).price, Money(8, 'GBP'))
+        self.assertRaises(ValueError, TestMoneyModel.objects.bulk_create, objs, batch_size=0)
+
+    @skipIf(connection.vendor != 'sqlite', "the parameter limit is SQLite's")
+    def testBulkCreateParameterLimit(self):
+        # name, price and price_currency: 333 rows fit in 999 parameters
+        objs = [TestMoneyModel(name='bulk', price=Money(i, 'USD')) for i in xrange(1000)]
+        with self.assertNumQueries(4):
+            TestMoneyModel.objects.bulk_create(objs)
+        with self.assertNumQueries(10):
+            TestMoneyModel.objects.bulk_create(objs, batch_size=100)
+        self.assertEqual(TestMoneyModel.objects.filter(name='bulk').count(), 2000)
+
+    def testCurrencyIndex(self):
+        table = TestMoneyModel._meta.db_table
+        self.assertEqual(sql_money_indexes(TestMoneyModel, connection),
+                         ['CREATE INDEX "%s_price_money" ON "%s" ("price_currency", "price");' % (table, table)])
+        self.assertEqual(sql_money_indexes(TestMoneyModel_USD, connection), [])
+
+    def testCreateCurrencyIndexes(self):
+        app = get_app('tests')
+        # the index exists already, as after flush
+        with self.assertNumQueries(1):
+            create_money_indexes(app, [TestMoneyModel], verbosity=0)
+        connection.cursor().execute('DROP INDEX %s' % connection.ops.quote_name(
+            '%s_price_money' % TestMoneyModel._meta.db_table))
+        with self.assertNumQueries(2):
+            create_money_indexes(app, [TestMoneyModel], verbosity=0)
+        with self.assertNumQueries(1):
+            create_money_indexes(app, [TestMoneyModel, TestMoneyModel_USD], verbosity=0)
+
+    @skipIf(connection.vendor != 'sqlite', "EXPLAIN QUERY PLAN is SQLite only")
+    def testCurrencyIndexQueryPlan(self):
+        table = TestMoneyModel._meta.db_table
+        cursor = connection.cursor()
+        cursor.execute('PRAGMA index_info("%s_price_money")' % table)
+        self.assertEqual([row[2] for row in cursor.fetchall()], ['price_currency', 'price'])
+
+        qset = TestMoneyModel.objects.filter(price__gte=Money(100, 'USD'))
+        sql, params = qset.query.get_compiler(connection=connection).as_sql()
+        cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+        plan = ' '.join(row[-1] for row in cursor.fetchall())
+        self.assertTrue('%s_price_money' % table in plan, plan)
+
     def testProxy(self):
         e = TestMoneyModel()
         e.price = Money(0, "BGN")
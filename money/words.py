@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+Amounts in words, for cheques and invoices.
+
+spell_out() writes the major and minor units of an amount in English words,
+e.g. "one thousand two hundred thirty-four US Dollars and fifty cents".
+Numbers are spelled in groups of three digits; the words of every group
+(0-999) are computed once and memoized, so spelling out many amounts mostly
+reuses earlier work. The major unit is the currency name from the registry.
+Minor units are named for the currencies in MINOR_UNITS and written as a
+fraction ("and 50/100") for the others.
+"""
+from decimal import ROUND_HALF_EVEN
+
+from money import CURRENCY
+from arrays import MoneyArray
+from rounding import round_amount
+
+__all__ = ('number_to_words', 'spell_out', 'spell_out_many', 'MINOR_UNITS')
+
+ONES = ('zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine',
+        'ten', 'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen', 'sixteen',
+        'seventeen', 'eighteen', 'nineteen')
+TENS = ('', '', 'twenty', 'thirty', 'forty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety')
+SCALES = ('', 'thousand', 'million', 'billion', 'trillion', 'quadrillion', 'quintillion',
+          'sextillion', 'septillion', 'octillion', 'nonillion', 'decillion')
+
+# currency code -> (singular, plural) name of the minor unit
+MINOR_UNITS = {
+    'USD': ('cent', 'cents'),
+    'EUR': ('cent', 'cents'),
+    'AUD': ('cent', 'cents'),
+    'CAD': ('cent', 'cents'),
+    'NZD': ('cent', 'cents'),
+    'HKD': ('cent', 'cents'),
+    'SGD': ('cent', 'cents'),
+    'ZAR': ('cent', 'cents'),
+    'GBP': ('penny', 'pence'),
+    'CHF': ('centime', 'centimes'),
+    'RUB': ('kopeck', 'kopecks'),
+    'INR': ('paisa', 'paise'),
+    'BHD': ('fils', 'fils'),
+    'IQD': ('fils', 'fils'),
+    'JOD': ('fils', 'fils'),
+    'KWD': ('fils', 'fils'),
+    'LYD': ('dirham', 'dirhams'),
+    'OMR': ('baisa', 'baisa'),
+    'TND': ('millime', 'millimes'),
+}
+
+# currency names that are the same in the plural
+INVARIANT_NAMES = frozenset(['Yen', 'Won', 'Yuan Renminbi', 'Baht', 'Kip', 'Rand', 'Dong',
+                             'Vatu', 'Tugrik', 'Kwacha', 'Lilangeni', 'Rufiyaa', 'Renminbi'])
+
+# currency names with an irregular plural
+PLURAL_NAMES = {
+    'Pound Sterling': 'Pounds Sterling',
+    'Danish Krone': 'Danish Kroner',
+    'Norwegian Krone': 'Norwegian Kroner',
+    'Swedish Krona': 'Swedish Kronor',
+    'Iceland Krona': 'Iceland Kronur',
+    'Rial Omani': 'Rials Omani',
+}
+
+# 0-999 -> words, filled in as groups are spelled
+_chunks = {}
+
+# currency code -> (major singular, major plural, minor names or None)
+_units = {}
+
+
+def _chunk(n):
+    """
+    Returns the words for 0 <= n < 1000, memoized.
+    """
+    try:
+        return _chunks[n]
+    except KeyError:
+        pass
+    hundreds, rest = divmod(n, 100)
+    words = []
+    if hundreds:
+        words.append('%s hundred' % ONES[hundreds])
+    if rest >= 20:
+        tens, ones = divmod(rest, 10)
+        words.append('%s-%s' % (TENS[tens], ONES[ones]) if ones else TENS[tens])
+    elif rest or not hundreds:
+        words.append(ONES[rest])
+    text = _chunks[n] = ' '.join(words)
+    return text
+
+
+def number_to_words(n):
+    """
+    Returns the integer ``n`` in English words.
+
+    >>> number_to_words(1234)
+    'one thousand two hundred thirty-four'
+    """
+    if n < 0:
+        return 'minus ' + number_to_words(-n)
+    if n < 1000:
+        return _chunk(n)
+    words = []
+    scale = 0
+    while n:
+        n, group = divmod(n, 1000)
+        if group:
+            if scale >= len(SCALES):
+                raise ValueError("number too large to spell out")
+            words.append('%s %s' % (_chunk(group), SCALES[scale]) if scale else _chunk(group))
+        scale += 1
+    words.reverse()
+    return ' '.join(words)
+
+
+def _plural(name):
+    if name in PLURAL_NAMES:
+        return PLURAL_NAMES[name]
+    if name in INVARIANT_NAMES or name.endswith('s'):
+        return name
+    return name + 's'
+
+
+def _currency_units(currency):
+    try:
+        return _units[currency.code]
+    except KeyError:
+        name = currency.name or currency.code
+        units = _units[currency.code] = (name, _plural(name), MINOR_UNITS.get(currency.code))
+        return units
+
+
+def _spell(minor, currency):
+    """
+    Spells out an integer number of minor units of ``currency``.
+    """
+    if minor < 0:
+        return 'minus ' + _spell(-minor, currency)
+    major, minor = divmod(minor, 10 ** currency.decimals)
+    singular, plural, minor_names = _currency_units(currency)
+    text = '%s %s' % (number_to_words(major), singular if major == 1 else plural)
+    if not currency.decimals:
+        return text
+    if minor_names is None:
+        return '%s and %0*d/%d' % (text, currency.decimals, minor, 10 ** currency.decimals)
+    if not minor:
+        return text
+    return '%s and %s %s' % (text, number_to_words(minor), minor_names[minor != 1])
+
+
+def spell_out(money):
+    """
+    Returns ``money`` in words, rounded according to the rounding policy of
+    its currency.
+
+    >>> spell_out(Money('226.17', 'USD'))
+    'two hundred twenty-six US Dollars and seventeen cents'
+    """
+    currency = money.currency
+    amount = round_amount(money.amount, currency)
+    return _spell(int(amount.scaleb(currency.decimals).to_integral_value(ROUND_HALF_EVEN)), currency)
+
+
+def spell_out_many(moneys):
+    """
+    Spells out every Money in ``moneys`` and returns a list of strings.
+    ``moneys`` can also be a MoneyArray, whose minor units are spelled out
+    directly.
+    """
+    if not isinstance(moneys, MoneyArray):
+        return [spell_out(money) for money in moneys]
+    if moneys.codes is None:
+        return [_spell(minor, moneys.currency) for minor in moneys.minor.tolist()]
+    return [_spell(minor, CURRENCY[code]) for minor, code in zip(moneys.minor.tolist(), moneys.codes.tolist())]
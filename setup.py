@@ -39,6 +39,7 @@ for dirpath, dirnames, filenames in os.walk(start_dir):
     for i, dirname in enumerate(dirnames):
         if dirname.startswith('.'): del dirnames[i]
         if dirname.startswith('docs'): del dirnames[i]
+        if dirname.startswith('benchmarks'): del dirnames[i]
         
     if '__init__.py' in filenames:
         packages.append('.'.join(fullsplit(dirpath)))